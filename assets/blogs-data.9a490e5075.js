@@ -0,0 +1,161 @@
+// Auto-generated blog listing (full posts live in blogs/posts/<id>.json)
+// Last updated: 2026-10-18 16:07:17
+// Posts: 11
+// Latest id: 11
+
+const allBlogs = [
+  {
+    "id": 1,
+    "slug": "10-plagiarism-mistakes-students-make",
+    "title": "10 Plagiarism Mistakes Students Make",
+    "date": "December 15, 2024",
+    "excerpt": "Learn how to avoid accidental plagiarism in academic writing with proper citation techniques...",
+    "image": "https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8",
+    "readTime": 5,
+    "category": "Academic Writing",
+    "tags": [
+      "plagiarism",
+      "mistakes",
+      "citations"
+    ]
+  },
+  {
+    "id": 2,
+    "slug": "detecting-ai-writing-latest-methods",
+    "title": "Detecting AI Writing: Latest Methods",
+    "date": "December 22, 2024",
+    "excerpt": "How universities are adapting to ChatGPT-generated content and detection strategies...",
+    "image": "https://images.unsplash.com/photo-1677442136019-21780ecad995",
+    "readTime": 6,
+    "category": "AI Detection",
+    "tags": [
+      "AI detection",
+      "ChatGPT",
+      "universities"
+    ]
+  },
+  {
+    "id": 3,
+    "slug": "citation-styles-guide-2025",
+    "title": "Citation Styles Guide 2025",
+    "date": "December 30, 2024",
+    "excerpt": "Updated APA, MLA, and Chicago formatting rules every researcher must know...",
+    "image": "https://images.unsplash.com/photo-1456324463128-7ff6903988d8",
+    "readTime": 7,
+    "category": "Citation Guides",
+    "tags": [
+      "APA",
+      "MLA",
+      "Chicago",
+      "2025"
+    ]
+  },
+  {
+    "id": 4,
+    "slug": "how-to-reduce-turnitin-similarity-score-proven-methods",
+    "title": "How to Reduce Turnitin Similarity Score: Proven Methods",
+    "date": "January 16, 2025",
+    "excerpt": "Introduction\nAre you a student struggling with high Turnitin similarity scores? You're not alone. Many students in Indian universities, such as Delhi University (DU) and Jawaharlal Nehru U...",
+    "image": "https://images.unsplash.com/photo-1460925895917-afdab827c52f.jpg",
+    "readTime": 5,
+    "category": "Plagiarism Detection",
+    "tags": [
+      "turnitin",
+      "similarity score",
+      "academic writing"
+    ]
+  },
+  {
+    "id": 5,
+    "slug": "turnitin-alternative-for-students-india",
+    "title": "Turnitin Alternative for Students India",
+    "date": "January 17, 2025",
+    "excerpt": "Introduction\nAs a student in India, you're likely familiar with the importance of submitting original work. Whether you're studying at Delhi University (DU), Jawaharlal Nehru University (J...",
+    "image": "https://images.unsplash.com/photo-1488913113399-3666c3036b1a.jpg",
+    "readTime": 4,
+    "category": "Service Comparison",
+    "tags": [
+      "turnitin alternative",
+      "plagiarism checker",
+      "India"
+    ]
+  },
+  {
+    "id": 6,
+    "slug": "plagiarism-checker-affordable-rs-200",
+    "title": "Plagiarism Checker Affordable Rs 200",
+    "date": "January 18, 2025",
+    "excerpt": "Introduction\nPlagiarism is a serious issue in academic writing, and students in Indian universities such as Delhi University (DU) and Jawaharlal Nehru University (JNU) are no exception. Wi...",
+    "image": "https://images.unsplash.com/photo-1657550650283-2fba3a0123fa?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHxwbGFnaWFyaXNtJTIwY2hlY2tlciUyMGFmZm9yZGFibGUlMjBzdHVkZW50JTIwZWR1Y2F0aW9uJTIwYWNhZGVtaWN8ZW58MHwwfHx8MTc2Njk4MzI2M3ww&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 6,
+    "category": "Pricing & Services",
+    "tags": [
+      "affordable",
+      "plagiarism checker",
+      "Rs 200"
+    ]
+  },
+  {
+    "id": 7,
+    "slug": "ai-content-detection-tools-students",
+    "title": "AI Content Detection Tools Students",
+    "date": "January 19, 2025",
+    "excerpt": "Introduction\nAs a student in India, you're likely familiar with the importance of submitting original work. Whether you're studying at Delhi University (DU), Jawaharlal Nehru University (J...",
+    "image": "https://images.unsplash.com/photo-1608600712992-03e5325d94c8?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHxjb250ZW50JTIwZGV0ZWN0aW9uJTIwdG9vbHMlMjBzdHVkZW50JTIwZWR1Y2F0aW9uJTIwYWNhZGVtaWN8ZW58MHwwfHx8MTc2NzA2ODAxNHww&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 5,
+    "category": "AI Detection",
+    "tags": [
+      "AI detection",
+      "ChatGPT",
+      "student tools"
+    ]
+  },
+  {
+    "id": 8,
+    "slug": "top-7-essential-tips-avoid-plagiarism-essays",
+    "title": "Top 7 Essential Tips to Avoid Plagiarism in Essays",
+    "date": "January 20, 2025",
+    "excerpt": "Introduction\nPlagiarism is a serious issue in academic writing, and it can have severe consequences for students. Most Indian universities, such as Delhi University (DU) and Jawaharlal Neh...",
+    "image": "https://images.unsplash.com/photo-1657550650283-2fba3a0123fa?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHxhdm9pZCUyMHBsYWdpYXJpc20lMjBhY2FkZW1pYyUyMHN0dWRlbnQlMjBlZHVjYXRpb24lMjBhY2FkZW1pY3xlbnwwfDB8fHwxNzY3MTU0MzQyfDA&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 4,
+    "category": "Writing Tips",
+    "tags": [
+      "plagiarism prevention",
+      "academic writing",
+      "tips"
+    ]
+  },
+  {
+    "id": 9,
+    "slug": "complete-student-guide-plagiarism-prevention-tools-2025",
+    "title": "Complete Student Guide: Plagiarism Prevention Tools 2025",
+    "date": "January 21, 2025",
+    "excerpt": "Introduction\nPlagiarism is a serious issue in academic writing, and it can have severe consequences for students. Most Indian universities, such as Delhi University (DU) and Jawaharlal Neh...",
+    "image": "https://images.unsplash.com/photo-1657550650283-2fba3a0123fa?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHxhdm9pZCUyMHBsYWdpYXJpc20lMjBhY2FkZW1pYyUyMHN0dWRlbnQlMjBlZHVjYXRpb24lMjBhY2FkZW1pY3xlbnwwfDB8fHwxNzY3MTU0MzQyfDA&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 7,
+    "category": "Tools & Software",
+    "tags": [
+      "plagiarism tools",
+      "student guide",
+      "2025"
+    ]
+  },
+  {
+    "id": 10,
+    "slug": "how-to-excel-avoid-plagiarism-academic-writing-tips",
+    "title": "How to Excel: Avoid Plagiarism Academic Writing Tips",
+    "date": "January 02, 2026",
+    "excerpt": "Quick Overview\nWhen it comes to academic writing, you're not just conveying your ideas, but also demonstrating your integrity. As a student, you're likely to have come across the term \"pla...",
+    "image": "https://images.unsplash.com/photo-1657550650283-2fba3a0123fa?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHxhdm9pZCUyMHBsYWdpYXJpc20lMjBhY2FkZW1pYyUyMHN0dWRlbnQlMjBlZHVjYXRpb258ZW58MHwwfHx8MTc2NzMyNzk3MHww&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 3
+  },
+  {
+    "id": 11,
+    "slug": "how-to-understand-turnitin-percentage-meaning-explained",
+    "title": "How to Understand: Turnitin Percentage Meaning Explained",
+    "date": "January 03, 2026",
+    "excerpt": "Quick Overview\nHave you ever wondered what the Turnitin percentage really means? You're not alone. As a student, you've likely encountered this mysterious metric, but do you know how to in...",
+    "image": "https://images.unsplash.com/photo-1650525217641-891e936d3486?crop=entropy&cs=tinysrgb&fit=max&fm=jpg&ixid=M3w4NDk1Mzl8MHwxfHNlYXJjaHwxfHx0dXJuaXRpbiUyMHBlcmNlbnRhZ2UlMjBtZWFuaW5nJTIwc3R1ZGVudCUyMGVkdWNhdGlvbnxlbnwwfDB8fHwxNzY3NDEzMjE3fDA&ixlib=rb-4.1.0&q=80&w=1080",
+    "readTime": 3
+  }
+];
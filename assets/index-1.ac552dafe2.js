@@ -0,0 +1,1144 @@
+function showInlineError(elementId, message) {
+let errorDiv = document.getElementById(elementId);
+if (!errorDiv) {
+errorDiv = document.createElement('div');
+errorDiv.id = elementId;
+errorDiv.style.cssText = `
+                    background: #fff5f5;
+                    border-left: 4px solid #dc3545;
+                    color: #721c24;
+                    padding: 12px 16px;
+                    border-radius: 8px;
+                    margin: 12px 0;
+                    font-size: 0.95rem;
+                    animation: slideDown 0.3s ease-out;
+                `;
+const uploadArea = document.getElementById('uploadArea');
+if (uploadArea) {
+uploadArea.parentNode.insertBefore(errorDiv, uploadArea.nextSibling);
+}
+}
+errorDiv.textContent = message;
+errorDiv.style.display = 'block';
+setTimeout(() => {
+errorDiv.style.display = 'none';
+}, 5000);
+}
+const currencyRates = {
+'INR': 1,
+'USD': 0.012,
+'GBP': 0.0095,
+'EUR': 0.011,
+'AUD': 0.018,
+'CAD': 0.016
+};
+const currencySymbols = {
+'INR': '₹',
+'USD': '$',
+'GBP': '£',
+'EUR': '€',
+'AUD': 'A$',
+'CAD': 'C$'
+};
+let currentCurrency = 'INR';
+function updateCurrency(currency) {
+currentCurrency = currency;
+try { localStorage.setItem('preferredCurrency', currency); } catch(e) { console.warn('Storage failed:', e); }
+const priceElements = document.querySelectorAll('[data-price-inr]');
+priceElements.forEach(el => {
+const inrPrice = parseInt(el.getAttribute('data-price-inr'));
+const convertedPrice = Math.round(inrPrice * currencyRates[currency]);
+const displaySpan = el.querySelector('.hero-price-display');
+if (displaySpan) {
+displaySpan.textContent = currencySymbols[currency] + ' ' + convertedPrice;
+} else {
+el.textContent = currencySymbols[currency] + ' ' + convertedPrice;
+}
+});
+const officialPriceCell = document.querySelector('[data-price-usd]');
+if (officialPriceCell) {
+const usdPrice = parseInt(officialPriceCell.getAttribute('data-price-usd'));
+const inrEquivalent = usdPrice / currencyRates['USD']; 
+const convertedPrice = Math.round(inrEquivalent * currencyRates[currency]);
+officialPriceCell.textContent = currencySymbols[currency] + convertedPrice + '-' + Math.round(convertedPrice * 1.3);
+}
+trackEvent('currency_change', {
+'event_category': 'preferences',
+'event_label': currency
+});
+}
+function toggleDarkMode() {
+document.body.classList.toggle('dark-mode');
+const isDark = document.body.classList.contains('dark-mode');
+try { localStorage.setItem('darkMode', isDark ? 'enabled' : 'disabled'); } catch(e) { console.warn('Storage failed:', e); }
+const toggleBtn = document.getElementById('darkModeToggle');
+if (toggleBtn) {
+toggleBtn.textContent = isDark ? '☀️' : '🌙';
+}
+const mobileIcon = document.getElementById('mobileDarkModeIcon');
+if (mobileIcon) {
+mobileIcon.textContent = isDark ? '☀️' : '🌙';
+}
+trackEvent('dark_mode_toggle', {
+'event_category': 'preferences',
+'event_label': isDark ? 'enabled' : 'disabled'
+});
+}
+const CONFIG = {
+whatsappNumber: '918168706565',
+email: 'shivansh.assignment365@gmail.com',
+adminPasswordHash: '27fcb86d00180784cffd1cae62fcadcc16baac99a27bbe3061f492bfae76371b'
+};
+let blogPosts = [];
+let blogPostsLoaded = false;
+function loadBlogPosts() {
+if (blogPostsLoaded) return Promise.resolve();
+return fetch('blogs/index.json')
+.then(response => response.json())
+.then(manifest => {
+blogPosts = (manifest.posts || []).concat(blogPosts);
+blogPostsLoaded = true;
+})
+.catch(error => console.error('Error loading blog posts:', error));
+}
+let allCountries = [];
+async function loadCountryCodes() {
+try {
+const response = await fetch('assets/country-codes.2a2c2a6398.json');
+allCountries = await response.json();
+populateCountryDropdown('countryCode', 'countrySearch');
+populateCountryDropdown('contactCountryCode', 'contactCountrySearch');
+console.log('✅ Loaded ' + allCountries.length + ' country codes from JSON');
+} catch (error) {
+console.error('Failed to load country codes:', error);
+allCountries = [{"code": "+91", "flag": "🇮🇳", "name": "India"}];
+populateCountryDropdown('countryCode', 'countrySearch');
+populateCountryDropdown('contactCountryCode', 'contactCountrySearch');
+}
+}
+function populateCountryDropdown(selectId, searchId) {
+const select = document.getElementById(selectId);
+const searchInput = document.getElementById(searchId);
+if (!select || !searchInput) return;
+select.innerHTML = '';
+allCountries.forEach(country => {
+const option = document.createElement('option');
+option.value = country.code;
+option.textContent = `${country.flag} ${country.name} (${country.code})`;
+if (country.code === '+91') option.selected = true;
+select.appendChild(option);
+});
+searchInput.addEventListener('input', function() {
+const filter = this.value.toLowerCase();
+select.innerHTML = '';
+const filtered = allCountries.filter(c =>
+c.name.toLowerCase().includes(filter) ||
+c.code.includes(filter)
+);
+filtered.forEach(country => {
+const option = document.createElement('option');
+option.value = country.code;
+option.textContent = `${country.flag} ${country.name} (${country.code})`;
+select.appendChild(option);
+});
+if (filtered.length === 0) {
+select.innerHTML = '<option value="">No results found</option>';
+}
+});
+}
+let currentEmailData = null;
+function showEmailProviderModal(emailData) {
+currentEmailData = emailData;
+document.getElementById('emailProviderModal').style.display = 'flex';
+}
+function closeEmailModal() {
+document.getElementById('emailProviderModal').style.display = 'none';
+currentEmailData = null;
+}
+function openEmailProvider(provider) {
+if (!currentEmailData) return;
+const { subject, body } = currentEmailData;
+let mailtoLink = '';
+switch(provider) {
+case 'gmail':
+mailtoLink = `https://mail.google.com/mail/?view=cm&fs=1&to=${CONFIG.email}&su=${encodeURIComponent(subject)}&body=${encodeURIComponent(body)}`;
+window.open(mailtoLink, '_blank');
+break;
+case 'outlook':
+mailtoLink = `https://outlook.live.com/mail/0/deeplink/compose?to=${CONFIG.email}&subject=${encodeURIComponent(subject)}&body=${encodeURIComponent(body)}`;
+window.open(mailtoLink, '_blank');
+break;
+case 'yahoo':
+mailtoLink = `https://compose.mail.yahoo.com/?to=${CONFIG.email}&subject=${encodeURIComponent(subject)}&body=${encodeURIComponent(body)}`;
+window.open(mailtoLink, '_blank');
+break;
+case 'default':
+mailtoLink = `mailto:${CONFIG.email}?subject=${encodeURIComponent(subject)}&body=${encodeURIComponent(body)}`;
+window.location.href = mailtoLink;
+break;
+}
+closeEmailModal();
+trackEvent('email_provider_selected', {
+'event_category': 'conversion',
+'event_label': provider
+});
+}
+const cookieConsent = document.getElementById('cookieConsent');
+const acceptCookies = document.getElementById('acceptCookies');
+if(!localStorage.getItem('cookiesAccepted')) {
+cookieConsent.style.display = 'flex';
+}
+acceptCookies.addEventListener('click', function() {
+localStorage.setItem('cookiesAccepted', 'true');
+cookieConsent.style.display = 'none';
+trackEvent('cookie_consent', {'event_category': 'engagement', 'event_label': 'accepted'});
+});
+document.getElementById('mobileMenuToggle').addEventListener('click', function() {
+document.getElementById('navMenu').classList.toggle('active');
+trackEvent('mobile_menu_toggle', {'event_category': 'navigation'});
+});
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+anchor.addEventListener('click', function(e) {
+const href = this.getAttribute('href');
+if (href !== '#' && href !== 'javascript:void(0)') {
+e.preventDefault();
+const target = document.querySelector(href);
+if (target) {
+target.scrollIntoView({ behavior: 'smooth' });
+document.getElementById('navMenu').classList.remove('active');
+}
+}
+});
+});
+function animateOnScroll() {
+document.querySelectorAll('.fade-in').forEach(element => {
+const elementTop = element.getBoundingClientRect().top;
+if (elementTop < window.innerHeight - 150) {
+element.classList.add('visible');
+}
+});
+}
+window.addEventListener('scroll', animateOnScroll);
+window.addEventListener('DOMContentLoaded', animateOnScroll);
+function openWhatsAppForService(serviceName, price) {
+const message = `Hi! 👋
+
+I want the *${serviceName}* service for Rs ${price}.
+
+Please guide me on:
+✅ Document submission
+✅ Payment process
+✅ Expected delivery time
+
+Thank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackWhatsAppClick('service_price_click', serviceName);
+trackEvent('whatsapp_click', {
+'event_category': 'conversion',
+'event_label': serviceName,
+'value': parseInt(price)
+});
+}
+function openWhatsAppForPricing(planName, price) {
+const message = `Hi! 👋
+
+I'm interested in the *${planName}* plan.
+
+Can you help me with:
+✅ Getting started
+✅ Document submission
+✅ Payment options
+
+Thank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackWhatsAppClick('pricing_get_started', planName);
+trackEvent('whatsapp_click', {
+'event_category': 'conversion',
+'event_label': planName,
+'value': parseInt(price)
+});
+}
+function openWhatsAppForSample() {
+const message = `Hi! 👋
+
+I would like to view sample reports:
+📄 Plagiarism Detection
+🤖 AI Content Detection
+📊 Combined Report
+
+Thank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackWhatsAppClick('sample_report', 'all');
+}
+const uploadArea = document.getElementById('uploadArea');
+const fileInput = document.getElementById('fileInput');
+const fileList = document.getElementById('fileList');
+let uploadedFiles = [];
+uploadArea.addEventListener('click', () => {
+fileInput.click();
+trackEvent('upload_area_click', {'event_category': 'interaction'});
+});
+uploadArea.addEventListener('dragover', (e) => {
+e.preventDefault();
+uploadArea.classList.add('dragover');
+});
+uploadArea.addEventListener('dragleave', () => {
+uploadArea.classList.remove('dragover');
+});
+uploadArea.addEventListener('drop', (e) => {
+e.preventDefault();
+uploadArea.classList.remove('dragover');
+const files = Array.from(e.dataTransfer.files);
+uploadedFiles = files;
+displayFiles();
+trackEvent('file_drop', {'event_category': 'interaction', 'event_label': files.length + '_files'});
+});
+fileInput.addEventListener('change', (e) => {
+uploadedFiles = Array.from(e.target.files);
+displayFiles();
+trackEvent('file_select', {'event_category': 'interaction', 'event_label': uploadedFiles.length + '_files'});
+});
+function displayFiles() {
+fileList.innerHTML = '';
+const maxSize = 100 * 1024 * 1024; 
+uploadedFiles.forEach((file, index) => {
+const item = document.createElement('div');
+item.className = 'file-item';
+if (file.size > maxSize) {
+item.style.border = '2px solid #dc3545';
+item.style.background = '#fff5f5';
+item.innerHTML = `
+                        <span>
+                            ⚠️ ${getFileIcon(file.name)} ${file.name} 
+                            <small style="color: #dc3545; font-weight: bold;">
+                                (${formatFileSize(file.size)} - EXCEEDS 100MB WHATSAPP LIMIT)
+                            </small>
+                        </span>
+                        <button class="remove-file" onclick="removeFile(${index})">Remove</button>
+                    `;
+} else {
+item.innerHTML = `
+                        <span>✅ ${getFileIcon(file.name)} ${file.name} <small>(${formatFileSize(file.size)})</small></span>
+                        <button class="remove-file" onclick="removeFile(${index})">Remove</button>
+                    `;
+}
+fileList.appendChild(item);
+});
+const oversizedFiles = uploadedFiles.filter(f => f.size > maxSize);
+if (oversizedFiles.length > 0) {
+showInlineError('uploadError',
+`⚠️ ${oversizedFiles.length} file(s) exceed 100MB WhatsApp limit. You can still submit, but you'll need to send smaller files or use email.`
+);
+}
+}
+function getFileIcon(filename) {
+const ext = filename.split('.').pop().toLowerCase();
+const iconMap = {
+'pdf': '📕',
+'doc': '📘',
+'docx': '📘',
+'txt': '📄',
+'rtf': '📝',
+'odt': '📗',
+'pages': '📙'
+};
+return iconMap[ext] || '📝';
+}
+function removeFile(index) {
+uploadedFiles.splice(index, 1);
+displayFiles();
+trackEvent('file_remove', {'event_category': 'interaction'});
+}
+function formatFileSize(bytes) {
+if (bytes === 0) return '0 Bytes';
+const k = 1024;
+const sizes = ['Bytes', 'KB', 'MB', 'GB'];
+const i = Math.floor(Math.log(bytes) / Math.log(k));
+return Math.round(bytes / Math.pow(k, i) * 100) / 100 + ' ' + sizes[i];
+}
+document.getElementById('submitWhatsAppBtn').addEventListener('click', function() {
+if (!uploadedFiles.length) {
+showInlineError('uploadError', '⚠️ Please upload at least one file');
+return;
+}
+const mobile = document.getElementById('mobileNumber').value.trim();
+if (!mobile || mobile.length < 10) {
+showInlineError('uploadError', '⚠️ Please enter a valid mobile number');
+return;
+}
+const agreeTerms = document.getElementById('agreeTermsUpload');
+if (!agreeTerms.checked) {
+showInlineError('uploadError', '⚠️ Please agree to Terms of Service and Privacy Policy to continue');
+agreeTerms.focus();
+agreeTerms.scrollIntoView({ behavior: 'smooth', block: 'center' });
+return;
+}
+const service = document.getElementById('serviceType').options[document.getElementById('serviceType').selectedIndex].text;
+const countryCode = document.getElementById('countryCode').value;
+const progressBar = document.getElementById('uploadProgress');
+const progressFill = document.getElementById('progressFill');
+const progressText = document.getElementById('progressText');
+const progressMessage = document.getElementById('progressMessage');
+progressBar.style.display = 'block';
+let progress = 0;
+const interval = setInterval(() => {
+progress += Math.random() * 15;
+if (progress > 100) progress = 100;
+progressFill.style.width = progress + '%';
+progressText.textContent = Math.round(progress) + '%';
+if (progress < 30) {
+progressMessage.textContent = 'Analyzing documents...';
+} else if (progress < 60) {
+progressMessage.textContent = 'Preparing submission...';
+} else if (progress < 90) {
+progressMessage.textContent = 'Almost ready...';
+} else {
+progressMessage.textContent = 'Opening WhatsApp...';
+}
+if (progress >= 100) {
+clearInterval(interval);
+setTimeout(() => {
+const message = `📄 DOCUMENT CHECK REQUEST
+
+Service: ${service}
+Mobile: ${countryCode}${mobile}
+Files: ${uploadedFiles.map(f => f.name).join(', ')}
+Total Size: ${formatFileSize(uploadedFiles.reduce((sum, f) => sum + f.size, 0))}
+
+Please guide me on the submission process and payment details.`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackWhatsAppClick('document_submission', service);
+progressBar.style.display = 'none';
+progressFill.style.width = '0%';
+document.getElementById('uploadSuccess').style.display = 'block';
+setTimeout(() => {
+document.getElementById('uploadSuccess').style.display = 'none';
+}, 5000);
+}, 500);
+}
+}, 200);
+});
+document.getElementById('submitEmailBtn').addEventListener('click', function() {
+if (!uploadedFiles.length) {
+alert('⚠️ Please upload at least one file');
+return;
+}
+const mobile = document.getElementById('mobileNumber').value.trim();
+if (!mobile || mobile.length < 10) {
+alert('⚠️ Please enter a valid mobile number');
+return;
+}
+const service = document.getElementById('serviceType').options[document.getElementById('serviceType').selectedIndex].text;
+const countryCode = document.getElementById('countryCode').value;
+showEmailProviderModal({
+subject: `Document Check Request - ${service}`,
+body: `Service: ${service}\nMobile: ${countryCode}${mobile}\nFiles to attach: ${uploadedFiles.map(f => f.name).join(', ')}\n\nPlease attach your files manually and send.`
+});
+trackEvent('email_submission', {'event_category': 'conversion', 'event_label': service});
+});
+function validateContactForm() {
+const name = document.getElementById('name').value.trim();
+const email = document.getElementById('email').value.trim();
+const mobile = document.getElementById('contactMobile').value.trim();
+const message = document.getElementById('message').value.trim();
+if (!name || !email || !mobile || !message) {
+alert('⚠️ Please fill all required fields');
+return false;
+}
+if (!validateEmail(email)) {
+alert('⚠️ Please enter a valid email address');
+return false;
+}
+if (mobile.length < 10) {
+alert('⚠️ Please enter a valid mobile number');
+return false;
+}
+return true;
+}
+function validateEmail(email) {
+return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);
+}
+document.getElementById('sendWhatsAppBtn').addEventListener('click', function() {
+if (!validateContactForm()) return;
+const name = document.getElementById('name').value.trim();
+const email = document.getElementById('email').value.trim();
+const mobile = document.getElementById('contactCountryCode').value + document.getElementById('contactMobile').value.trim();
+const subject = document.getElementById('subject').options[document.getElementById('subject').selectedIndex].text;
+const message = document.getElementById('message').value.trim();
+const whatsappMessage = `📧 CONTACT FORM SUBMISSION
+
+Name: ${name}
+Email: ${email}
+Mobile: ${mobile}
+Subject: ${subject}
+
+Message:
+${message}`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(whatsappMessage)}`, '_blank');
+trackWhatsAppClick('contact_form', subject);
+document.getElementById('contactSuccess').style.display = 'block';
+setTimeout(() => {
+document.getElementById('contactSuccess').style.display = 'none';
+document.getElementById('contactForm').reset();
+}, 5000);
+});
+document.getElementById('sendEmailBtn').addEventListener('click', function() {
+if (!validateContactForm()) return;
+const name = document.getElementById('name').value.trim();
+const email = document.getElementById('email').value.trim();
+const mobile = document.getElementById('contactCountryCode').value + document.getElementById('contactMobile').value.trim();
+const subject = document.getElementById('subject').options[document.getElementById('subject').selectedIndex].text;
+const message = document.getElementById('message').value.trim();
+showEmailProviderModal({
+subject: `Contact: ${subject}`,
+body: `Name: ${name}\nEmail: ${email}\nMobile: ${mobile}\n\nMessage:\n${message}`
+});
+trackEvent('email_contact', {'event_category': 'conversion', 'event_label': subject});
+});
+async function verifyPassword() {
+const password = document.getElementById('adminPassword').value;
+if (!password) {
+alert('⚠️ Please enter a password');
+return;
+}
+const encoder = new TextEncoder();
+const data = encoder.encode(password);
+const hashBuffer = await crypto.subtle.digest('SHA-256', data);
+const hashArray = Array.from(new Uint8Array(hashBuffer));
+const enteredHash = hashArray.map(b => b.toString(16).padStart(2, '0')).join('');
+if (enteredHash === CONFIG.adminPasswordHash) {
+document.getElementById('passwordModal').style.display = 'none';
+document.getElementById('passwordError').style.display = 'none';
+document.getElementById('adminPassword').value = '';
+document.querySelector('main').style.display = 'none';
+document.getElementById('blog-admin').classList.add('active');
+window.scrollTo(0, 0);
+loadBlogPosts().then(renderBlogPosts);
+trackEvent('admin_login_success', {'event_category': 'admin'});
+} else {
+document.getElementById('passwordError').style.display = 'block';
+trackEvent('admin_login_failed', {'event_category': 'admin'});
+}
+}
+function showHomePage() {
+document.querySelector('main').style.display = 'block';
+document.getElementById('blog-admin').classList.remove('active');
+window.scrollTo(0, 0);
+}
+function sanitizeHTML(str) {
+if (!str) return '';
+const div = document.createElement('div');
+div.textContent = str;
+return div.innerHTML;
+}
+function renderBlogPosts() {
+const container = document.getElementById('blogPostsContainer');
+if (blogPosts.length === 0) {
+container.innerHTML = '<p style="text-align: center; color: #666; padding: 2rem;">No blog posts found. Add your first post above!</p>';
+return;
+}
+container.innerHTML = '';
+const sortedPosts = [...blogPosts].sort((a, b) => b.id - a.id);
+sortedPosts.forEach(post => {
+const el = document.createElement('div');
+el.className = 'blog-post';
+el.innerHTML = `
+                    <div>
+                        <h3>${sanitizeHTML(post.title)}</h3>
+                        <p style="color: #666; margin: 0.5rem 0 0;">
+                            <small>📅 ${post.date} • ⏱️ ${post.readTime} min read • 📂 ${post.category || 'Uncategorized'}</small>
+                        </p>
+                    </div>
+                    <div class="blog-actions">
+                        <button class="action-btn view-btn" onclick="viewBlogPost(${post.id})">
+                            <i class="fas fa-eye"></i> View
+                        </button>
+                    </div>
+                `;
+container.appendChild(el);
+});
+}
+function viewBlogPost(id) {
+const post = blogPosts.find(p => p.id === id);
+if (post && post.content === undefined) {
+fetch(`blogs/posts/${id}.json`)
+.then(response => response.json())
+.then(full => { Object.assign(post, full); viewBlogPost(id); })
+.catch(error => console.error('Error loading blog post:', error));
+return;
+}
+if (post) {
+document.getElementById('blogModalContent').innerHTML = `
+                    <h2 style="color: #0a5d8c; margin-bottom: 1rem;">${sanitizeHTML(post.title)}</h2>
+                    <p style="color: #666; margin-bottom: 2rem;">
+                        <strong>Date:</strong> ${post.date} | 
+                        <strong>Read Time:</strong> ${post.readTime} min | 
+                        <strong>Category:</strong> ${post.category || 'N/A'}
+                    </p>
+                    ${post.image ? `<img src="${post.image}" alt="${post.title}" style="width: 100%; border-radius: 10px; margin-bottom: 2rem;">` : ''}
+                    <div style="line-height: 1.8;">
+                        ${post.content}
+                    </div>
+                    <p style="margin-top: 2rem; padding-top: 2rem; border-top: 2px solid #eee; color: #666;">
+                        <strong>Excerpt:</strong> ${post.excerpt || 'N/A'}
+                    </p>
+                `;
+document.getElementById('blogModal').style.display = 'block';
+trackEvent('blog_post_view', {'event_category': 'blog', 'event_label': post.title});
+}
+}
+document.getElementById('closeBlogModal').addEventListener('click', function() {
+document.getElementById('blogModal').style.display = 'none';
+});
+document.getElementById('blogTitle').addEventListener('input', function() {
+const title = this.value;
+const slug = title.toLowerCase()
+.replace(/[^a-z0-9\s-]/g, '')
+.replace(/\s+/g, '-')
+.replace(/-+/g, '-')
+.substring(0, 100);
+document.getElementById('blogSlug').value = slug;
+});
+document.getElementById('saveBlogBtn').addEventListener('click', function() {
+const title = document.getElementById('blogTitle').value.trim();
+const content = document.getElementById('blogContent').value.trim();
+if (!title || !content) {
+alert('⚠️ Please fill in both Title and Content fields');
+return;
+}
+let slug = document.getElementById('blogSlug').value.trim();
+if (!slug) {
+slug = title.toLowerCase()
+.replace(/[^a-z0-9\s-]/g, '')
+.replace(/\s+/g, '-')
+.replace(/-+/g, '-');
+}
+const image = document.getElementById('blogImage').value.trim() || 'https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8?ixlib=rb-4.0.3&auto=format&fit=crop&w=800&q=80';
+const category = document.getElementById('blogCategory').value;
+const excerpt = document.getElementById('blogExcerpt').value.trim() || content.substring(0, 150).replace(/<[^>]*>/g, '') + '...';
+const wordCount = content.replace(/<[^>]*>/g, '').split(/\s+/).length;
+const readTime = Math.max(1, Math.ceil(wordCount / 200));
+const newPost = {
+id: blogPosts.length > 0 ? Math.max(...blogPosts.map(p => p.id)) + 1 : 1,
+title: title,
+slug: slug,
+content: content,
+excerpt: excerpt,
+image: image,
+meta: {
+title: title,
+description: excerpt
+},
+date: new Date().toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' }),
+author: "TurnitinPaperChecker Team",
+readTime: readTime,
+category: category,
+tags: []
+};
+blogPosts.push(newPost);
+document.getElementById('blogSuccess').style.display = 'block';
+document.getElementById('blogTitle').value = '';
+document.getElementById('blogSlug').value = '';
+document.getElementById('blogContent').value = '';
+document.getElementById('blogImage').value = '';
+document.getElementById('blogExcerpt').value = '';
+renderBlogPosts();
+trackEvent('blog_post_created', {'event_category': 'blog', 'event_label': title});
+setTimeout(() => {
+document.getElementById('blogSuccess').style.display = 'none';
+}, 5000);
+setTimeout(() => {
+alert(`✅ Blog post created!
+
+⚠️ Note: This is stored in-memory only.
+
+To persist permanently:
+1. Copy the blog data
+2. Add to blogs-data.js file
+3. Or use blog-generator.py
+
+Blog ID: ${newPost.id}
+Title: ${newPost.title}
+Slug: ${newPost.slug}`);
+}, 1000);
+});
+document.getElementById('footerNewsletterForm')?.addEventListener('submit', async function(e) {
+e.preventDefault();
+const emailInput = document.getElementById('footerNewsletterEmail');
+const email = emailInput.value.trim();
+const message = document.getElementById('newsletterMessage');
+if (!email || !validateEmail(email)) {
+message.textContent = '⚠️ Please enter a valid email address';
+message.style.display = 'block';
+message.style.color = '#dc3545';
+return;
+}
+message.textContent = '⏳ Subscribing...';
+message.style.display = 'block';
+message.style.color = '#87cefa';
+try {
+let subscribers = JSON.parse(localStorage.getItem('newsletterSubscribers') || '[]');
+if (!subscribers.includes(email)) {
+subscribers.push(email);
+try { localStorage.setItem('newsletterSubscribers', JSON.stringify(subscribers)); } catch(e) { console.warn('Storage failed:', e); }
+}
+const subscriptionMessage = `🔔 NEW NEWSLETTER SUBSCRIBER
+
+        📧 Email: ${email}
+        📅 Date: ${new Date().toLocaleString()}
+        🌐 Source: Website Footer
+        📊 Total Subscribers: ${subscribers.length}
+
+        Action Required:
+        1. Add to newsletter-subscribers.json
+        2. Send welcome email
+        3. Include in next blog email blast`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(subscriptionMessage)}`, '_blank');
+setTimeout(() => {
+message.innerHTML = `✅ <strong>Thank you for subscribing!</strong><br>You'll receive daily blog updates at ${email}`;
+message.style.color = '#27ae60';
+message.style.background = '#d4edda';
+message.style.padding = '15px';
+message.style.borderRadius = '8px';
+message.style.marginTop = '15px';
+emailInput.value = '';
+trackEvent('newsletter_subscribe', {
+'event_category': 'conversion',
+'event_label': 'footer',
+'value': 1
+});
+setTimeout(() => {
+message.style.display = 'none';
+message.style.background = 'transparent';
+message.style.padding = '0';
+}, 10000);
+}, 1000);
+} catch (error) {
+message.textContent = '❌ Subscription failed. Please try again or contact support.';
+message.style.color = '#dc3545';
+}
+});
+window.addEventListener('click', function(event) {
+if (event.target.id === 'passwordModal') {
+document.getElementById('passwordModal').style.display = 'none';
+}
+if (event.target.id === 'blogModal') {
+document.getElementById('blogModal').style.display = 'none';
+}
+if (event.target.id === 'emailProviderModal') {
+closeEmailModal();
+}
+});
+document.addEventListener('keydown', function(event) {
+if (event.key === 'Escape') {
+document.getElementById('passwordModal').style.display = 'none';
+document.getElementById('blogModal').style.display = 'none';
+closeEmailModal();
+}
+if (event.key === 'Enter' && document.getElementById('passwordModal').style.display === 'flex') {
+verifyPassword();
+}
+});
+let maxScrollDepth = 0;
+let scrollTracked = {25: false, 50: false, 75: false, 100: false};
+window.addEventListener('scroll', function() {
+const scrollHeight = document.documentElement.scrollHeight - window.innerHeight;
+const scrollDepth = Math.round((window.scrollY / scrollHeight) * 100);
+if (scrollDepth > maxScrollDepth) {
+maxScrollDepth = scrollDepth;
+if (maxScrollDepth >= 25 && !scrollTracked[25]) {
+trackEvent('scroll_depth', {'event_category': 'engagement', 'event_label': '25%'});
+scrollTracked[25] = true;
+} else if (maxScrollDepth >= 50 && !scrollTracked[50]) {
+trackEvent('scroll_depth', {'event_category': 'engagement', 'event_label': '50%'});
+scrollTracked[50] = true;
+} else if (maxScrollDepth >= 75 && !scrollTracked[75]) {
+trackEvent('scroll_depth', {'event_category': 'engagement', 'event_label': '75%'});
+scrollTracked[75] = true;
+} else if (maxScrollDepth >= 100 && !scrollTracked[100]) {
+trackEvent('scroll_depth', {'event_category': 'engagement', 'event_label': '100%'});
+scrollTracked[100] = true;
+}
+}
+});
+let timeOnPage = 0;
+let timeTracked = {30: false, 60: false, 180: false, 300: false};
+setInterval(function() {
+timeOnPage += 30;
+if (timeOnPage === 30 && !timeTracked[30]) {
+trackEvent('time_on_page', {'event_category': 'engagement', 'event_label': '30_seconds'});
+timeTracked[30] = true;
+} else if (timeOnPage === 60 && !timeTracked[60]) {
+trackEvent('time_on_page', {'event_category': 'engagement', 'event_label': '1_minute'});
+timeTracked[60] = true;
+} else if (timeOnPage === 180 && !timeTracked[180]) {
+trackEvent('time_on_page', {'event_category': 'engagement', 'event_label': '3_minutes'});
+timeTracked[180] = true;
+} else if (timeOnPage === 300 && !timeTracked[300]) {
+trackEvent('time_on_page', {'event_category': 'engagement', 'event_label': '5_minutes'});
+timeTracked[300] = true;
+}
+}, 30000);
+document.addEventListener('mouseleave', function(event) {
+if (event.clientY < 0) {
+trackEvent('exit_intent', {'event_category': 'engagement'});
+}
+});
+document.addEventListener('visibilitychange', function() {
+if (document.hidden) {
+trackEvent('page_hidden', {'event_category': 'engagement'});
+} else {
+trackEvent('page_visible', {'event_category': 'engagement'});
+}
+});
+const navLinks = document.querySelectorAll('.nav-link');
+const sections = document.querySelectorAll('section[id]');
+window.addEventListener('scroll', () => {
+let current = '';
+sections.forEach(section => {
+const sectionTop = section.offsetTop - 100;
+if (pageYOffset >= sectionTop) {
+current = section.getAttribute('id');
+}
+});
+navLinks.forEach(link => {
+link.classList.remove('active');
+if (link.getAttribute('href') === '#' + current) {
+link.classList.add('active');
+}
+});
+});
+if (navLinks.length > 0) {
+navLinks[0].classList.add('active');
+}
+window.addEventListener('DOMContentLoaded', function() {
+if (localStorage.getItem('darkMode') === 'enabled') {
+document.body.classList.add('dark-mode');
+const toggleBtn = document.getElementById('darkModeToggle');
+if (toggleBtn) {
+toggleBtn.textContent = '☀️';
+}
+const mobileIcon = document.getElementById('mobileDarkModeIcon');
+if (mobileIcon) {
+mobileIcon.textContent = '☀️';
+}
+}
+const currencySelector = document.getElementById('currencySelector');
+const mobileCurrencySelector = document.getElementById('mobileCurrencySelector');
+if (currencySelector && mobileCurrencySelector) {
+const savedCurrency = localStorage.getItem('preferredCurrency') || 'INR';
+currencySelector.value = savedCurrency;
+mobileCurrencySelector.value = savedCurrency;
+}
+const savedCurrency = localStorage.getItem('preferredCurrency');
+if (savedCurrency && savedCurrency !== 'INR') {
+const currencySelector = document.getElementById('currencySelector');
+if (currencySelector) {
+currencySelector.value = savedCurrency;
+updateCurrency(savedCurrency);
+}
+}
+loadCountryCodes();
+if (document.getElementById('wordCountSlider')) {
+updateCalculatorPrice();
+document.getElementById('wordCountSlider').addEventListener('input', updateCalculatorPrice);
+document.getElementById('serviceTypeSelector').addEventListener('change', updateCalculatorPrice);
+document.getElementById('deliverySpeedSelector').addEventListener('change', updateCalculatorPrice);
+}
+animateLiveStats();
+initializeActivityFeed();
+setTimeout(showIntegrityDisclaimer, 2000); 
+animateOnScroll();
+trackEvent('page_load', {'event_category': 'engagement'});
+if (window.performance && window.performance.timing) {
+const loadTime = window.performance.timing.loadEventEnd - window.performance.timing.navigationStart;
+trackEvent('page_load_time', {
+'event_category': 'performance',
+'value': Math.round(loadTime / 1000)
+});
+}
+});
+function requestSampleReport(reportType) {
+const message = `Hi! 👋
+
+I would like to view a detailed sample report for:
+📊 Report Type: ${reportType}
+
+Please share the full sample report so I can see:
+✅ Format and layout
+✅ Level of detail
+✅ Quality of analysis
+
+This will help me understand what I'll receive before ordering.
+
+Thank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackEvent('sample_report_request', {
+'event_category': 'engagement',
+'event_label': reportType
+});
+}
+function openWhatsAppForQuery(topic) {
+const messages = {
+'fast delivery': `Hi! 👋\n\nI saw your WhatsApp reviews about fast delivery.\n\nHow quickly can I get my report?\n\nThank you!`,
+'fast delivery service': `Hi! 👋\n\nI saw a customer got their report in 12 minutes!\n\nCan I also get such fast service?\n\nThank you!`,
+'pricing': `Hi! 👋\n\nI saw your WhatsApp chat showing Rs 200 pricing.\n\nCan you confirm the current pricing for:\n- Plagiarism check\n- AI detection\n- Combined report\n\nThank you!`,
+'pricing information': `Hi! 👋\n\nI'm interested in your services. What are your current prices?\n\nThank you!`,
+'report quality': `Hi! 👋\n\nI want to verify that you provide authentic Turnitin reports.\n\nCan you share a sample to prove authenticity?\n\nThank you!`,
+'report authenticity': `Hi! 👋\n\nHow can I be sure these are real Turnitin reports and not from free online tools?\n\nThank you!`
+};
+const message = messages[topic] || `Hi! 👋\n\nI saw your WhatsApp reviews and I'm interested in your services.\n\nCan you help me with plagiarism checking?\n\nThank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackEvent('whatsapp_review_click', {
+'event_category': 'social_proof',
+'event_label': topic
+});
+}
+function openWhatsAppGeneral() {
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent('Hi! I saw your customer reviews and I need plagiarism checking service. Can you help me?')}`, '_blank');
+trackEvent('whatsapp_cta_click', {'event_category': 'conversion'});
+}
+function updateCalculatorPrice() {
+const wordCount = parseInt(document.getElementById('wordCountSlider').value);
+const serviceType = document.getElementById('serviceTypeSelector').value;
+const deliverySpeed = parseFloat(document.getElementById('deliverySpeedSelector').value);
+document.getElementById('wordCountDisplay').textContent = wordCount.toLocaleString();
+let basePrice = parseInt(serviceType.replace('-ai', ''));
+let wordMultiplier = 1;
+let wordFactorText = 'Standard (< 5,000 words)';
+if (wordCount > 5000 && wordCount <= 10000) {
+wordMultiplier = 1.2;
+wordFactorText = 'Medium (5,001-10,000 words) +20%';
+} else if (wordCount > 10000 && wordCount <= 15000) {
+wordMultiplier = 1.5;
+wordFactorText = 'Large (10,001-15,000 words) +50%';
+} else if (wordCount > 15000) {
+wordMultiplier = 1.8;
+wordFactorText = 'Extra Large (15,000+ words) +80%';
+}
+const finalPrice = Math.round(basePrice * wordMultiplier * deliverySpeed);
+document.getElementById('calculatedPrice').textContent = currencySymbols[currentCurrency] + ' ' + Math.round(finalPrice * currencyRates[currentCurrency]);
+document.getElementById('wordFactor').textContent = wordFactorText;
+let deliveryText = '10-20 minutes';
+if (deliverySpeed === 1.5) {
+deliveryText = '5-10 minutes (Express)';
+} else if (deliverySpeed === 2) {
+deliveryText = '2-5 minutes (Rush)';
+}
+document.getElementById('estimatedDelivery').textContent = deliveryText;
+}
+function sendCalculatedQuoteToWhatsApp() {
+const wordCount = document.getElementById('wordCountSlider').value;
+const serviceText = document.getElementById('serviceTypeSelector').options[document.getElementById('serviceTypeSelector').selectedIndex].text;
+const deliveryText = document.getElementById('deliverySpeedSelector').options[document.getElementById('deliverySpeedSelector').selectedIndex].text;
+const finalPrice = document.getElementById('calculatedPrice').textContent;
+const deliveryTime = document.getElementById('estimatedDelivery').textContent;
+const message = `Hi! 👋
+
+I used your price calculator and here's my quote:
+
+📝 Word Count: ${wordCount} words
+⚡ Service: ${serviceText}
+🚀 Delivery Speed: ${deliveryText}
+💰 Estimated Price: Rs ${finalPrice}
+⏱️ Delivery Time: ${deliveryTime}
+
+Please confirm the final price and guide me on the next steps.
+
+Thank you!`;
+window.open(`https://wa.me/${CONFIG.whatsappNumber}?text=${encodeURIComponent(message)}`, '_blank');
+trackEvent('price_calculator_submit', {
+'event_category': 'conversion',
+'event_label': serviceText,
+'value': parseInt(finalPrice)
+});
+}
+function animateLiveStats() {
+const ordersEl = document.getElementById('ordersToday');
+const usersEl = document.getElementById('waitingUsers');
+if (!ordersEl || !usersEl) return;
+let dailyOrders = parseInt(localStorage.getItem('dailyOrders') || '200');
+let lastUpdateDate = localStorage.getItem('lastUpdateDate') || new Date().toDateString();
+const today = new Date().toDateString();
+if (lastUpdateDate !== today) {
+dailyOrders = 200; 
+localStorage.setItem('lastUpdateDate', today);
+localStorage.setItem('dailyOrders', '200');
+}
+ordersEl.textContent = dailyOrders;
+setInterval(() => {
+dailyOrders += Math.floor(Math.random() * 3) + 1; 
+if (dailyOrders > 999) dailyOrders = 250; 
+localStorage.setItem('dailyOrders', dailyOrders.toString());
+ordersEl.textContent = dailyOrders;
+}, 15000);
+setInterval(() => {
+const randomUsers = 8 + Math.floor(Math.random() * 10);
+usersEl.textContent = randomUsers;
+}, 8000);
+const viewersEl = document.getElementById('liveViewers');
+if (viewersEl) {
+setInterval(() => {
+const randomViewers = 5 + Math.floor(Math.random() * 10);
+viewersEl.textContent = randomViewers;
+}, 12000);
+}
+}
+const indianCities = ["Delhi", "Mumbai", "Bangalore", "Pune", "Kolkata", "Hyderabad", "Chennai", "Ahmedabad", "Jaipur", "Lucknow", "Surat", "Kanpur", "Nagpur", "Indore", "Thane", "Bhopal", "Visakhapatnam", "Patna", "Vadodara", "Ghaziabad"];
+const firstNames = ["Priya", "Rahul", "Sarah", "John", "Amit", "Emily", "David", "Lisa", "Mohammed", "Sophia", "Arjun", "Maya", "Rohan", "Ananya", "Vikram", "Neha", "Karan", "Aisha", "Sanjay", "Riya", "Alex", "Nina", "Sam", "Diya", "Aryan", "Ishaan", "Zara", "Aarav", "Nisha", "Kabir"];
+const lastNames = ["Sharma", "Kumar", "Singh", "Patel", "Shah", "Gupta", "Khan", "Reddy", "Rao", "Nair", "Mehta", "Joshi", "Das", "Thompson", "Wilson", "Chen", "Rodriguez", "Kim", "Lee", "Brown", "Martinez", "Garcia", "Anderson", "Taylor", "Verma", "Agarwal", "Malhotra", "Chopra", "Bansal"];
+const actions = [
+"ordered plagiarism check",
+"got AI detection report",
+"ordered combined report",
+"rated us 5 stars ⭐⭐⭐⭐⭐",
+"reordered for thesis",
+"requested sample report",
+"ordered bulk package",
+"completed payment",
+"received report in 10 min",
+"submitted dissertation",
+"got express delivery",
+"recommended to friend"
+];
+let usedNames = JSON.parse(localStorage.getItem('usedActivityNames') || '[]');
+let lastReset = localStorage.getItem('lastActivityReset') || new Date().toDateString();
+const today = new Date();
+const todayStr = today.toDateString();
+if (lastReset !== todayStr) {
+const lastDate = new Date(lastReset);
+const daysDiff = Math.floor((today - lastDate) / (1000 * 60 * 60 * 24));
+if (daysDiff >= 30) {
+usedNames = [];
+localStorage.setItem('lastActivityReset', todayStr);
+localStorage.setItem('usedActivityNames', '[]');
+}
+}
+try {
+const storageKeys = ['dailyOrders', 'lastUpdateDate', 'usedActivityNames', 'lastActivityReset'];
+storageKeys.forEach(key => {
+const data = localStorage.getItem(key);
+if (data) {
+const stored = localStorage.getItem(key + '_timestamp');
+if (stored) {
+const timestamp = parseInt(stored);
+const daysSinceStored = Math.floor((Date.now() - timestamp) / (1000 * 60 * 60 * 24));
+if (daysSinceStored > 90) {
+localStorage.removeItem(key);
+localStorage.removeItem(key + '_timestamp');
+}
+} else {
+localStorage.setItem(key + '_timestamp', Date.now().toString());
+}
+}
+});
+} catch (e) {
+console.error('localStorage cleanup error:', e);
+}
+function generateUniqueName() {
+let attempts = 0;
+while (attempts < 100) {
+const firstName = firstNames[Math.floor(Math.random() * firstNames.length)];
+const lastName = lastNames[Math.floor(Math.random() * lastNames.length)];
+const fullName = `${firstName} ${lastName.charAt(0)}.`;
+if (!usedNames.includes(fullName)) {
+usedNames.push(fullName);
+if (usedNames.length > 100) usedNames.shift(); 
+localStorage.setItem('usedActivityNames', JSON.stringify(usedNames));
+return {
+name: fullName,
+avatar: firstName.charAt(0) + lastName.charAt(0)
+};
+}
+attempts++;
+}
+return {
+name: `User ${Math.floor(Math.random() * 9999)}`,
+avatar: "U" + Math.floor(Math.random() * 99)
+};
+}
+function generateActivity() {
+const person = generateUniqueName();
+const action = actions[Math.floor(Math.random() * actions.length)];
+const city = indianCities[Math.floor(Math.random() * indianCities.length)];
+const minutesAgo = Math.floor(Math.random() * 30) + 2;
+return {
+name: person.name,
+action: action,
+time: `${minutesAgo} min ago`,
+city: city,
+avatar: person.avatar
+};
+}
+let currentActivityIndex = 0;
+function showNextActivity() {
+const container = document.getElementById('activityContainer');
+if (!container) return;
+const activity = generateActivity();
+const html = `
+                <div class="activity-item">
+                    <img src="https://ui-avatars.com/api/?name=${encodeURIComponent(activity.avatar)}&background=0a9cfc&color=fff&size=50&bold=true" 
+                        class="avatar" 
+                        alt="${activity.name}">
+                    <div class="activity-content">
+                        <strong>${activity.name}</strong> ${activity.action}
+                        <p>📍 ${activity.city}, India</p>
+                    </div>
+                    <div class="activity-time">${activity.time}</div>
+                </div>
+            `;
+container.insertAdjacentHTML('afterbegin', html);
+const items = container.querySelectorAll('.activity-item');
+if (items.length > 6) {
+items[items.length - 1].remove();
+}
+}
+function initializeActivityFeed() {
+const container = document.getElementById('activityContainer');
+if (!container) return;
+for (let i = 0; i < 5; i++) {
+showNextActivity();
+}
+setInterval(showNextActivity, 8000);
+}
+function showIntegrityDisclaimer() {
+const hasAccepted = localStorage.getItem('integrityDisclaimerAccepted');
+const modal = document.getElementById('integrityDisclaimerModal');
+const checkbox = document.getElementById('acceptIntegrityDisclaimer');
+const acceptBtn = document.getElementById('acceptDisclaimerBtn');
+if (!hasAccepted && modal) {
+modal.style.display = 'flex';
+checkbox.addEventListener('change', function() {
+if (this.checked) {
+acceptBtn.disabled = false;
+acceptBtn.style.background = 'linear-gradient(135deg, #0a5d8c 0%, #0a9cfc 100%)';
+acceptBtn.style.cursor = 'pointer';
+} else {
+acceptBtn.disabled = true;
+acceptBtn.style.background = '#6c757d';
+acceptBtn.style.cursor = 'not-allowed';
+}
+});
+acceptBtn.addEventListener('click', function() {
+if (checkbox.checked) {
+localStorage.setItem('integrityDisclaimerAccepted', 'true');
+modal.style.display = 'none';
+trackEvent('integrity_disclaimer_accepted', {'event_category': 'compliance'});
+}
+});
+}
+}
+window.openWhatsAppForService = openWhatsAppForService;
+window.openWhatsAppForPricing = openWhatsAppForPricing;
+window.openWhatsAppForSample = openWhatsAppForSample;
+window.showHomePage = showHomePage;
+window.verifyPassword = verifyPassword;
+window.viewBlogPost = viewBlogPost;
+window.removeFile = removeFile;
+window.showEmailProviderModal = showEmailProviderModal;
+window.closeEmailModal = closeEmailModal;
+window.openEmailProvider = openEmailProvider;
+console.log('%c👋 Welcome to TurnitinPaperChecker!', 'font-size: 20px; color: #0a5d8c; font-weight: bold;');
+console.log('%c📊 Powered by Advanced AI & Plagiarism Detection', 'font-size: 14px; color: #666;');
+console.log('%c💼 Contact: shivansh.assignment365@gmail.com', 'font-size: 12px; color: #0a9cfc;');
+console.log('%c🔐 Admin Access: Authorized personnel only', 'font-size: 12px; color: #dc3545;');
\ No newline at end of file
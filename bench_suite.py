@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for TurnitinPaperChecker
+Measures how the generator and sender hot paths scale with the corpus,
+with every network service replaced by a local stand-in.
+
+- For each size a scratch directory gets synthetic fixtures in the legacy
+  formats the stores migrate from: blogs-data.js, keywords.json,
+  newsletter-subscribers.json and sent-blogs.json (N posts, N keywords,
+  N subscribers, N - 1 sent ids)
+- Groq (chat-completions stub below), Unsplash/Pexels (image_resolver),
+  IndexNow (notify_queue) and Brevo (email_delivery) are served from
+  localhost, so a run costs no API calls and no quota
+- Each stage reports wall time, peak traced memory and bytes written to
+  disk; every size runs TIMED_RUNS times from identical fixtures without
+  tracemalloc (the best time is kept, so one slow run on a busy machine
+  is not a regression) and then once traced for memory, so its overhead
+  never skews times
+- Results go to bench-results.json; stages slower, hungrier or writing
+  more than REGRESSION_RATIO x bench-baseline.json (beyond the noise
+  floors) are flagged and the run exits with status 1; stages under
+  SHORT_STAGE_MS are only flagged once they also pass SHORT_STAGE_MS,
+  since an fsync or a scheduler hiccup can triple them
+
+Usage:
+    python bench_suite.py run [100,1000,10000]   # 100000 works too, slowly
+    python bench_suite.py baseline               # keep the last results as the baseline
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import socket
+import tempfile
+import threading
+import importlib.util
+import tracemalloc
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ===== CONFIGURATION =====
+SIZES = (100, 1000, 10000)
+RESULTS_FILE = 'bench-results.json'
+BASELINE_FILE = 'bench-baseline.json'
+REGRESSION_RATIO = 1.5
+TIMED_RUNS = 3               # best wall time of these is reported and compared
+NOISE_FLOOR_MS = 25          # smaller slowdowns are timer noise
+SHORT_STAGE_MS = 250         # below this, the floor grows to reach it
+NOISE_FLOOR_KB = 1024
+NOISE_FLOOR_BYTES = 64 * 1024
+WORDS_PER_POST = 150         # keeps the 100k fixture around 150 MB
+SEED = 1
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Site files save_blogs needs besides the stores (page template, assets, sw.js)
+SITE_FILES = ['blog-post.html', 'sw.js', 'country-codes.json', 'manage-blog.html',
+              os.path.join('src', 'index.html'), 'image1.jpeg', 'image2.jpeg', 'image3.jpeg']
+SITE_DIRS = [os.path.join('assets', 'img')]   # image variants: not re-encoded per size
+
+# ===== FIXTURES =====
+TOPICS = ['turnitin', 'plagiarism', 'similarity', 'citation', 'paraphrasing', 'thesis', 'ai detection',
+          'research', 'essay', 'assignment', 'originality', 'referencing', 'university', 'report']
+CATEGORIES = ['Academic Integrity', 'AI Detection', 'Guides', 'Research Tips', 'Turnitin', 'Writing']
+
+def _vocab(rng, size=20000):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return list({''.join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(size)})
+
+def synthetic_post(rng, vocab, blog_id):
+    topic = rng.sample(TOPICS, 2)
+    title = f"{topic[0].title()} {rng.choice(['Guide', 'Tips', 'Mistakes', 'Explained'])} {' '.join(rng.sample(vocab, 3))} {blog_id}"
+    words = [rng.choice(vocab) for _ in range(WORDS_PER_POST)]
+    third = WORDS_PER_POST // 3
+    content = (f"<h2>{topic[0].title()} basics</h2><p>{' '.join(words[:third])}</p>"
+               f"<h2>{topic[1].title()} in practice</h2><p>{' '.join(words[third:2 * third])}</p>"
+               f"<h2>Next steps</h2><p>{' '.join(words[2 * third:])} "
+               f'<a href="https://www.turnitinpaperchecker.com/#pricing">check your paper</a></p>')
+    return {
+        'id': blog_id,
+        'title': title,
+        'slug': title.lower().replace(' ', '-')[:60],
+        'content': content,
+        'excerpt': ' '.join(words[:30]) + '...',
+        'image': f"https://images.unsplash.com/photo-{blog_id}?w=800",
+        'meta': f"{title} - synthetic post",
+        'date': 'January 01, 2026',
+        'author': 'TurnitinPaperChecker Team',
+        'readTime': 3,
+        'category': rng.choice(CATEGORIES),
+        'tags': topic,
+        'keyword': f"{' '.join(topic)} {blog_id}",
+    }
+
+def write_fixtures(directory, size, seed=SEED):
+    """Legacy-format fixtures for `size` posts / keywords / subscribers"""
+    rng = random.Random(seed)
+    vocab = _vocab(rng)
+    with open(os.path.join(directory, 'blogs-data.js'), 'w', encoding='utf-8') as f:
+        f.write(f"// Auto-generated synthetic corpus\n// Posts: {size}\n\nconst allBlogs = [\n")
+        for blog_id in range(1, size + 1):
+            f.write(('' if blog_id == 1 else ',\n') + json.dumps(synthetic_post(rng, vocab, blog_id), ensure_ascii=False))
+        f.write('\n];\n')
+    with open(os.path.join(directory, 'keywords.json'), 'w', encoding='utf-8') as f:
+        json.dump({'queue': [f"{' '.join(rng.sample(TOPICS, 2))} {i}" for i in range(size)]}, f)
+    with open(os.path.join(directory, 'newsletter-subscribers.json'), 'w', encoding='utf-8') as f:
+        json.dump({'subscribers': [{'email': f"student{i}@example.com", 'name': f"Student {i}"}
+                                   for i in range(size)]}, f)
+    with open(os.path.join(directory, 'sent-blogs.json'), 'w', encoding='utf-8') as f:
+        json.dump(list(range(1, size)), f)   # every post but the newest
+
+def copy_site(directory):
+    for name in SITE_FILES:
+        target = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(target) or directory, exist_ok=True)
+        shutil.copyfile(os.path.join(ROOT, name), target)
+    for name in SITE_DIRS:
+        if os.path.isdir(os.path.join(ROOT, name)):
+            shutil.copytree(os.path.join(ROOT, name), os.path.join(directory, name))
+
+# ===== LOCAL STAND-INS =====
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def groq_response(prompt_tokens=1200):
+    """A well-formed generation in the ---TITLE--- / ---CONTENT--- format"""
+    rng = random.Random(time.perf_counter_ns())
+    words = [rng.choice(TOPICS) for _ in range(1600)]
+    body = ''.join(f"<h2>Section {i}</h2><p>{' '.join(words[i * 200:(i + 1) * 200])}</p>" for i in range(8))
+    return f"---TITLE---\nBenchmark Post {rng.randrange(10**9)}\n---CONTENT---\n{body}\n---META---\nBenchmark meta\n---END---"
+
+def make_groq_stub(port=0, chunk_chars=24):
+    """OpenAI-compatible /chat/completions (streamed or not) with canned text"""
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            text = groq_response()
+            chunks = [text[i:i + chunk_chars] for i in range(0, len(text), chunk_chars)]
+            usage = {'prompt_tokens': 1200, 'completion_tokens': len(chunks), 'total_tokens': 1200 + len(chunks)}
+            base = {'id': 'bench', 'created': int(time.time()), 'model': request.get('model', 'stub')}
+            if not request.get('stream'):
+                data = json.dumps(dict(base, object='chat.completion', usage=usage, choices=[
+                    {'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': text}}])).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            for i, chunk in enumerate(chunks):
+                event = dict(base, object='chat.completion.chunk', choices=[
+                    {'index': 0, 'delta': {'content': chunk}, 'finish_reason': None}])
+                if i == len(chunks) - 1:
+                    event['choices'][0]['finish_reason'] = 'stop'
+                    event['x_groq'] = {'usage': usage}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    return server
+
+def start_stubs():
+    """Start every stand-in and point the modules at them; returns the servers to stop"""
+    import email_delivery
+    import image_resolver
+    import notify_queue
+
+    groq = make_groq_stub()
+    brevo = email_delivery.make_fake_server(rate_limit=100000, latency=0.002)
+    for server in (groq, brevo):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    images, indexnow = free_port(), free_port()
+    threading.Thread(target=image_resolver.serve, args=(images,), daemon=True).start()
+    threading.Thread(target=notify_queue.serve, args=(indexnow,), daemon=True).start()
+
+    os.environ.update({
+        'GROQ_API_KEY': 'bench', 'GROQ_BASE_URL': f"http://127.0.0.1:{groq.server_address[1]}",
+        'UNSPLASH_ACCESS_KEY': 'bench', 'PEXELS_API_KEY': 'bench', 'INDEXNOW_API_KEY': 'bench',
+        'UNSUBSCRIBE_SECRET': 'bench',
+    })
+    image_resolver.UNSPLASH_API_URL = image_resolver.PEXELS_API_URL = f"http://127.0.0.1:{images}"
+    notify_queue.INDEXNOW_ENDPOINT = f"http://127.0.0.1:{indexnow}/indexnow"
+    email_delivery.BREVO_API_URL = f"http://127.0.0.1:{brevo.server_address[1]}"
+    time.sleep(0.2)   # let the stub threads bind
+    return [groq, brevo]
+
+def load_script(name, filename):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# ===== MEASUREMENT =====
+def disk_state(directory):
+    state = {}
+    for base, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(base, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            state[path] = (st.st_size, st.st_mtime_ns)
+    return state
+
+def measure(stage, func, directory, results):
+    """Run one stage: wall time (best so far) and bytes written, or peak traced KB when tracemalloc is on"""
+    tracing = tracemalloc.is_tracing()
+    before = None if tracing else disk_state(directory)
+    if tracing:
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    error = None
+    try:
+        value = func()
+    except Exception as e:
+        value, error = None, f"{type(e).__name__}: {e}"
+    ms = (time.perf_counter() - started) * 1000
+    result = results.setdefault(stage, {})
+    if tracing:
+        result['peak_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+    else:
+        after = disk_state(directory)
+        result['ms'] = round(min(ms, result.get('ms', ms)), 1)
+        result['bytes'] = sum(size for path, (size, mtime) in after.items() if before.get(path) != (size, mtime))
+    if error:
+        result['error'] = error
+    return value
+
+def run_size(template, generator, sender, results):
+    """Every stage once, in a fresh copy of the fixture directory"""
+    import blog_store
+    import delivery_ledger
+    import duplicate_index
+    import related_posts
+    import search_index
+
+    directory = tempfile.mkdtemp(prefix='bench-run-')
+    shutil.rmtree(directory)
+    shutil.copytree(template, directory)
+    cwd = os.getcwd()
+    try:
+        os.chdir(directory)
+
+        # Generator: first run migrates the legacy files and builds the indexes
+        manifest = measure('load_blogs (migrate)', generator.load_blogs, directory, results)
+        manifest = measure('load_blogs', generator.load_blogs, directory, results)
+        keywords = generator.load_keywords()
+        measure('get_next_keyword (index build)', lambda: generator.get_next_keyword(keywords), directory, results)
+        keyword = measure('get_next_keyword', lambda: generator.get_next_keyword(keywords), directory, results)
+        measure('make_slug (x corpus)', lambda: [generator.make_slug(b['title']) for b in manifest],
+                directory, results)
+        measure('build indexes (first run)', lambda: (duplicate_index.load_index(), related_posts.load_index(),
+                                                      search_index.load_index(blog_store.load_manifest())),
+                directory, results)
+        client = generator.make_groq_client()   # the SDK import is not part of the stage
+        text = measure('generate_blog (stub Groq)', lambda: generator.generate_blog(keyword, [], client=client),
+                       directory, results)
+        blog_data = generator.parse_response(text or groq_response())
+        used = generator.image_resolver.used_images(manifest)
+        measure('get_relevant_image (stub)', lambda: generator.get_relevant_image(keyword, used), directory, results)
+        measure('save_blog', lambda: generator.save_blog(blog_data, keyword), directory, results)
+        manifest = generator.load_blogs()
+        measure('update_sitemap (unchanged)', lambda: generator.update_sitemap(manifest), directory, results)
+        measure('notify (stub IndexNow)', lambda: generator.notify_search_engines(ping_google=False),
+                directory, results)
+
+        # Sender: the newest post goes out to every subscriber
+        latest = measure('load_latest_blog', sender.load_latest_blog, directory, results)
+        ledger = measure('check_if_sent (ledger load)', delivery_ledger.load_ledger, directory, results)
+        if ledger is not None and latest:
+            measure('check_if_sent', lambda: ledger.is_complete(latest['id']), directory, results)
+        total, subscribers = measure('load_subscribers (import)', sender.load_subscribers, directory, results)
+        if latest and total:
+            ledger.start(latest['id'])
+            measure('send_blog_email (stub Brevo)', lambda: sender.send_blog_email(latest, subscribers, ledger),
+                    directory, results)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+def prepare(size):
+    """Fixture + site directory for one size; returns its path"""
+    directory = tempfile.mkdtemp(prefix=f"bench-{size}-")
+    started = time.perf_counter()
+    write_fixtures(directory, size)
+    copy_site(directory)
+    total = sum(size for size, _ in disk_state(directory).values())
+    print(f"📦 {size:,} posts/keywords/subscribers: {total / 1024 / 1024:.1f} MB of fixtures "
+          f"in {time.perf_counter() - started:.1f}s")
+    return directory
+
+def _quiet(func, *args):
+    """Run with the scripts' per-item status lines silenced"""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w', encoding='utf-8')
+    try:
+        return func(*args)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+# ===== REGRESSIONS =====
+def compare(results, baseline, ratio=REGRESSION_RATIO):
+    """[(size, stage, metric, now, before)] for stages that got worse than the baseline allows"""
+    floors = {'ms': NOISE_FLOOR_MS, 'peak_kb': NOISE_FLOOR_KB, 'bytes': NOISE_FLOOR_BYTES}
+    flagged = []
+    for size, stages in results.get('sizes', {}).items():
+        for stage, now in stages.items():
+            before = baseline.get('sizes', {}).get(size, {}).get(stage)
+            if not before:
+                continue
+            if 'error' in now and 'error' not in before:
+                flagged.append((size, stage, 'error', now['error'], None))
+                continue
+            for metric, floor in floors.items():
+                if metric == 'ms':
+                    floor = max(floor, SHORT_STAGE_MS - before.get('ms', 0))
+                if now.get(metric, 0) > before.get(metric, 0) * ratio and now.get(metric, 0) - before.get(metric, 0) > floor:
+                    flagged.append((size, stage, metric, now[metric], before[metric]))
+    return flagged
+
+def run(sizes=SIZES, results_path=RESULTS_FILE, baseline_path=BASELINE_FILE):
+    """Benchmark every size; returns (results, regressions)"""
+    servers = start_stubs()
+    generator = load_script('blog_generator', 'blog-generator.py')
+    sender = load_script('blog_email_sender', 'blog-email-sender.py')
+    sender.SEND_CONCURRENCY = 4
+
+    results = {'started': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+               'python': sys.version.split()[0], 'sizes': {}}
+    try:
+        for size in sizes:
+            template = prepare(size)
+            stages = {}
+            try:
+                for _ in range(TIMED_RUNS):
+                    _quiet(run_size, template, generator, sender, stages)
+                tracemalloc.start()
+                try:
+                    _quiet(run_size, template, generator, sender, stages)
+                finally:
+                    tracemalloc.stop()
+            finally:
+                shutil.rmtree(template, ignore_errors=True)
+            for stage, r in stages.items():
+                print(f"   {'⚠️' if 'error' in r else '⏱️'} {stage:<30} {r['ms']:>10.1f} ms {r['peak_kb']:>9,} KB peak "
+                      f"{r['bytes'] / 1024:>10,.0f} KB written" + (f"  {r['error']}" if 'error' in r else ''))
+            results['sizes'][str(size)] = stages
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    print(f"💾 Results saved to {results_path}")
+
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except OSError:
+        print(f"ℹ️ No {baseline_path} yet: `python bench_suite.py baseline` stores these results as one")
+        return results, []
+    regressions = compare(results, baseline)
+    for size, stage, metric, now, before in regressions:
+        print(f"❌ Regression at {size}: {stage} {metric} {now} (baseline {before})")
+    if not regressions:
+        print(f"✅ No regressions against {baseline_path} ({REGRESSION_RATIO}x threshold)")
+    return results, regressions
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'run':
+        sizes = [int(s) for s in sys.argv[2].split(',')] if len(sys.argv) > 2 else SIZES
+        _, regressions = run(sizes)
+        sys.exit(1 if regressions else 0)
+    elif command == 'baseline':
+        shutil.copyfile(RESULTS_FILE, BASELINE_FILE)
+        print(f"✅ {RESULTS_FILE} saved as {BASELINE_FILE}")
+    else:
+        print(__doc__)
@@ -1,170 +1,170 @@
-import requests
-import json
-from datetime import datetime
 import os
 
+import blog_loader
+import delivery_ledger
+import email_delivery
+import email_render
+import file_store
+import run_metrics
+import subscriber_store
+
 # ===== CONFIGURATION =====
 BREVO_API_KEY = 'xsmtpsib-c52b1a5897d4fb061380796be4d038b8a805669a60f495eaa7a730cbe70fe992-WtaOMsBPAtQPCnwn'  # You'll get this from Brevo dashboard
 FROM_EMAIL = 'shivansh.assignment365@gmail.com'
 FROM_NAME = 'TurnitinPaperChecker'
-SUBSCRIBERS_FILE = 'newsletter-subscribers.json'
-BLOGS_FILE = 'blogs-data.js'
-SENT_BLOGS_FILE = 'sent-blogs.json'
+SEND_BATCH_SIZE = email_delivery.BATCH_SIZE  # recipients per Brevo request
+SEND_CONCURRENCY = int(os.environ.get('BREVO_CONCURRENCY', email_delivery.CONCURRENCY))
+# Held for a whole send, so a manual run and the daemon never mail the same post twice
+SEND_LOCK = f"{delivery_ledger.LEDGER_FILE}.send"
 
 # ===== LOAD SUBSCRIBERS =====
+@run_metrics.timed
 def load_subscribers():
+    """(active count, lazy iterator of (email, name)) from the subscriber store"""
     try:
-        with open(SUBSCRIBERS_FILE, 'r') as f:
-            data = json.load(f)
-            return data.get('subscribers', [])
-    except:
-        return []
+        conn = subscriber_store.connect()
+        return subscriber_store.count(conn), subscriber_store.iter_active(conn, with_names=True)
+    except Exception as e:
+        print(f"Error loading subscribers: {e}")
+        return 0, iter(())
 
 # ===== LOAD LATEST BLOG =====
+@run_metrics.timed
 def load_latest_blog():
     try:
-        with open(BLOGS_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Extract the allBlogs array
-            start = content.find('const allBlogs = [')
-            end = content.find('];', start) + 2
-            blogs_str = content[start:end]
-            # Remove the const declaration
-            blogs_str = blogs_str.replace('const allBlogs = ', '')
-            # Parse JSON
-            blogs = json.loads(blogs_str)
-            return blogs[0] if blogs else None  # Return most recent blog
+        # Reads only the manifest plus the newest post file
+        return blog_loader.load_latest_blog()
     except Exception as e:
         print(f"Error loading blogs: {e}")
         return None
 
-# ===== CHECK IF BLOG WAS SENT =====
-def check_if_sent(blog_id):
-    try:
-        with open(SENT_BLOGS_FILE, 'r') as f:
-            sent = json.load(f)
-            return blog_id in sent
-    except:
-        return False
-
-# ===== MARK BLOG AS SENT =====
-def mark_as_sent(blog_id):
-    try:
-        with open(SENT_BLOGS_FILE, 'r') as f:
-            sent = json.load(f)
-    except:
-        sent = []
-    
-    sent.append(blog_id)
-    
-    with open(SENT_BLOGS_FILE, 'w') as f:
-        json.dump(sent, f)
-
 # ===== SEND EMAIL VIA BREVO =====
-def send_blog_email(blog, subscribers):
-    if not subscribers:
-        print("No subscribers found.")
-        return
+@run_metrics.timed
+def send_blog_email(blog, subscribers, ledger=None, session=None):
+    """Deliver blog to subscribers; with a ledger, every batch is recorded and
+    recipients it already lists as delivered are skipped. `session` is an
+    optional pooled Brevo session kept open by the caller"""
     
-    # Create HTML email
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-            .header {{ background: linear-gradient(135deg, #0a5d8c 0%, #0a9cfc 100%); color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }}
-            .content {{ background: white; padding: 30px; border: 1px solid #ddd; }}
-            .footer {{ background: #f8f9fa; padding: 20px; text-align: center; border-radius: 0 0 10px 10px; }}
-            .btn {{ background: #0a5d8c; color: white; padding: 15px 30px; text-decoration: none; border-radius: 25px; display: inline-block; margin: 20px 0; }}
-            img {{ max-width: 100%; border-radius: 10px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>📝 New Blog Post from TurnitinPaperChecker!</h1>
-            </div>
-            <div class="content">
-                <h2>{blog['title']}</h2>
-                <p><strong>Published:</strong> {blog['date']} | <strong>Read Time:</strong> {blog['readTime']} minutes</p>
-                <img src="{blog['image']}" alt="{blog['title']}">
-                <p>{blog['excerpt']}</p>
-                <a href="https://www.turnitinpaperchecker.com/blog-post.html?id={blog['id']}" class="btn">Read Full Article →</a>
-            </div>
-            <div class="footer">
-                <p>You're receiving this because you subscribed to TurnitinPaperChecker updates.</p>
-                <p><small>TurnitinPaperChecker | Professional Plagiarism & AI Detection</small></p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    # Prepare recipients
-    to_emails = [{"email": sub} for sub in subscribers]
+    # Unsubscribe tokens are only as good as the secret behind them
+    if not email_render.secret_configured():
+        return False
     
-    # Send via Brevo API
-    url = "https://api.brevo.com/v3/smtp/email"
-    headers = {
-        "api-key": BREVO_API_KEY,
-        "Content-Type": "application/json"
-    }
+    # The body is compiled once and sent once; each recipient only carries params
+    campaign = email_render.CampaignEmail(blog)
     
+    # One shared message, one messageVersion per subscriber: nobody sees the
+    # other addresses and a failed request only affects its own batch
     payload = {
         "sender": {
             "name": FROM_NAME,
             "email": FROM_EMAIL
         },
-        "to": to_emails,
         "subject": f"📚 New Post: {blog['title']}",
-        "htmlContent": html_content
+        "htmlContent": campaign.html,
+        "textContent": campaign.text
     }
     
+    first_batch = 1
+    on_batch = None
+    if ledger:
+        subscribers = ledger.pending(blog['id'], subscribers)
+        first_batch = ledger.last_batch(blog['id']) + 1
+        on_batch = lambda result, batch: ledger.record_batch(
+            blog['id'], result['batch'], [email for email, _ in batch], result['ok'], result['error'])
+    
+    engine = email_delivery.DeliveryEngine(BREVO_API_KEY, concurrency=SEND_CONCURRENCY, session=session)
     try:
-        response = requests.post(url, headers=headers, json=payload)
-        if response.status_code == 201:
-            print(f"✅ Email sent successfully to {len(subscribers)} subscribers!")
-            return True
-        else:
-            print(f"❌ Error: {response.status_code} - {response.text}")
-            return False
+        with run_metrics.span('brevo'):
+            report = engine.deliver(payload, subscribers, make_version=campaign.message_version,
+                                    batch_size=SEND_BATCH_SIZE,
+                                    on_batch=on_batch, first_batch=first_batch)
     except Exception as e:
         print(f"❌ Error sending email: {e}")
         return False
+    finally:
+        engine.close()
+    
+    email_delivery.print_report(report)
+    record_delivery(report)
+    if ledger and not report['failed']:
+        ledger.complete(blog['id'])
+    if report['failed']:
+        print(f"❌ {report['failed']} recipients were not delivered")
+        return False
+    print(f"✅ Email sent successfully to {report['sent']} subscribers!")
+    return True
+
+def record_delivery(report):
+    """Delivery report -> run metrics counters"""
+    run_metrics.count('brevo.sent', report['sent'])
+    run_metrics.count('brevo.failed', report['failed'])
+    run_metrics.count('brevo.requests', sum(b['attempts'] for b in report['batches']))
+    run_metrics.count('brevo.retries', sum(b['attempts'] - 1 for b in report['batches']))
+    run_metrics.note('brevo_latency_p95_ms', report['latency_p95_ms'])
 
 # ===== MAIN FUNCTION =====
 def main():
+    """Send the latest post; the run's timings and counters go to run-history.jsonl"""
+    run_metrics.start('blog-email-sender')
+    status = 'error'
+    try:
+        status = send_latest()
+    finally:
+        run_metrics.finish(status)
+
+def send_latest(session=None):
+    """Deliver the newest post to everyone not yet sent it; returns the run status"""
     print("🚀 Starting blog email sender...")
+    try:
+        with file_store.lock(SEND_LOCK, blocking=False):
+            return _send_latest(session)
+    except file_store.LockBusy:
+        print("⏳ Another sender is running; leaving this post to it")
+        return 'busy'
+
+def _send_latest(session):
+    
+    if not email_render.secret_configured():
+        return 'no secret'
     
     # Load latest blog
     latest_blog = load_latest_blog()
     if not latest_blog:
-        print("❌ No blogs found in blogs-data.js")
-        return
+        print("❌ No blogs found in the blog store")
+        return 'no posts'
+    run_metrics.note('blog_id', latest_blog['id'])
     
     print(f"📝 Latest blog: {latest_blog['title']}")
     
     # Check if already sent
-    if check_if_sent(latest_blog['id']):
+    ledger = delivery_ledger.load_ledger()
+    if ledger.is_complete(latest_blog['id']):
         print(f"✅ Blog {latest_blog['id']} already sent. Skipping.")
-        return
+        return 'already sent'
     
     # Load subscribers
-    subscribers = load_subscribers()
-    if not subscribers:
-        print("❌ No subscribers found in newsletter-subscribers.json")
-        return
+    total, subscribers = load_subscribers()
+    if not total:
+        print("❌ No active subscribers in the subscriber store")
+        return 'no subscribers'
     
-    print(f"👥 Found {len(subscribers)} subscribers")
+    print(f"👥 Found {total} subscribers")
+    
+    # Resume an interrupted campaign instead of starting over
+    if ledger.in_progress(latest_blog['id']):
+        print(f"⏯️ Resuming blog {latest_blog['id']} after batch {ledger.last_batch(latest_blog['id'])} "
+              f"({len(ledger.campaigns[latest_blog['id']]['delivered'])} already delivered)")
+    else:
+        ledger.start(latest_blog['id'])
     
     # Send email
-    if send_blog_email(latest_blog, subscribers):
-        mark_as_sent(latest_blog['id'])
-        print(f"✅ Successfully sent blog {latest_blog['id']} to {len(subscribers)} subscribers!")
+    ok = send_blog_email(latest_blog, subscribers, ledger, session)
+    if ok:
+        print(f"✅ Successfully sent blog {latest_blog['id']} to {total} subscribers!")
     else:
-        print("❌ Failed to send emails")
+        print("❌ Failed to send emails; run again to retry the undelivered batches")
+    ledger.maybe_compact()
+    return 'ok' if ok else 'failed'
 
 if __name__ == '__main__':
     main()
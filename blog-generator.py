@@ -8,16 +8,43 @@ With 5 different templates, varied structures, and creative content
 import os
 import json
 import re
-import requests
+import time
+import argparse
+import threading
 import random
 from datetime import datetime
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import asset_build
+import blog_loader
+import blog_store
+import duplicate_index
+import file_store
+import image_resolver
+import keyword_index
+import notify_queue
+import page_build
+import post_analysis
+import post_renderer
+import related_posts
+import search_index
+import response_cache
+import run_metrics
+import sitemap_builder
+from response_stream import SectionStreamParser, StreamAbort
 
 # ===== CONFIGURATION =====
 WEBSITE_URL = "https://www.turnitinpaperchecker.com/"
 WEBSITE_HOST = "www.turnitinpaperchecker.com"
+# The three backlinks every prompt asks for (checked by post_analysis.py)
+BACKLINKS = [WEBSITE_URL, f"{WEBSITE_URL}#services", f"{WEBSITE_URL}#pricing"]
 EMAIL = "shivansh.assignment365@gmail.com"
 WHATSAPP = "+91-8168706565"
+DEFAULT_CONCURRENCY = 3  # parallel Groq requests in --count batch mode
+DUPLICATE_RETRIES = 2  # regenerations allowed when a post is a near-duplicate
+DUPLICATE_SEED_STEP = 1000
+NOTIFY_FLUSH_BUDGET = 30  # seconds the run waits for IndexNow/Google before moving on
+OFFLINE = False  # set by --replay: serve Groq/image lookups from the response cache only
 
 # ===== BLOG TEMPLATES =====
 TEMPLATES = [
@@ -94,18 +121,12 @@ NUMBERS = ["5", "7", "10", "12", "15"]
 UNIVERSITIES = ["Delhi University", "JNU", "IIT Delhi", "IIT Bombay", "Mumbai University", "Pune University"]
 
 # ===== LOAD FUNCTIONS =====
+@run_metrics.timed
 def load_blogs():
-    """Load existing blogs"""
-    try:
-        with open('blogs-data.js', 'r', encoding='utf-8') as f:
-            content = f.read()
-            match = re.search(r'const allBlogs = (\[.*?\]);', content, re.DOTALL)
-            if match:
-                return json.loads(match.group(1))
-    except Exception as e:
-        print(f"⚠️ Error loading blogs: {e}")
-    return []
+    """Load existing blogs (manifest entries, no post bodies)"""
+    return blog_loader.load_index()
 
+@run_metrics.timed
 def load_keywords():
     """Load keywords"""
     try:
@@ -120,101 +141,41 @@ def load_keywords():
             "AI content detection students"
         ]
 
-def get_next_keyword(blogs, keywords):
-    """Get unused keyword"""
-    used = set()
-    for blog in blogs:
-        title = blog.get('title', '').lower()
-        for kw in keywords:
-            if kw.lower() in title:
-                used.add(kw)
-    
-    for kw in keywords:
-        if kw not in used:
-            return kw
-    
-    return random.choice(keywords)
+def get_next_keyword(keywords):
+    """Get least recently used keyword from the keyword index"""
+    picked = get_next_keywords(keywords, 1)
+    return picked[0] if picked else None
 
-# ===== IMAGE FUNCTIONS =====
-def get_image_from_unsplash(keyword):
-    """Fetch from Unsplash"""
-    api_key = os.environ.get('UNSPLASH_ACCESS_KEY')
-    if not api_key:
-        return None
-    
-    try:
-        search_terms = ' '.join(keyword.split()[:3] + ['student', 'education'])
-        print(f"🔍 Searching Unsplash: {search_terms}")
-        
-        response = requests.get(
-            "https://api.unsplash.com/search/photos",
-            headers={"Authorization": f"Client-ID {api_key}"},
-            params={"query": search_terms, "per_page": 5, "orientation": "landscape"},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('results'):
-                return data['results'][0]['urls']['regular']
-    except Exception as e:
-        print(f"⚠️ Unsplash error: {e}")
-    
-    return None
+@run_metrics.timed
+def get_next_keywords(keywords, count):
+    """Get `count` distinct keywords in least-recently-used order"""
+    index = keyword_index.load_index(keywords)
+    return keyword_index.pick_keywords(keywords, index, count, keyword_index.load_weights())
 
-def get_image_from_pexels(keyword):
-    """Fetch from Pexels"""
-    api_key = os.environ.get('PEXELS_API_KEY')
-    if not api_key:
-        return None
-    
-    try:
-        search_terms = ' '.join(keyword.split()[:3] + ['student'])
-        print(f"🔍 Searching Pexels: {search_terms}")
-        
-        response = requests.get(
-            "https://api.pexels.com/v1/search",
-            headers={"Authorization": api_key},
-            params={"query": search_terms, "per_page": 5, "orientation": "landscape"},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('photos'):
-                return data['photos'][0]['src']['large']
-    except Exception as e:
-        print(f"⚠️ Pexels error: {e}")
-    
-    return None
-
-def get_relevant_image(keyword):
-    """Get image with fallback"""
-    image = get_image_from_unsplash(keyword)
-    if image:
-        return image
-    
-    print("📸 Trying Pexels...")
-    image = get_image_from_pexels(keyword)
-    if image:
-        return image
-    
-    print("📸 Using default")
-    return "https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8?w=800"
+# ===== IMAGE FUNCTIONS =====
+@run_metrics.timed
+def get_relevant_image(keyword, used=None):
+    """Hero image not used by any other post (providers raced, results cached)"""
+    return image_resolver.resolve(keyword, used, offline=OFFLINE)
 
 # ===== RANDOMIZED PROMPT GENERATION =====
-def create_randomized_prompt(keyword, existing_titles):
-    """Create completely randomized, unique prompt"""
+def create_randomized_prompt(keyword, existing_titles, rng=random, expect=None):
+    """Create completely randomized, unique prompt (rng seeded for --seed/--replay)
+
+    expect: a dict to fill with the sections and links the prompt asks for
+    """
     
     # Select random template
-    template = random.choice(TEMPLATES)
+    template = rng.choice(TEMPLATES)
     
     # Generate random backlink positions
     total_sections = len(template['sections'])
-    backlink_positions = random.sample(range(2, total_sections - 1), min(3, total_sections - 3))
+    # Short templates (Listicle) don't have 3 middle sections to choose from
+    positions = range(2, total_sections - 1) if total_sections >= 6 else range(1, total_sections + 1)
+    backlink_positions = rng.sample(positions, 3)
     
     # Create unique structure instructions
-    structure_variation = random.choice([
+    structure_variation = rng.choice([
         "Use short paragraphs (2-3 sentences each)",
         "Include bullet points in 2-3 sections",
         "Add numbered lists where appropriate",
@@ -222,7 +183,7 @@ def create_randomized_prompt(keyword, existing_titles):
     ])
     
     # Random university mentions
-    unis = random.sample(UNIVERSITIES, 2)
+    unis = rng.sample(UNIVERSITIES, 2)
     
     prompt = f"""Write a comprehensive, UNIQUE blog post for TurnitinPaperChecker.
 
@@ -261,9 +222,9 @@ CRITICAL REQUIREMENTS:
 - NO generic phrases like "In today's digital age"
 
 BACKLINK PLACEMENT (must include ALL 3 naturally):
-- Section {backlink_positions[0]}: Link to <a href="{WEBSITE_URL}">TurnitinPaperChecker</a>
-- Section {backlink_positions[1]}: Link to <a href="{WEBSITE_URL}#services">plagiarism detection services</a>
-- Section {backlink_positions[2]}: Link to <a href="{WEBSITE_URL}#pricing">affordable pricing at Rs 200</a>
+- Section {backlink_positions[0]}: Link to <a href="{BACKLINKS[0]}">TurnitinPaperChecker</a>
+- Section {backlink_positions[1]}: Link to <a href="{BACKLINKS[1]}">plagiarism detection services</a>
+- Section {backlink_positions[2]}: Link to <a href="{BACKLINKS[2]}">affordable pricing at Rs 200</a>
 
 WRITING STYLE:
 - Conversational yet professional
@@ -293,37 +254,205 @@ FORMAT OUTPUT EXACTLY:
 
 ---END---"""
 
+    if expect is not None:
+        expect.update(sections=template['sections'][:8], links=BACKLINKS)
     return prompt
 
 # ===== GROQ AI GENERATION =====
-def generate_blog(keyword, existing_titles):
-    """Generate with randomized prompt"""
+GROQ_MODEL = "llama-3.3-70b-versatile"
+GROQ_TEMPERATURE = 0.9
+GROQ_MAX_RETRIES = 4
+GROQ_BACKOFF_SECONDS = 2
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+GROQ_STREAM = os.environ.get('GROQ_STREAM', '1') != '0'  # parse sections while tokens arrive
+
+def make_groq_client():
+    """Groq client; GROQ_BASE_URL points it at a local stub for testing"""
     api_key = os.environ.get('GROQ_API_KEY')
     if not api_key:
         print("❌ GROQ_API_KEY not found")
         return None
+    from groq import Groq   # imported on first use: ~250 ms the offline paths never need
+    # Retries are handled in generate_blog so batch workers share one policy
+    return Groq(api_key=api_key, base_url=os.environ.get('GROQ_BASE_URL') or None, max_retries=0)
+
+def _retry_delay(error, attempt):
+    """Honour Retry-After when the API sends one, else exponential backoff"""
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return GROQ_BACKOFF_SECONDS * (2 ** attempt) + random.uniform(0, 1)
+
+@run_metrics.timed
+def generate_blog(keyword, existing_titles, client=None, seed=None, expect=None):
+    """Generate with randomized prompt (expect: see create_randomized_prompt)"""
+    rng = random.Random(f"{seed}:{keyword}") if seed is not None else random
+    prompt = create_randomized_prompt(keyword, existing_titles, rng, expect)
+    
+    cache_key = response_cache.llm_key(prompt, GROQ_MODEL, GROQ_TEMPERATURE, seed)
+    cached = response_cache.get(cache_key, response_cache.LLM_TTL)
+    if cached:
+        print(f"💾 Cached response for: {keyword}")
+        run_metrics.count('groq.cache_hits')
+        return cached
+    if OFFLINE:
+        print(f"❌ No cached response for '{keyword}' (offline replay)")
+        return None
     
-    client = Groq(api_key=api_key)
-    prompt = create_randomized_prompt(keyword, existing_titles)
+    client = client or make_groq_client()
+    if not client:
+        return None
     
     print(f"🤖 Generating UNIQUE blog for: {keyword}")
     
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        try:
+            response = client.chat.completions.create(
+                model=GROQ_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are an expert SEO blogger who creates UNIQUE, engaging content. Never use templates - every post must be completely different in structure and style."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=GROQ_TEMPERATURE,  # Higher for more creativity
+                max_tokens=5000,
+                # Vary the sampling seed on retries so an aborted output isn't reproduced
+                seed=None if seed is None else seed + attempt,
+                stream=GROQ_STREAM
+            )
+            
+            if GROQ_STREAM:
+                text = consume_stream(response, keyword)
+            else:
+                text = response.choices[0].message.content
+                count_usage(getattr(response, 'usage', None))
+            run_metrics.count('groq.requests')
+            
+            response_cache.put(cache_key, text, keyword=keyword, model=GROQ_MODEL, seed=seed)
+            return text
+        
+        except StreamAbort as e:
+            if attempt == GROQ_MAX_RETRIES:
+                print(f"❌ Malformed response for '{keyword}': {e}")
+                return None
+            print(f"♻️ Aborted malformed response for '{keyword}' ({e}), regenerating")
+            run_metrics.count('groq.aborted')
+            continue
+        
+        except Exception as e:
+            status = getattr(e, 'status_code', None)
+            retryable = status in RETRYABLE_STATUS or (status is None and 'connection' in type(e).__name__.lower())
+            if not retryable or attempt == GROQ_MAX_RETRIES:
+                print(f"❌ Groq error: {e}")
+                return None
+            delay = _retry_delay(e, attempt)
+            print(f"⏳ Groq {status or 'connection'} error for '{keyword}', retrying in {delay:.1f}s")
+            run_metrics.count('groq.retries')
+            time.sleep(delay)
+    return None
+
+def count_usage(usage):
+    """Add a completion's token usage to the run metrics"""
+    if usage is not None:
+        run_metrics.count('groq.prompt_tokens', getattr(usage, 'prompt_tokens', 0) or 0)
+        run_metrics.count('groq.completion_tokens', getattr(usage, 'completion_tokens', 0) or 0)
+
+def consume_stream(stream, keyword):
+    """Parse sections as tokens arrive; abort early on a malformed response"""
+    parser = SectionStreamParser()
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {"role": "system", "content": "You are an expert SEO blogger who creates UNIQUE, engaging content. Never use templates - every post must be completely different in structure and style."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.9,  # Higher for more creativity
-            max_tokens=5000
-        )
+        for chunk in stream:
+            if chunk.choices:
+                parser.feed(chunk.choices[0].delta.content)
+            # Groq reports usage on the final chunk (x_groq.usage)
+            extra = getattr(chunk, 'x_groq', None)
+            count_usage(getattr(extra, 'usage', None) or getattr(chunk, 'usage', None))
+        text = parser.finish()
+    finally:
+        # Stop the server-side generation when we bail out early
+        close = getattr(stream, 'close', None)
+        if close:
+            close()
+    print(f"⏱️ {keyword}: {parser.timing_report()}")
+    return text
+
+@run_metrics.timed
+def generate_batch(keywords, existing_titles, concurrency=DEFAULT_CONCURRENCY, seed=None,
+                   threshold=duplicate_index.DEFAULT_THRESHOLD, client=None, seeds=None):
+    """Generate one post per keyword with a bounded thread pool
+
+    Each result is checked against the near-duplicate index (and the rest
+    of the batch); a post above `threshold` is regenerated with a new seed.
+    Accepted posts are analysed once (post_analysis.py); missing sections
+    or backlinks are reported, and the analysis is kept for build_blog.
+    A long-lived `client` (blog_daemon.py) keeps its connections warm.
+    `seeds` maps keyword -> seed to start from (a replay) and is updated
+    with the seed of each accepted post.
+    """
+    client = None if OFFLINE else client or make_groq_client()
+    if not client and not OFFLINE:
+        return []
+    
+    # A replay re-runs posts that already passed (and may already be indexed)
+    dup_index = None if OFFLINE else duplicate_index.load_index()
+    
+    seeds = {} if seeds is None else seeds
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        pending = {}
+        def submit(keyword, retry, seed):
+            expect = {}
+            pending[pool.submit(generate_blog, keyword, existing_titles, client, seed, expect)] = (keyword, retry, seed, expect)
         
-        return response.choices[0].message.content
-    
-    except Exception as e:
-        print(f"❌ Groq error: {e}")
-        return None
+        for kw in keywords:
+            submit(kw, 0, seeds.get(kw, seed))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                keyword, retry, used_seed, expect = pending.pop(future)
+                try:
+                    ai_response = future.result()
+                except Exception as e:
+                    print(f"❌ Generation error for '{keyword}': {e}")
+                    continue
+                if not ai_response:
+                    print(f"❌ Generation failed: {keyword}")
+                    continue
+                blog_data = parse_response(ai_response)
+                if not all(k in blog_data for k in ['title', 'content']):
+                    print(f"❌ Invalid response: {keyword}")
+                    continue
+                
+                matches = dup_index.query(blog_data['content'], threshold) if dup_index else []
+                if matches:
+                    match_id, score = matches[0]
+                    if retry < DUPLICATE_RETRIES:
+                        print(f"♻️ '{keyword}' is {score:.0%} similar to #{match_id}, regenerating")
+                        run_metrics.count('posts.regenerated')
+                        retry_seed = None if used_seed is None else used_seed + DUPLICATE_SEED_STEP
+                        submit(keyword, retry + 1, retry_seed)
+                    else:
+                        print(f"❌ Rejected '{keyword}': {score:.0%} similar to #{match_id}")
+                        run_metrics.count('posts.rejected')
+                    continue
+                if dup_index:
+                    # Keep later posts in this batch from duplicating this one
+                    dup_index.add(f"batch:{keyword}", blog_data['content'], persist=False)
+                
+                analysis = post_analysis.analyse(blog_data['content'], **expect)
+                if analysis['errors']:
+                    print(f"⚠️ '{keyword}': {'; '.join(analysis['errors'])}")
+                    run_metrics.count('posts.invalid')
+                blog_data['analysis'] = analysis
+                print(f"📝 Title: {blog_data['title']} ({analysis['words']} words, {len(analysis['outline'])} headings)")
+                seeds[keyword] = used_seed
+                results.append((blog_data, keyword))
+    
+    # Keep ids in keyword-priority order regardless of completion order
+    order = {kw: i for i, kw in enumerate(keywords)}
+    results.sort(key=lambda item: order[item[1]])
+    return results
 
 # ===== PARSING =====
 def parse_response(text):
@@ -351,55 +480,97 @@ def make_slug(title):
     slug = re.sub(r'\s+', '-', slug)
     return slug.strip('-')[:60]
 
+# ===== STATIC PAGES & INDEXES =====
+@run_metrics.timed
+def update_related(new_blogs, manifest):
+    """Index new posts for related posts; returns {id: cards} for them and their neighbours"""
+    try:
+        with file_store.lock(related_posts.INDEX_FILE):
+            index = related_posts.load_index()
+            touched = index.add_posts(new_blogs)
+            index.save()
+        manifest = blog_store.fresh(manifest)
+        ids = [b['id'] for b in new_blogs] + sorted(touched)
+        print(f"✅ Related posts: {len(new_blogs)} new, {len(touched)} neighbour list(s) updated")
+        return post_renderer.related_map(manifest, ids, index)
+    except Exception as e:
+        print(f"⚠️ Related posts error: {e}")
+        return {}
+
+@run_metrics.timed
+def update_search_index(new_blogs, manifest):
+    """Add new posts to blog.html's search index (touched shards + card chunk only)"""
+    try:
+        with file_store.lock(search_index.SEARCH_DIR):
+            index = search_index.load_index(blog_store.fresh(manifest))
+            index.add_posts(new_blogs)
+            index.save()
+        print(f"✅ Search index: {len(index.ids)} posts")
+    except Exception as e:
+        print(f"⚠️ Search index error: {e}")
+
+@run_metrics.timed
+def render_pages(blogs, related=None):
+    """Pre-render articles/<slug>-<id>.html for new or changed posts"""
+    try:
+        # Neighbours whose related list changed are re-rendered too
+        new_ids = {b['id'] for b in blogs}
+        blogs = list(blogs) + [blog_store.load_post(i) for i in (related or {}) if i not in new_ids]
+        written = post_renderer.render_posts(blogs, related)
+        run_metrics.count_files('bytes.pages', written)
+        print(f"✅ Static pages: {len(written)} rendered")
+        return written
+    except Exception as e:
+        print(f"⚠️ Static page error: {e}")
+        return []
+
+@run_metrics.timed
+def build_assets(manifest):
+    """Refresh the homepage's latest posts, rebuild index.html and changed assets, refresh sw.js"""
+    try:
+        with file_store.lock(asset_build.MANIFEST_FILE):
+            page_build.write_latest(blog_store.fresh(manifest))
+            written = asset_build.build()
+        run_metrics.count_files('bytes.assets', written)
+        print(f"✅ Assets: {len(written)} file(s) updated")
+        return written
+    except Exception as e:
+        print(f"⚠️ Asset build error: {e}")
+        return []
+
 # ===== SITEMAP & INDEXING =====
+@run_metrics.timed
 def update_sitemap(blogs):
-    """Update sitemap.xml"""
+    """Update sitemap.xml with the static post URLs (only changed shards are rewritten)
+
+    Built from the current manifest under the sitemap lock, so a publish that
+    overlaps another cannot write a sitemap missing the other's posts.
+    """
     try:
-        sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        
-        sitemap += '  <url>\n'
-        sitemap += f'    <loc>{WEBSITE_URL}</loc>\n'
-        sitemap += f'    <lastmod>{datetime.now().strftime("%Y-%m-%d")}</lastmod>\n'
-        sitemap += '    <changefreq>daily</changefreq>\n'
-        sitemap += '    <priority>1.0</priority>\n'
-        sitemap += '  </url>\n'
-        
-        sitemap += '  <url>\n'
-        sitemap += f'    <loc>{WEBSITE_URL}blog.html</loc>\n'
-        sitemap += f'    <lastmod>{datetime.now().strftime("%Y-%m-%d")}</lastmod>\n'
-        sitemap += '    <changefreq>daily</changefreq>\n'
-        sitemap += '    <priority>0.9</priority>\n'
-        sitemap += '  </url>\n'
-        
-        for blog in blogs:
-            try:
-                blog_date = datetime.strptime(blog['date'], '%B %d, %Y').strftime('%Y-%m-%d')
-            except:
-                blog_date = datetime.now().strftime('%Y-%m-%d')
-            
-            sitemap += '  <url>\n'
-            sitemap += f'    <loc>{WEBSITE_URL}blog-post.html?id={blog["id"]}</loc>\n'
-            sitemap += f'    <lastmod>{blog_date}</lastmod>\n'
-            sitemap += '    <changefreq>monthly</changefreq>\n'
-            sitemap += '    <priority>0.8</priority>\n'
-            sitemap += '  </url>\n'
-        
-        sitemap += '</urlset>'
-        
-        with open('sitemap.xml', 'w', encoding='utf-8') as f:
-            f.write(sitemap)
-        
-        print(f"✅ Sitemap updated: {len(blogs)} posts")
-        return True
+        with file_store.lock(sitemap_builder.STATE_FILE):
+            blogs = blog_store.fresh(blogs)
+            changed = sitemap_builder.build(blogs, WEBSITE_URL, post_url=post_renderer.post_url)
+        run_metrics.count_files('bytes.sitemap', changed)
+        if changed:
+            print(f"✅ Sitemap updated: {len(blogs)} posts ({', '.join(changed)})")
+        else:
+            print(f"✅ Sitemap unchanged: {len(blogs)} posts")
+        return changed
     except Exception as e:
         print(f"⚠️ Sitemap error: {e}")
-        return False
+        return None
 
-def ping_google_sitemap():
+@run_metrics.timed
+def ping_google_sitemap(session=None):
     """Ping Google"""
+    if OFFLINE:
+        print("⏭️ Offline replay: skipping Google ping")
+        return False
     try:
-        response = requests.get(
+        if session is None:
+            import requests
+            session = requests
+        response = session.get(
             f"https://www.google.com/ping?sitemap={WEBSITE_URL}sitemap.xml",
             timeout=10
         )
@@ -410,118 +581,209 @@ def ping_google_sitemap():
         print(f"⚠️ Google ping error: {e}")
     return False
 
-def notify_indexnow(blog_url):
-    """Notify IndexNow"""
-    api_key = os.environ.get('INDEXNOW_API_KEY')
-    if not api_key:
-        return False
-    
+def queue_notifications(urls):
+    """Queue changed URLs for IndexNow; they are sent by notify_search_engines()"""
+    if OFFLINE or not urls:
+        return
     try:
-        payload = {
-            "host": WEBSITE_HOST,
-            "key": api_key,
-            "keyLocation": f"{WEBSITE_URL}{api_key}.txt",
-            "urlList": [blog_url]
-        }
-        
-        print(f"📡 IndexNow: {blog_url}")
-        
-        response = requests.post(
-            "https://api.indexnow.org/indexnow",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            print("✅ IndexNow sent")
-            return True
+        queued = notify_queue.enqueue(urls)
+        print(f"📥 Queued {len(urls)} URL(s) for IndexNow ({queued} pending)")
     except Exception as e:
-        print(f"⚠️ IndexNow error: {e}")
-    return False
+        print(f"⚠️ Notification queue error: {e}")
+
+@run_metrics.timed
+def notify_search_engines(ping_google=True, budget=NOTIFY_FLUSH_BUDGET):
+    """Flush the IndexNow queue (and ping Google) without holding up publishing
+
+    Runs in a daemon thread for at most `budget` seconds; anything not
+    confirmed sent stays in notify-queue.json for the next run.
+    """
+    if OFFLINE:
+        print("⏭️ Offline replay: skipping search engine notifications")
+        return
+
+    def run():
+        try:
+            with run_metrics.span('indexnow'):
+                sent, left = notify_queue.flush()
+            run_metrics.count('indexnow.sent', sent)
+            if sent or left:
+                print(f"📡 IndexNow: {sent} sent, {left} still queued")
+        except Exception as e:
+            print(f"⚠️ IndexNow error: {e}")
+        if ping_google:
+            ping_google_sitemap()
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(budget)
+    if worker.is_alive():
+        print(f"⏳ Search engines still busy after {budget}s; the queue will retry next run")
 
 # ===== SAVE BLOG =====
-def save_blog(blog_data, keyword):
-    """Save blog"""
-    blogs = load_blogs()
-    new_id = max([b.get('id', 0) for b in blogs], default=0) + 1
+def build_blog(blog_data, keyword, new_id, used_images=None):
+    """Assemble the stored post record (new_id None: the store assigns one)"""
+    image_url = get_relevant_image(keyword, used_images)
+    analysis = blog_data.get('analysis') or post_analysis.analyse(blog_data['content'])
     
-    image_url = get_relevant_image(keyword)
-    
-    new_blog = {
+    return {
         'id': new_id,
         'title': blog_data['title'],
         'slug': make_slug(blog_data['title']),
         'content': blog_data['content'],
-        'excerpt': blog_data['content'][:200].replace('<h2>', '').replace('</h2>', '').replace('<p>', '').replace('</p>', '').strip() + '...',
+        'excerpt': analysis['excerpt'],
         'image': image_url,
         'meta': blog_data.get('meta', ''),
         'date': datetime.now().strftime('%B %d, %Y'),
         'author': 'TurnitinPaperChecker Team',
-        'readTime': max(3, len(blog_data['content'].split()) // 200)
+        'readTime': analysis['read_time'],
+        'keyword': keyword
     }
-    
-    blogs.append(new_blog)
-    
-    js_content = f"""// Auto-generated blog data
-// Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-const allBlogs = {json.dumps(blogs, indent=2, ensure_ascii=False)};
-"""
-    
-    with open('blogs-data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
-    
-    print(f"✅ Blog #{new_id} saved: {blog_data['title']}")
-    
-    update_sitemap(blogs)
-    ping_google_sitemap()
-    
-    blog_url = f"{WEBSITE_URL}blog-post.html?id={new_id}"
-    notify_indexnow(blog_url)
-    
-    return new_id
+@run_metrics.timed
+def save_blogs(items, reuse_slugs=False, blogs=None):
+    """Save a batch of (blog_data, keyword): one store write, one sitemap, one queue write
+
+    reuse_slugs: overwrite a post with the same slug instead of adding a
+    new id, so replaying a half-finished run does not duplicate posts.
+    blogs: the manifest the caller already loaded (read again if omitted).
+    """
+    if not items:
+        return []
+    
+    blogs = blogs if blogs is not None else load_blogs()
+    existing = {b.get('slug'): b['id'] for b in blogs} if reuse_slugs else {}
+    # A post being overwritten may keep its own image
+    replaced = {existing.get(make_slug(blog_data['title'])) for blog_data, _ in items}
+    used_images = image_resolver.used_images(b for b in blogs if b['id'] not in replaced)
+    
+    # New posts get their ids from the store, under its lock
+    new_blogs = [build_blog(blog_data, keyword, existing.get(make_slug(blog_data['title'])), used_images)
+                 for blog_data, keyword in items]
+    
+    with run_metrics.span('store'):
+        blogs = blog_store.append_posts(new_blogs, blogs)
+    run_metrics.count_files('bytes.store', [blog_store.post_path(b['id']) for b in new_blogs] +
+                            [blog_store.MANIFEST_FILE, blog_store.LEGACY_FILE])
+    keyword_index.record_uses([(b['keyword'], b['id']) for b in new_blogs])
+    dup_index = duplicate_index.load_index()
+    for blog in new_blogs:
+        dup_index.add(blog['id'], blog['content'])
+    
+    for blog in new_blogs:
+        print(f"✅ Blog #{blog['id']} saved: {blog['title']}")
+    
+    update_search_index(new_blogs, blogs)
+    render_pages(new_blogs, update_related(new_blogs, blogs))
+    changed = update_sitemap(blogs) or []
+    build_assets(blogs)
+    queue_notifications([post_renderer.post_url(WEBSITE_URL, b) for b in new_blogs] +
+                        [f"{WEBSITE_URL}{path}" for path in changed if os.path.exists(path)])
+    
+    return [b['id'] for b in new_blogs]
+
+def save_blog(blog_data, keyword):
+    """Save blog"""
+    return save_blogs([(blog_data, keyword)])[0]
 
 # ===== MAIN =====
-def main():
-    """Main execution"""
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate and publish blog posts")
+    parser.add_argument('--count', type=int, default=1,
+                        help="number of posts to generate in this run (default: 1)")
+    parser.add_argument('--concurrency', type=int,
+                        default=int(os.environ.get('BLOG_CONCURRENCY', DEFAULT_CONCURRENCY)),
+                        help=f"parallel Groq requests (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--seed', type=int,
+                        help="seed prompt randomisation and Groq sampling (reproducible, cacheable runs)")
+    parser.add_argument('--similarity-threshold', type=float, default=duplicate_index.DEFAULT_THRESHOLD,
+                        help="regenerate posts at least this similar to an existing one (default: %(default)s)")
+    parser.add_argument('--replay', action='store_true',
+                        help="re-run the last run offline from the response cache")
+    parser.add_argument('--profile', choices=run_metrics.PROFILE_MODES,
+                        help="add a cProfile or tracemalloc summary to the run report")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main execution; the run's timings and counters go to run-history.jsonl"""
+    args = parse_args(argv)
+    run_metrics.start('blog-generator', profile=args.profile, count=args.count, replay=args.replay)
+    status = 'error'
+    try:
+        status = publish(args)
+    finally:
+        run_metrics.finish(status)
+
+def publish(args, client=None, notify=True):
+    """Generate and publish; returns the run status
+
+    notify=False leaves the queued IndexNow URLs for the caller to flush.
+    """
+    global OFFLINE
+    blogs = None
     print("="*60)
     print("🚀 ENHANCED RANDOMIZED BLOG GENERATOR")
     print("="*60)
     
-    blogs = load_blogs()
-    print(f"📚 Existing: {len(blogs)} blogs")
-    
-    keywords = load_keywords()
-    print(f"🔑 Keywords: {len(keywords)}")
-    
-    keyword = get_next_keyword(blogs, keywords)
-    print(f"🎯 Target: {keyword}")
+    if args.replay:
+        run = response_cache.load_last_run()
+        if not run:
+            print("❌ Nothing to replay: no previous run recorded")
+            return 'nothing to replay'
+        OFFLINE = True
+        seed, targets, existing_titles = run['seed'], run['keywords'], run['titles']
+        # Replay what the run published: a regenerated post's own seed, and
+        # nothing for keywords it rejected (journals before 'seeds' replay all)
+        seeds = run.get('seeds')
+        if seeds is not None:
+            targets = [kw for kw in targets if kw in seeds]
+        print(f"⏪ Replaying run from {run['started']} offline (seed {seed})")
+    else:
+        blogs = load_blogs()
+        print(f"📚 Existing: {len(blogs)} blogs")
+        
+        keywords = load_keywords()
+        print(f"🔑 Keywords: {len(keywords)}")
+        
+        targets = get_next_keywords(keywords, args.count)
+        seed = args.seed if args.seed is not None else random.randrange(2**31)
+        # Only the last 10 titles reach the prompt, so that is all a replay needs
+        existing_titles = [b['title'] for b in blogs][-10:]
+        run = {
+            'started': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'seed': seed,
+            'keywords': targets,
+            'titles': existing_titles
+        }
+        response_cache.save_last_run(run)
+        seeds = {}
     
-    existing_titles = [b['title'] for b in blogs]
+    for keyword in targets:
+        print(f"🎯 Target: {keyword}")
     
-    ai_response = generate_blog(keyword, existing_titles)
+    results = generate_batch(targets, existing_titles, args.concurrency, seed, args.similarity_threshold, client,
+                             seeds=seeds)
+    if not args.replay:
+        # The accepted seed per keyword, so a replay skips rejected near-duplicates
+        response_cache.save_last_run(dict(run, seeds=seeds))
     
-    if not ai_response:
+    if not results:
         print("❌ Generation failed")
-        return
-    
-    blog_data = parse_response(ai_response)
-    
-    if not all(k in blog_data for k in ['title', 'content']):
-        print("❌ Invalid response")
-        return
-    
-    print(f"📝 Title: {blog_data['title']}")
-    print(f"📊 Length: {len(blog_data['content'])} chars")
+        return 'failed'
     
-    blog_id = save_blog(blog_data, keyword)
+    blog_ids = save_blogs(results, reuse_slugs=args.replay, blogs=blogs)
+    run_metrics.note('published', blog_ids)
+    if notify:
+        notify_search_engines()
+    with run_metrics.span('cache_evict'):
+        response_cache.evict()
     
     print("="*60)
-    print("✅ SUCCESS!")
-    print(f"📌 ID: {blog_id}")
-    print(f"📌 Title: {blog_data['title']}")
+    print(f"✅ SUCCESS! {len(blog_ids)}/{len(targets)} posts published")
+    for blog_id, (blog_data, _) in zip(blog_ids, results):
+        print(f"📌 #{blog_id}: {blog_data['title']}")
     print("="*60)
+    return 'ok' if len(blog_ids) == len(targets) else 'partial'
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Command Line for TurnitinPaperChecker
+One entry point for the publishing tasks. Each subcommand imports only
+the modules it needs - the Groq SDK and requests are loaded by the
+network subcommands alone - and reads the blog manifest at most once.
+
+- generate / send run blog-generator.py / blog-email-sender.py in-process
+  (generate takes the generator's options: --count, --seed, --replay, ...)
+- sitemap rebuilds changed sitemap files from the manifest and queues them
+  for IndexNow; notify flushes that queue
+- stats: post count, newest posts, next keywords, pending notifications
+  and the last recorded runs
+- coldstart runs every subcommand's imports under `python -X importtime`;
+  non-network subcommands must stay under COLDSTART_TARGET_MS (exit 1
+  otherwise) and each check is appended to run-history.jsonl, so
+  `python run_metrics.py trend coldstart.stats_ms` shows the trend
+
+Usage:
+    python blog_cli.py generate [--count N] [--seed S] [--replay] ...
+    python blog_cli.py send
+    python blog_cli.py sitemap
+    python blog_cli.py notify
+    python blog_cli.py stats [N]        # N newest posts / next keywords (default 5)
+    python blog_cli.py coldstart [RUNS]  # median of RUNS cold starts (default 5)
+"""
+
+import os
+import sys
+import time
+import importlib
+import importlib.util
+
+# ===== CONFIGURATION =====
+WEBSITE_URL = "https://www.turnitinpaperchecker.com/"
+COLDSTART_TARGET_MS = 100
+COLDSTART_RUNS = 5
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Subcommand -> (modules it imports, needs the network)
+COMMANDS = {
+    'generate': (['blog-generator.py'], True),
+    'send': (['blog-email-sender.py'], True),
+    'sitemap': (['blog_store', 'notify_queue', 'post_renderer', 'sitemap_builder'], False),
+    'notify': (['notify_queue', 'requests'], True),
+    'stats': (['blog_store', 'keyword_index', 'notify_queue', 'run_metrics'], False),
+}
+
+def load_script(name, filename):
+    """Import one of the hyphenated scripts as a module"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_modules(command):
+    """{short name: module} for a subcommand"""
+    modules = {}
+    for name in COMMANDS[command][0]:
+        if name.endswith('.py'):
+            short = name[:-3].replace('-', '_')
+            modules[short] = load_script(short, name)
+        else:
+            modules[name] = importlib.import_module(name)
+    return modules
+
+# ===== SUBCOMMANDS =====
+def cmd_generate(m, args):
+    m['blog_generator'].main(args)
+
+def cmd_send(m, args):
+    m['blog_email_sender'].main()
+
+def cmd_sitemap(m, args):
+    blogs = m['blog_store'].load_manifest()
+    changed = m['sitemap_builder'].build(blogs, WEBSITE_URL, post_url=m['post_renderer'].post_url)
+    if not changed:
+        print(f"✅ Sitemap unchanged: {len(blogs)} posts")
+        return
+    queued = m['notify_queue'].enqueue([f"{WEBSITE_URL}{path}" for path in changed])
+    print(f"✅ Sitemap updated: {len(blogs)} posts ({', '.join(changed)}); {queued} URL(s) queued for IndexNow")
+
+def cmd_notify(m, args):
+    sent, left = m['notify_queue'].flush()
+    print(f"✅ Sent {sent} URL(s), {left} still queued")
+
+def cmd_stats(m, args):
+    count = int(args[0]) if args else 5
+    blogs = m['blog_store'].load_manifest()
+    print(f"📚 {len(blogs)} posts")
+    for blog in blogs[-count:][::-1]:
+        print(f"   #{blog['id']} {blog.get('date', '')}: {blog.get('title', '')}")
+
+    keyword_index = m['keyword_index']
+    keywords = keyword_index.load_queue()
+    index = keyword_index.load_index(keywords)
+    upcoming = keyword_index.pick_keywords(keywords, index, count, keyword_index.load_weights())
+    print(f"🔑 {len(keywords)} keywords, next: {', '.join(upcoming) or '-'}")
+
+    queue = m['notify_queue'].load_queue()
+    print(f"📡 IndexNow: {len(queue['urls'])} queued, {len(m['notify_queue'].due_urls(queue))} due")
+
+    run_metrics = m['run_metrics']
+    for record in run_metrics.load_history()[-3:]:
+        print(f"{record['started']} ", end='')
+        run_metrics.print_summary(record, top=3)
+
+HANDLERS = {'generate': cmd_generate, 'send': cmd_send, 'sitemap': cmd_sitemap,
+            'notify': cmd_notify, 'stats': cmd_stats}
+
+# ===== COLD START =====
+def import_times(stderr):
+    """Top-level (name, cumulative µs) entries of -X importtime output"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            entries.append((name.strip(), int(cumulative)))
+    return entries
+
+def measure_coldstart(command, runs=COLDSTART_RUNS):
+    """Median import time and wall time (ms) of starting `command`, plus its heaviest imports"""
+    import subprocess
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(ROOT, 'blog_cli.py'),
+                                 '--imports-only', command],
+                                capture_output=True, text=True, cwd=os.getcwd())
+        wall = (time.perf_counter() - started) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed')
+        entries = import_times(result.stderr)
+        samples.append((sum(us for _, us in entries) / 1000, wall, entries))
+    samples.sort(key=lambda s: s[0])
+    imports_ms, wall_ms, entries = samples[len(samples) // 2]
+    heaviest = sorted(entries, key=lambda e: -e[1])[:3]
+    return imports_ms, wall_ms, heaviest
+
+def coldstart(runs=COLDSTART_RUNS, target=COLDSTART_TARGET_MS):
+    """Check every subcommand; returns the non-network ones over target"""
+    import run_metrics
+    run_metrics.start('coldstart', runs=runs, target_ms=target)
+    over = []
+    print(f"{'command':<10} {'imports':>9} {'wall':>9}  heaviest imports")
+    for command, (_, network) in COMMANDS.items():
+        try:
+            with run_metrics.span(command):
+                imports_ms, wall_ms, heaviest = measure_coldstart(command, runs)
+        except Exception as e:
+            print(f"⚠️ {command}: {e}")
+            continue
+        run_metrics.count(f"coldstart.{command}_ms", round(imports_ms))
+        flag = '' if network else ('✅' if imports_ms < target else '❌')
+        if not network and imports_ms >= target:
+            over.append(command)
+        print(f"{command:<10} {imports_ms:>6.1f} ms {wall_ms:>6.1f} ms  "
+              + ', '.join(f"{name} {us / 1000:.0f}" for name, us in heaviest) + f" {flag}")
+    print(f"🎯 Target: non-network subcommands under {target} ms of imports (network ones are informational)")
+    run_metrics.finish('over target' if over else 'ok')
+    return over
+
+# ===== MAIN =====
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    imports_only = '--imports-only' in argv
+    if imports_only:
+        argv.remove('--imports-only')
+    command = argv[0] if argv else ''
+    if command == 'coldstart':
+        over = coldstart(int(argv[1]) if len(argv) > 1 else COLDSTART_RUNS)
+        return 1 if over else 0
+    if command not in HANDLERS:
+        print(__doc__)
+        return 2
+    modules = load_modules(command)
+    if not imports_only:
+        HANDLERS[command](modules, argv[1:])
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Publishing Daemon for TurnitinPaperChecker
+One long-running process that publishes, emails and notifies on a
+schedule, instead of a cold `pip install` + Python start + corpus parse +
+TLS handshake for every run.
+
+- Warm state: one Groq client and one pooled requests.Session per provider
+  (Unsplash, Pexels, IndexNow, Google, Brevo) live as long as the process;
+  the blog manifest, keywords and duplicate/related indexes stay parsed in
+  memory and are reloaded only when their file changes on disk
+- Jobs (JOBS below): generate, send and notify run one at a time from a
+  job queue, so they never race on the state files; a publish queues a
+  notify straight away
+- Catch-up: daemon-state.json records each job's last run; slots missed
+  while the daemon was down run once on start (generate publishes one
+  post per missed day, up to its catch_up limit)
+- Graceful shutdown: SIGTERM/SIGINT stop the scheduler, the running job
+  finishes, queued jobs are left for the next start's catch-up, and
+  clients are closed
+- Each job is recorded in run-history.jsonl as "daemon:<job>"
+
+Usage:
+    python blog_daemon.py run            # schedule jobs until stopped
+    python blog_daemon.py once JOB       # run one job (generate|send|notify) now
+    python blog_daemon.py status         # last runs and next due times
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import threading
+from datetime import datetime, timedelta, timezone
+
+import blog_store
+from blog_cli import load_script
+import duplicate_index
+import file_store
+import image_resolver
+import notify_queue
+import related_posts
+import run_metrics
+
+# ===== CONFIGURATION =====
+STATE_FILE = 'daemon-state.json'
+# Times are UTC, like the workflow's cron. catch_up: most missed slots run on start
+JOBS = {
+    'generate': {'daily': '03:30', 'catch_up': 3},
+    'send': {'daily': '04:30', 'catch_up': 1},
+    'notify': {'every': 15 * 60, 'catch_up': 1},
+}
+TICK_SECONDS = 30          # longest the scheduler sleeps between checks
+PROVIDERS = ['unsplash', 'pexels', 'indexnow', 'google', 'brevo']
+BREVO_POOL_SIZE = 4
+
+# ===== WARM STATE =====
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class WarmCache:
+    """Keeps loader results while their file is unchanged on disk
+
+    install() swaps a module's zero-argument loader for a cached one, so
+    every caller (generator, sender, renderers) shares the parsed copy.
+    Entries marked `adopt` are objects a successful job mutates and saves
+    itself (the related index): after the job their new file signature is
+    taken over instead of re-parsing what was just written.
+    """
+
+    def __init__(self):
+        self.entries = {}   # path -> [signature, value, adopt]
+        self.lock = threading.Lock()
+        self.hits = self.loads = 0
+
+    def install(self, module, name, path, adopt=False):
+        original = getattr(module, name)
+
+        def load(*args, **kwargs):
+            if args or kwargs:
+                return original(*args, **kwargs)
+            signature = _signature(path)
+            with self.lock:
+                entry = self.entries.get(path)
+                if entry and signature is not None and entry[0] == signature:
+                    self.hits += 1
+                    run_metrics.count('warm.hits')
+                    return entry[1]
+            value = original()
+            self.loads += 1
+            run_metrics.count('warm.loads')
+            with self.lock:
+                # The loader may have created the file (migration/rebuild)
+                self.entries[path] = [_signature(path), value, adopt]
+            return value
+
+        load.original = original
+        setattr(module, name, load)
+
+    def settle(self, ok):
+        """After a job: adopt what it saved, or drop everything it may have left dirty"""
+        with self.lock:
+            if not ok:
+                self.entries.clear()
+                return
+            for path, entry in self.entries.items():
+                if entry[2]:
+                    entry[0] = _signature(path)
+
+class Resources:
+    """Clients and sessions shared by every job of the process"""
+
+    def __init__(self):
+        import requests
+        self.generator = load_script('blog_generator', 'blog-generator.py')
+        self.sender = load_script('blog_email_sender', 'blog-email-sender.py')
+        self.sessions = {name: requests.Session() for name in PROVIDERS}
+        self.sessions['brevo'] = self.sender.email_delivery.make_session(BREVO_POOL_SIZE)
+        image_resolver.SESSIONS.update(self.sessions)
+        self._groq = None
+        self.ping_pending = False   # sitemap changed since Google was last pinged
+        self.cache = WarmCache()
+        self.cache.install(blog_store, 'load_manifest', blog_store.MANIFEST_FILE)
+        self.cache.install(duplicate_index, 'load_index', duplicate_index.INDEX_FILE)
+        self.cache.install(related_posts, 'load_index', related_posts.INDEX_FILE, adopt=True)
+        self.cache.install(self.generator, 'load_keywords', 'keywords.json')
+
+    def groq(self):
+        """The Groq client, created on first use (None without GROQ_API_KEY)"""
+        if self._groq is None:
+            self._groq = self.generator.make_groq_client()
+        return self._groq
+
+    def close(self):
+        for session in self.sessions.values():
+            session.close()
+        if self._groq is not None:
+            close = getattr(self._groq, 'close', None)
+            if close:
+                close()
+
+# ===== JOBS =====
+def job_generate(resources, slots=1):
+    """Publish one post per missed slot (one per day); the notify job follows"""
+    generator = resources.generator
+    args = generator.parse_args(['--count', str(max(1, slots))])
+    status = generator.publish(args, client=resources.groq(), notify=False)
+    if status in ('ok', 'partial'):
+        resources.ping_pending = True
+    return status
+
+def job_send(resources, slots=1):
+    return resources.sender.send_latest(session=resources.sessions['brevo'])
+
+def job_notify(resources, slots=1):
+    """Flush the IndexNow queue over the pooled session, then ping Google"""
+    with run_metrics.span('indexnow'):
+        sent, left = notify_queue.flush(session=resources.sessions['indexnow'])
+    run_metrics.count('indexnow.sent', sent)
+    if sent or left:
+        print(f"📡 IndexNow: {sent} sent, {left} still queued")
+    if resources.ping_pending and resources.generator.ping_google_sitemap(resources.sessions['google']):
+        resources.ping_pending = False
+    return 'ok' if not left else 'partial'
+
+HANDLERS = {'generate': job_generate, 'send': job_send, 'notify': job_notify}
+FOLLOW_UPS = {'generate': ['notify']}
+
+# ===== SCHEDULE =====
+def _utc(stamp):
+    return datetime.fromisoformat(stamp).replace(tzinfo=timezone.utc)
+
+def missed_slots(spec, last, now):
+    """How many scheduled times fall in (last, now], capped at spec['catch_up']"""
+    if 'every' in spec:
+        slots = int((now - last).total_seconds() // spec['every'])
+    else:
+        hour, minute = (int(part) for part in spec['daily'].split(':'))
+        first = last.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if first <= last:
+            first += timedelta(days=1)
+        slots = 0 if first > now else (now - first).days + 1
+    return min(slots, spec.get('catch_up', 1))
+
+def next_due(spec, last):
+    if 'every' in spec:
+        return last + timedelta(seconds=spec['every'])
+    hour, minute = (int(part) for part in spec['daily'].split(':'))
+    due = last.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return due if due > last else due + timedelta(days=1)
+
+def load_state(path=STATE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"⚠️ Error loading {path}: {e}")
+        return {}
+
+def save_state(state, path=STATE_FILE):
+    file_store.write_json(path, state, sort_keys=True)
+
+# ===== DAEMON =====
+class Daemon:
+    def __init__(self, jobs=JOBS, state_path=STATE_FILE):
+        self.jobs = jobs
+        self.state_path = state_path
+        self.state = load_state(state_path)
+        self.queue = queue.Queue()
+        self.queued = set()   # queued or running
+        self.queued_lock = threading.Lock()
+        self.stop = threading.Event()
+        self.resources = None
+
+    def _now(self):
+        return datetime.now(timezone.utc).replace(microsecond=0)
+
+    def last_run(self, name, now):
+        entry = self.state.get(name)
+        if entry:
+            return _utc(entry['last_run'])
+        # First start: nothing is overdue yet
+        self.state[name] = {'last_run': now.replace(tzinfo=None).isoformat(), 'status': 'new'}
+        return now
+
+    def enqueue(self, name, slots=1, now=None):
+        with self.queued_lock:
+            if name in self.queued:
+                return
+            self.queued.add(name)
+        self.queue.put((name, slots, now or self._now()))
+
+    def schedule(self):
+        """Queue every job that is due; returns seconds until the next check"""
+        now = self._now()
+        wait = TICK_SECONDS
+        for name, spec in self.jobs.items():
+            last = self.last_run(name, now)
+            slots = missed_slots(spec, last, now)
+            if slots:
+                if slots > 1:
+                    print(f"⏰ {name}: catching up {slots} missed run(s)")
+                self.enqueue(name, slots, now)
+            else:
+                wait = min(wait, max(1, (next_due(spec, last) - now).total_seconds()))
+        return wait
+
+    def run_job(self, name, slots, stamp):
+        """Run one job under its own metrics record; returns its status"""
+        print(f"▶️ {name} ({stamp.strftime('%Y-%m-%d %H:%M')} UTC)")
+        run_metrics.start(f"daemon:{name}", slots=slots)
+        status = 'error'
+        try:
+            status = HANDLERS[name](self.resources, slots)
+        except Exception as e:
+            print(f"❌ {name} failed: {e}")
+        finally:
+            run_metrics.finish(status)
+            self.resources.cache.settle(status not in ('error', 'failed'))
+        self.state[name] = {'last_run': stamp.replace(tzinfo=None).isoformat(), 'status': status}
+        save_state(self.state, self.state_path)
+        if status in ('ok', 'partial'):
+            for follow in FOLLOW_UPS.get(name, ()):
+                self.enqueue(follow)
+        return status
+
+    def worker(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            name, slots, stamp = item
+            # Skipped jobs stay unrecorded, so the next start catches them up
+            if not self.stop.is_set():
+                self.run_job(name, slots, stamp)
+            with self.queued_lock:
+                self.queued.discard(name)
+
+    def _request_stop(self, signum, frame):
+        print(f"🛑 Signal {signum}: finishing the current job, then stopping")
+        self.stop.set()
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+        started = time.perf_counter()
+        self.resources = Resources()
+        now = self._now()
+        for name in self.jobs:
+            self.last_run(name, now)   # the worker may save state from here on
+        save_state(self.state, self.state_path)
+        print(f"🔥 Daemon warm in {time.perf_counter() - started:.2f}s; jobs: "
+              + ', '.join(f"{n} ({s.get('daily') or str(s['every'] // 60) + ' min'})" for n, s in self.jobs.items()))
+        worker = threading.Thread(target=self.worker, name='jobs')
+        worker.start()
+        try:
+            while not self.stop.is_set():
+                self.stop.wait(self.schedule())
+        finally:
+            self.queue.put(None)
+            worker.join()
+            save_state(self.state, self.state_path)
+            self.resources.close()
+            print(f"👋 Daemon stopped (warm cache: {self.resources.cache.hits} hits, "
+                  f"{self.resources.cache.loads} loads)")
+
+    def once(self, name):
+        self.resources = Resources()
+        try:
+            return self.run_job(name, 1, self._now())
+        finally:
+            self.resources.close()
+
+def print_status(jobs=JOBS, path=STATE_FILE):
+    state = load_state(path)
+    for name, spec in jobs.items():
+        entry = state.get(name)
+        if not entry:
+            print(f"{name:<9} never run")
+            continue
+        last = _utc(entry['last_run'])
+        due = next_due(spec, last)
+        print(f"{name:<9} last {last:%Y-%m-%d %H:%M} ({entry['status']}), next {due:%Y-%m-%d %H:%M} UTC")
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'run':
+        Daemon().run()
+    elif command == 'once' and len(sys.argv) > 2 and sys.argv[2] in HANDLERS:
+        Daemon().once(sys.argv[2])
+    elif command == 'status':
+        print_status()
+    else:
+        print(__doc__)
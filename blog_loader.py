@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Shared Blog Loader for TurnitinPaperChecker
+Used by blog-generator.py and blog-email-sender.py.
+
+- iter_js_blogs() walks a `const allBlogs = [...]` file incrementally and
+  yields one post at a time (no regex, safe when a post body contains `];`);
+  a file without the array or cut off before its closing `]` raises
+- load_index() / load_titles() / load_latest_blog() take the fast path and
+  read only the manifest (plus a single post file for the latest blog)
+"""
+
+import json
+
+import blog_store
+
+# ===== CONFIGURATION =====
+JS_MARKER = 'const allBlogs ='
+CHUNK_SIZE = 64 * 1024
+HEADER_LINES = 5
+
+_decoder = json.JSONDecoder()
+
+# ===== STREAMING PARSER =====
+def iter_js_blogs(path=None, chunk_size=CHUNK_SIZE):
+    """Yield posts from a blogs-data.js file one at a time"""
+    with open(path or blog_store.LEGACY_FILE, 'r', encoding='utf-8') as f:
+        buf = ''
+        eof = False
+
+        def fill(size):
+            nonlocal buf, eof
+            chunk = f.read(size)
+            if chunk:
+                buf += chunk
+            else:
+                eof = True
+
+        # Skip the comment header up to the opening bracket
+        while True:
+            start = buf.find(JS_MARKER)
+            if start != -1:
+                bracket = buf.find('[', start + len(JS_MARKER))
+                if bracket != -1:
+                    buf = buf[bracket + 1:]
+                    break
+            if eof:
+                raise ValueError(f"no '{JS_MARKER} [' array found")
+            fill(chunk_size)
+
+        pos = 0
+        while True:
+            # Skip whitespace and separators between posts
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                buf, pos = '', 0
+                fill(chunk_size)
+
+            if pos >= len(buf):
+                raise ValueError("file ends before the closing ']' (truncated?)")
+            if buf[pos] == ']':
+                return
+
+            try:
+                blog, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # Post spans past the buffer: drop what is consumed and grow
+                # geometrically so long posts are not re-scanned quadratically
+                buf, pos = buf[pos:], 0
+                fill(max(chunk_size, len(buf)))
+                continue
+
+            yield blog
+            pos = end
+
+def read_js_header(path=None, max_lines=HEADER_LINES):
+    """Read `// Key: value` comment lines at the top of blogs-data.js"""
+    path = path or blog_store.LEGACY_FILE
+    header = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for _ in range(max_lines):
+                line = f.readline()
+                if not line.startswith('//'):
+                    break
+                key, sep, value = line[2:].partition(':')
+                if sep:
+                    header[key.strip()] = value.strip()
+    except Exception as e:
+        print(f"⚠️ Error reading header of {path}: {e}")
+    return header
+
+# ===== FAST PATH =====
+def load_index():
+    """Listing entries only (id, slug, title, date, excerpt, ...)"""
+    return blog_store.load_manifest()
+
+def load_titles():
+    """All post titles, oldest first"""
+    return [b.get('title', '') for b in load_index()]
+
+def load_latest_blog():
+    """Full record of the most recent post (highest id)"""
+    index = load_index()
+    if not index:
+        return None
+    latest = max(index, key=lambda b: b.get('id', 0))
+    return blog_store.load_post(latest['id'])
+
+# ===== FULL ITERATION =====
+def iter_blogs():
+    """Yield every full post one at a time, oldest first"""
+    if blog_store.store_exists():
+        yield from blog_store.iter_posts()
+    else:
+        yield from iter_js_blogs()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Sharded Blog Store for TurnitinPaperChecker
+One JSON file per post plus a small index manifest, so publishing only
+writes the new post and patches the manifest instead of the whole corpus.
+
+Layout:
+    blogs/index.json        -> listing manifest (id, slug, title, date, excerpt, ...)
+    blogs/posts/<id>.json   -> full post (content included)
+
+Writers hold the manifest lock (file_store.py) while they assign ids and
+patch the manifest; a manifest read earlier is reused only while its
+version is still current, so overlapping publishes never drop a post.
+
+Usage:
+    python blog_store.py migrate   # split legacy blogs-data.js into the store
+"""
+
+import os
+import sys
+import json
+from datetime import datetime
+
+import blog_loader
+import file_store
+
+# ===== CONFIGURATION =====
+STORE_DIR = 'blogs'
+POSTS_DIR = os.path.join(STORE_DIR, 'posts')
+MANIFEST_FILE = os.path.join(STORE_DIR, 'index.json')
+LEGACY_FILE = 'blogs-data.js'
+MANIFEST_VERSION = 1
+
+# Fields copied into the manifest; everything else stays in the post file
+MANIFEST_FIELDS = ['id', 'slug', 'title', 'date', 'excerpt', 'image', 'readTime', 'category', 'tags', 'keyword']
+
+# ===== PATH HELPERS =====
+def post_path(blog_id):
+    """Path of a single post file"""
+    return os.path.join(POSTS_DIR, f"{int(blog_id)}.json")
+
+def manifest_entry(blog):
+    """Reduce a full post to its manifest entry"""
+    return {k: blog[k] for k in MANIFEST_FIELDS if k in blog}
+
+def _write_json(path, data, indent=2, durable=True):
+    file_store.write_json(path, data, indent=indent, durable=durable)
+
+class Manifest(list):
+    """Manifest entries plus the file version they were read from"""
+    version = None
+
+# ===== READ =====
+def store_exists():
+    """True once the legacy file has been migrated"""
+    return os.path.exists(MANIFEST_FILE)
+
+def load_manifest():
+    """Load listing manifest (no post bodies)"""
+    if not store_exists():
+        migrate_legacy()
+    try:
+        data, version = file_store.load_json(MANIFEST_FILE, {})
+        manifest = Manifest(data.get('posts', []))
+        manifest.version = version
+        return manifest
+    except Exception as e:
+        print(f"⚠️ Error loading manifest: {e}")
+        return Manifest()
+
+def fresh(manifest):
+    """manifest if nobody has written the store since it was read, else a re-read"""
+    if manifest is not None and getattr(manifest, 'version', None) == file_store.version(MANIFEST_FILE):
+        return manifest
+    return load_manifest()
+
+def load_post(blog_id):
+    """Load one full post by id"""
+    try:
+        with open(post_path(blog_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Error loading post {blog_id}: {e}")
+        return None
+
+def iter_posts(manifest=None):
+    """Yield full posts one at a time, oldest first"""
+    for entry in (manifest if manifest is not None else load_manifest()):
+        post = load_post(entry['id'])
+        if post:
+            yield post
+
+def next_id(manifest):
+    """Next free post id"""
+    return max([b.get('id', 0) for b in manifest], default=0) + 1
+
+# ===== WRITE =====
+def write_manifest(manifest):
+    """Write manifest and the listing-only blogs-data.js kept for older pages
+
+    Call with the manifest lock held; returns the manifest as a current Manifest.
+    """
+    _write_json(MANIFEST_FILE, {
+        'version': MANIFEST_VERSION,
+        'count': len(manifest),
+        'last_id': next_id(manifest) - 1,
+        'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'posts': manifest
+    })
+    write_legacy_listing(manifest)
+    manifest = Manifest(manifest)
+    manifest.version = file_store.version(MANIFEST_FILE)
+    return manifest
+
+def write_legacy_listing(manifest):
+    """blogs-data.js now carries listing fields only; bodies live in blogs/posts/"""
+    js_content = f"""// Auto-generated blog listing (full posts live in {POSTS_DIR}/<id>.json)
+// Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+// Posts: {len(manifest)}
+// Latest id: {next_id(manifest) - 1}
+
+const allBlogs = {json.dumps(manifest, indent=2, ensure_ascii=False)};
+"""
+    file_store.atomic_write(LEGACY_FILE, js_content)
+
+def append_post(blog, manifest=None):
+    """Publish one post: write its shard, then patch the manifest"""
+    return append_posts([blog], manifest)
+
+def append_posts(blogs, manifest=None):
+    """Publish a batch: one shard per post, one manifest write for all
+
+    Posts with id None get the next free ids (set on the dicts passed in);
+    posts with an id replace that post. `manifest` is only a hint: it is
+    re-read under the lock when another writer has changed the store.
+    """
+    with file_store.lock(MANIFEST_FILE):
+        current = fresh(manifest)
+        if manifest is not None and current is not manifest:
+            print("🔄 Blog store changed since it was read; publishing on top of the current manifest")
+        next_free = next_id(current)
+        for blog in blogs:
+            if blog.get('id') is None:
+                blog['id'], next_free = next_free, next_free + 1
+        new_ids = {blog['id'] for blog in blogs}
+        for blog in blogs:
+            _write_json(post_path(blog['id']), blog)
+        manifest = [b for b in current if b.get('id') not in new_ids]
+        manifest.extend(manifest_entry(blog) for blog in blogs)
+        return write_manifest(manifest)
+
+# ===== MIGRATION =====
+def migrate_legacy(path=LEGACY_FILE, force=False):
+    """Split a full blogs-data.js into one file per post plus the manifest"""
+    with file_store.lock(MANIFEST_FILE):
+        if store_exists() and not force:
+            return load_manifest()   # another process migrated while we waited
+        return _migrate(path)
+
+def _migrate(path):
+    """Raises on a file that can't be read to the end, before the manifest or
+    blogs-data.js is written, so no post body is lost; a missing file is a new site"""
+    manifest = []
+    if os.path.exists(path):
+        try:
+            for blog in blog_loader.iter_js_blogs(path):
+                if 'content' in blog:
+                    _write_json(post_path(blog['id']), blog, durable=False)
+                elif not os.path.exists(post_path(blog['id'])):
+                    print(f"⚠️ Post {blog.get('id')} has no content in {path}, skipping")
+                    continue
+                manifest.append(manifest_entry(blog))
+        except Exception as e:
+            print(f"❌ Error reading {path}: {e}; not migrating (the file is left as it is)")
+            raise
+    manifest.sort(key=lambda b: b.get('id', 0))
+    if hasattr(os, 'sync'):
+        os.sync()   # one flush for every shard before blogs-data.js loses the bodies
+    manifest = write_manifest(manifest)
+    print(f"✅ Migrated {len(manifest)} posts into {STORE_DIR}/")
+    return manifest
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'migrate':
+        migrate_legacy(force=True)
+    else:
+        print(__doc__)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Newsletter Delivery Ledger for TurnitinPaperChecker
+Append-only record of which recipients got which post, replacing
+sent-blogs.json.
+
+- One JSON line per finished batch: blog id, batch number, status,
+  timestamp and the batch's recipients; plus campaign start/complete lines
+- Every line is flushed and fsync'd before the next batch is recorded, and
+  a torn last line (crash mid-write) is ignored on load
+- In-memory index: "was blog X delivered to Y" is a set lookup
+- A re-run for an unfinished campaign skips everyone already delivered and
+  numbers its batches after the last acknowledged one
+- Compaction folds finished campaigns into one summary line, so the file
+  stays small over years of daily sends
+- Appends and compaction hold the ledger lock (file_store.py); compaction
+  re-reads the log first when another process appended since load
+
+Usage:
+    python delivery_ledger.py status
+    python delivery_ledger.py compact
+"""
+
+import os
+import sys
+import json
+import time
+
+import file_store
+
+# ===== CONFIGURATION =====
+LEDGER_FILE = 'delivery-ledger.jsonl'
+LEGACY_SENT_FILE = 'sent-blogs.json'
+COMPACT_AFTER_DAYS = 30    # finished campaigns older than this lose their recipient lists
+COMPACT_SIZE_BYTES = 20 * 1024 * 1024   # the sender compacts automatically past this size
+
+# ===== LEDGER =====
+class DeliveryLedger:
+    """Append-only campaign log with an in-memory per-blog index"""
+
+    def __init__(self, path=LEDGER_FILE):
+        self.path = path
+        self.campaigns = {}
+        self.version = None   # file version our in-memory state matches
+
+    def _campaign(self, blog_id):
+        return self.campaigns.setdefault(blog_id, {
+            'started': None, 'completed': None, 'sent': 0,
+            'delivered': set(), 'last_batch': 0, 'failed_batches': set()
+        })
+
+    def _apply(self, entry):
+        campaign = self._campaign(entry['blog'])
+        event = entry['event']
+        if event == 'start':
+            campaign['started'] = campaign['started'] or entry['ts']
+        elif event == 'batch':
+            campaign['last_batch'] = max(campaign['last_batch'], entry['batch'])
+            if entry['status'] == 'sent':
+                campaign['delivered'].update(entry['recipients'])
+                campaign['failed_batches'].discard(entry['batch'])
+            else:
+                campaign['failed_batches'].add(entry['batch'])
+        elif event == 'complete':
+            campaign['completed'] = entry['ts']
+            campaign['sent'] = entry.get('sent', len(campaign['delivered']))
+
+    def load(self):
+        """Replay the log; False when it does not exist yet"""
+        with file_store.lock(self.path):
+            return self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return False
+        good = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    self._apply(json.loads(line))
+                except ValueError:
+                    break
+                good += len(line)
+            size = f.seek(0, os.SEEK_END)
+        if good < size:
+            # Torn write from an interrupted run: drop it so appends start on a clean line
+            print(f"⚠️ Dropping {size - good} bytes of incomplete ledger data in {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(good)
+        self.version = file_store.version(self.path)
+        return True
+
+    def _append(self, entry):
+        self._apply(entry)
+        with file_store.lock(self.path):
+            current = file_store.version(self.path) == self.version
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            if current:
+                self.version = file_store.version(self.path)
+
+    # ----- recording -----
+    def start(self, blog_id):
+        self._append({'event': 'start', 'blog': blog_id, 'ts': time.time()})
+
+    def record_batch(self, blog_id, batch, recipients, ok, error=None):
+        entry = {'event': 'batch', 'blog': blog_id, 'batch': batch,
+                 'status': 'sent' if ok else 'failed', 'ts': time.time(),
+                 'recipients': list(recipients)}
+        if error:
+            entry['error'] = error
+        self._append(entry)
+
+    def complete(self, blog_id):
+        campaign = self._campaign(blog_id)
+        self._append({'event': 'complete', 'blog': blog_id, 'ts': time.time(),
+                      'sent': len(campaign['delivered']) or campaign['sent']})
+
+    # ----- queries -----
+    def is_complete(self, blog_id):
+        return bool(self.campaigns.get(blog_id, {}).get('completed'))
+
+    def is_delivered(self, blog_id, email):
+        return email in self.campaigns.get(blog_id, {}).get('delivered', ())
+
+    def in_progress(self, blog_id):
+        campaign = self.campaigns.get(blog_id)
+        return bool(campaign and campaign['started'] and not campaign['completed'])
+
+    def last_batch(self, blog_id):
+        return self.campaigns.get(blog_id, {}).get('last_batch', 0)
+
+    def pending(self, blog_id, recipients):
+        """Recipients (emails or (email, name) pairs) of blog_id not yet delivered
+
+        Lazy, O(1) per recipient.
+        """
+        delivered = self.campaigns.get(blog_id, {}).get('delivered', set())
+        return (r for r in recipients if (r[0] if isinstance(r, tuple) else r) not in delivered)
+
+    # ----- maintenance -----
+    def compact(self, older_than_days=COMPACT_AFTER_DAYS):
+        """Rewrite the log: old finished campaigns shrink to one summary line"""
+        with file_store.lock(self.path):
+            if file_store.version(self.path) != self.version:
+                # Another process appended since we loaded: don't drop its lines
+                self.campaigns = {}
+                self._load()
+            return self._compact(older_than_days)
+
+    def _compact(self, older_than_days):
+        cutoff = time.time() - older_than_days * 86400
+        lines = 0
+        f, tmp = file_store.open_temp(self.path)
+        try:
+            for blog_id, campaign in sorted(self.campaigns.items()):
+                entries = [{'event': 'start', 'blog': blog_id, 'ts': campaign['started'] or campaign['completed']}]
+                keep_recipients = not campaign['completed'] or campaign['completed'] >= cutoff
+                if keep_recipients and campaign['delivered']:
+                    entries.append({'event': 'batch', 'blog': blog_id, 'batch': campaign['last_batch'],
+                                    'status': 'sent', 'ts': campaign['started'],
+                                    'recipients': sorted(campaign['delivered'])})
+                if campaign['completed']:
+                    entries.append({'event': 'complete', 'blog': blog_id, 'ts': campaign['completed'],
+                                    'sent': len(campaign['delivered']) or campaign['sent']})
+                    if not keep_recipients:
+                        campaign['delivered'] = set()
+                campaign['failed_batches'] = set()
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                    lines += 1
+        except BaseException:
+            file_store.discard_temp(f, tmp)
+            raise
+        file_store.commit_temp(f, tmp, self.path)
+        self.version = file_store.version(self.path)
+        return lines
+
+    def maybe_compact(self, max_bytes=COMPACT_SIZE_BYTES):
+        try:
+            if os.path.getsize(self.path) > max_bytes:
+                print(f"🧹 Ledger compacted to {self.compact()} lines")
+        except OSError:
+            pass
+
+def migrate_legacy(ledger, path=LEGACY_SENT_FILE):
+    """Import blog ids from sent-blogs.json as finished campaigns"""
+    try:
+        with open(path, 'r') as f:
+            sent = json.load(f)
+    except Exception:
+        return 0
+    for blog_id in sent:
+        if not ledger.is_complete(blog_id):
+            ledger.start(blog_id)
+            ledger.complete(blog_id)
+    if sent:
+        print(f"📦 Imported {len(sent)} sent blog(s) from {path}")
+    return len(sent)
+
+def load_ledger(path=LEDGER_FILE):
+    """Load the ledger, importing sent-blogs.json the first time"""
+    ledger = DeliveryLedger(path)
+    if not ledger.load():
+        migrate_legacy(ledger)
+    return ledger
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'status':
+        ledger = load_ledger()
+        for blog_id, campaign in sorted(ledger.campaigns.items()):
+            state = 'complete' if campaign['completed'] else 'in progress'
+            print(f"#{blog_id}: {state}, {len(campaign['delivered']) or campaign['sent']} delivered, "
+                  f"{campaign['last_batch']} batch(es), {len(campaign['failed_batches'])} failed")
+    elif command == 'compact':
+        ledger = load_ledger()
+        print(f"✅ Ledger compacted to {ledger.compact()} lines")
+    else:
+        print(__doc__)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index for TurnitinPaperChecker
+MinHash signatures + LSH banding over every post's text, so a fresh
+generation can be checked against the whole corpus without comparing it
+to every post.
+
+- Shingles: 5-word windows of the visible text (tags stripped)
+- Signature: one-permutation MinHash with 128 bins (one hash per shingle)
+- LSH: 32 bands x 4 rows; only posts sharing a band are compared
+- Persisted append-only in duplicate-index.jsonl (one line per post)
+
+Usage:
+    python duplicate_index.py rebuild   # rebuild from the blog store
+    python duplicate_index.py bench     # lookup cost at 100 .. 50k posts
+"""
+
+import os
+import re
+import sys
+import json
+import html
+import time
+import base64
+import random
+import hashlib
+from array import array
+
+import blog_loader
+import file_store
+
+# ===== CONFIGURATION =====
+INDEX_FILE = 'duplicate-index.jsonl'
+SHINGLE_WORDS = 5
+NUM_BINS = 128
+BANDS = 32
+ROWS = NUM_BINS // BANDS
+DEFAULT_THRESHOLD = float(os.environ.get('DUPLICATE_THRESHOLD', 0.5))
+
+_EMPTY = 0xFFFFFFFF
+_TAG = re.compile(r'<[^>]+>')
+_WORD = re.compile(r"[a-z0-9']+")
+
+# ===== SIGNATURES =====
+def shingle_hashes(content):
+    """64-bit hashes of the 5-word shingles of an HTML body"""
+    words = _WORD.findall(html.unescape(_TAG.sub(' ', content)).lower())
+    if len(words) < SHINGLE_WORDS:
+        words = words + [''] * (SHINGLE_WORDS - len(words))
+    hashes = set()
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = ' '.join(words[i:i + SHINGLE_WORDS]).encode('utf-8')
+        hashes.add(int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'little'))
+    return hashes
+
+def signature(content):
+    """One-permutation MinHash: bin by low bits, keep the min of the rest"""
+    sig = [_EMPTY] * NUM_BINS
+    for h in shingle_hashes(content):
+        b = h % NUM_BINS
+        v = (h >> 7) & 0xFFFFFFFF
+        if v < sig[b]:
+            sig[b] = v
+    # Densify empty bins from the next filled bin (rotation), so sparse
+    # documents still get a comparable full-length signature
+    if _EMPTY in sig and any(v != _EMPTY for v in sig):
+        orig = sig[:]
+        for i in range(NUM_BINS):
+            if orig[i] == _EMPTY:
+                j = 1
+                while orig[(i + j) % NUM_BINS] == _EMPTY:
+                    j += 1
+                sig[i] = (orig[(i + j) % NUM_BINS] + j * 0x9E3779B1) & 0xFFFFFFFF
+    return sig
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_BINS
+
+def band_keys(sig):
+    return [hash((band,) + tuple(sig[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+def _pack(sig):
+    return base64.b64encode(array('I', sig).tobytes()).decode('ascii')
+
+def _unpack(data):
+    sig = array('I')
+    sig.frombytes(base64.b64decode(data))
+    return list(sig)
+
+# ===== INDEX =====
+class DuplicateIndex:
+    """In-memory LSH buckets over persisted signatures"""
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.signatures = {}
+        self.buckets = {}
+
+    def _insert(self, blog_id, sig):
+        self.signatures[blog_id] = sig
+        for key in band_keys(sig):
+            self.buckets.setdefault(key, []).append(blog_id)
+
+    def load(self):
+        """Load signatures; False when the index file does not exist yet"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._insert(entry['id'], _unpack(entry['sig']))
+        return True
+
+    def add(self, blog_id, content, persist=True):
+        """Index a post; appends one line to the index file"""
+        sig = signature(content)
+        if blog_id in self.signatures:
+            return sig
+        self._insert(blog_id, sig)
+        if persist:
+            with file_store.lock(self.path), open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'id': blog_id, 'sig': _pack(sig)}) + '\n')
+        return sig
+
+    def query(self, content, threshold=DEFAULT_THRESHOLD, sig=None):
+        """[(blog_id, similarity)] of indexed posts at or above threshold"""
+        sig = sig or signature(content)
+        candidates = set()
+        for key in band_keys(sig):
+            candidates.update(self.buckets.get(key, ()))
+        matches = [(blog_id, similarity(sig, self.signatures[blog_id])) for blog_id in candidates]
+        return sorted([m for m in matches if m[1] >= threshold], key=lambda m: -m[1])
+
+    def rebuild(self, blogs=None):
+        """Recompute every signature from the corpus"""
+        self.signatures, self.buckets = {}, {}
+        lines = []
+        for blog in (blogs if blogs is not None else blog_loader.iter_blogs()):
+            sig = signature(blog.get('content', ''))
+            self._insert(blog['id'], sig)
+            lines.append(json.dumps({'id': blog['id'], 'sig': _pack(sig)}) + '\n')
+        with file_store.lock(self.path):
+            file_store.atomic_write(self.path, ''.join(lines))
+        print(f"✅ Duplicate index rebuilt: {len(self.signatures)} posts")
+        return self
+
+def load_index(path=INDEX_FILE):
+    """Load the index, rebuilding it from the corpus when missing"""
+    index = DuplicateIndex(path)
+    try:
+        if index.load():
+            return index
+    except Exception as e:
+        print(f"⚠️ Error loading duplicate index: {e}")
+    return index.rebuild()
+
+# ===== BENCHMARK =====
+def _synthetic_post(rng, vocab, words=120):
+    return '<p>' + ' '.join(rng.choice(vocab) for _ in range(words)) + '</p>'
+
+def benchmark(sizes=(100, 1000, 10000, 50000), queries=200, seed=1):
+    """Average lookup time as the corpus grows; the index is built in memory"""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(5000)]
+    index = DuplicateIndex(os.devnull)
+    sample = []
+    results = []
+    for size in sizes:
+        while len(index.signatures) < size:
+            post = _synthetic_post(rng, vocab)
+            index.add(len(index.signatures) + 1, post, persist=False)
+            if len(sample) < 1000:
+                sample.append(post)
+        # Half the probes are fresh posts, half are trimmed copies of indexed ones
+        probes = []
+        for i in range(queries):
+            if i % 2:
+                probes.append(_synthetic_post(rng, vocab))
+            else:
+                words = rng.choice(sample)[3:-4].split()
+                probes.append('<p>' + ' '.join(words[:100]) + '</p>')
+        sigs = [signature(p) for p in probes]
+        started = time.perf_counter()
+        hits = sum(1 for probe, sig in zip(probes, sigs) if index.query(probe, sig=sig))
+        per_query = (time.perf_counter() - started) / queries
+        results.append({'posts': size, 'lookup_ms': round(per_query * 1000, 4), 'hits': hits})
+        print(f"📏 {size:>6} posts: {per_query * 1000:.3f} ms/lookup ({hits}/{queries} flagged)")
+    return results
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'rebuild':
+        DuplicateIndex().rebuild()
+    elif command == 'bench':
+        benchmark()
+    else:
+        print(__doc__)
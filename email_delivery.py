@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Newsletter Delivery Engine for TurnitinPaperChecker
+Sends one campaign as many Brevo `messageVersions` batches instead of one
+giant `to` list, so recipients never see each other and one failed request
+only affects its own batch.
+
+- Batches of BATCH_SIZE versions (one recipient each) per API call
+- One pooled requests.Session shared by CONCURRENCY worker threads
+- Recipients are consumed lazily; at most CONCURRENCY batches are in flight
+- 429s honour x-sib-ratelimit-reset / Retry-After; 5xx and network errors
+  back off exponentially; all workers pause together on a rate limit
+- Per-batch latency and overall throughput are reported
+
+Usage:
+    python email_delivery.py serve [port]      # fake Brevo API for local runs
+    python email_delivery.py simulate [count]  # end-to-end run against the fake
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ===== CONFIGURATION =====
+BREVO_API_URL = os.environ.get('BREVO_API_URL', 'https://api.brevo.com')
+BATCH_SIZE = 1000          # messageVersions per request (Brevo's per-call limit)
+CONCURRENCY = 4
+MAX_RETRIES = 5
+BACKOFF_SECONDS = 1
+REQUEST_TIMEOUT = 30
+
+# ===== BATCHING =====
+def batches(recipients, size=BATCH_SIZE):
+    """Yield lists of up to `size` recipients without materialising the input"""
+    batch = []
+    for recipient in recipients:
+        batch.append(recipient)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def default_version(email):
+    return {"to": [{"email": email}]}
+
+def make_session(concurrency=CONCURRENCY):
+    """Session whose pool keeps one connection per worker thread"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# ===== ENGINE =====
+class DeliveryEngine:
+    """Sends payload batches to Brevo over a shared, pooled session
+
+    Pass `session` (see make_session) to reuse warm connections across
+    campaigns; close() then leaves it open for its owner.
+    """
+
+    def __init__(self, api_key, base_url=None, concurrency=CONCURRENCY,
+                 max_retries=MAX_RETRIES, backoff=BACKOFF_SECONDS, session=None):
+        self.url = f"{base_url or BREVO_API_URL}/v3/smtp/email"
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.owns_session = session is None
+        self.session = session or make_session(concurrency)
+        self.session.headers.update({"api-key": api_key, "Content-Type": "application/json"})
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+
+    def close(self):
+        if self.owns_session:
+            self.session.close()
+
+    def _wait_for_rate_limit(self):
+        delay = self._pause_until - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause(self, seconds):
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.time() + seconds)
+
+    def send_batch(self, number, payload):
+        """POST one batch; returns its metrics dict (never raises)"""
+        started = time.perf_counter()
+        result = {'batch': number, 'recipients': len(payload['messageVersions']),
+                  'ok': False, 'status': None, 'attempts': 0, 'error': None}
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            result['attempts'] = attempt + 1
+            try:
+                response = self.session.post(self.url, json=payload, timeout=REQUEST_TIMEOUT)
+                result['status'] = response.status_code
+            except Exception as e:
+                result['error'] = str(e)
+                time.sleep(self.backoff * (2 ** attempt) * (1 + random.random() / 2))
+                continue
+
+            if response.status_code in (200, 201, 202):
+                result['ok'], result['error'] = True, None
+                # Slow down before the limit is hit rather than after
+                if response.headers.get('x-sib-ratelimit-remaining') == '0':
+                    self._pause(float(response.headers.get('x-sib-ratelimit-reset', 1)))
+                break
+            if response.status_code == 429:
+                reset = response.headers.get('x-sib-ratelimit-reset') or response.headers.get('Retry-After')
+                self._pause(float(reset) if reset else self.backoff * (2 ** attempt))
+                result['error'] = 'rate limited'
+                continue
+            if response.status_code >= 500:
+                result['error'] = f"HTTP {response.status_code}"
+                time.sleep(self.backoff * (2 ** attempt) * (1 + random.random() / 2))
+                continue
+            # 4xx other than 429: the payload itself is wrong, retrying won't help
+            result['error'] = f"HTTP {response.status_code}: {response.text[:200]}"
+            break
+        result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def deliver(self, base_payload, recipients, make_version=default_version,
+                batch_size=BATCH_SIZE, on_batch=None, first_batch=1):
+        """Send base_payload to every recipient; returns a delivery report
+
+        on_batch(result, emails) is called as each batch finishes.
+        first_batch numbers batches after those of an interrupted run.
+        """
+        started = time.perf_counter()
+        results = []
+
+        def finished(done):
+            for future in done:
+                result, emails = future.result(), in_flight.pop(future)
+                results.append(result)
+                mark = '✅' if result['ok'] else '❌'
+                print(f"{mark} Batch {result['batch']}: {result['recipients']} recipients, "
+                      f"{result['latency_ms']} ms, {result['attempts']} attempt(s)"
+                      + (f" - {result['error']}" if result['error'] else ''))
+                if on_batch:
+                    on_batch(result, emails)
+
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for number, emails in enumerate(batches(recipients, batch_size), first_batch):
+                payload = dict(base_payload, messageVersions=[make_version(e) for e in emails])
+                in_flight[executor.submit(self.send_batch, number, payload)] = emails
+                if len(in_flight) >= self.concurrency:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    finished(done)
+            finished(wait(list(in_flight)).done)
+
+        return summarize(sorted(results, key=lambda r: r['batch']), time.perf_counter() - started)
+
+def summarize(results, seconds):
+    latencies = sorted(r['latency_ms'] for r in results)
+    sent = sum(r['recipients'] for r in results if r['ok'])
+    failed = sum(r['recipients'] for r in results if not r['ok'])
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0
+
+    return {
+        'batches': results,
+        'sent': sent,
+        'failed': failed,
+        'seconds': round(seconds, 2),
+        'per_second': round(sent / seconds, 1) if seconds else 0,
+        'latency_p50_ms': pct(0.5),
+        'latency_p95_ms': pct(0.95),
+    }
+
+def print_report(report):
+    print(f"📬 Sent {report['sent']} / failed {report['failed']} in {report['seconds']}s "
+          f"({report['per_second']}/s, p50 {report['latency_p50_ms']} ms, p95 {report['latency_p95_ms']} ms)")
+
+# ===== FAKE BREVO =====
+def make_fake_server(port=0, rate_limit=20, window=1.0, latency=0.02):
+    """Threaded fake of POST /v3/smtp/email: counts recipients, enforces a per-window rate limit"""
+    state = {'recipients': set(), 'requests': 0, 'limited': 0, 'window_start': time.time(), 'in_window': 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _reply(self, status, body, headers=None):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            if self.path != '/v3/smtp/email' or not self.headers.get('api-key'):
+                return self._reply(401, {'message': 'Key not found'})
+            with lock:
+                now = time.time()
+                if now - state['window_start'] >= window:
+                    state['window_start'], state['in_window'] = now, 0
+                reset = max(0.0, window - (now - state['window_start']))
+                if state['in_window'] >= rate_limit:
+                    state['limited'] += 1
+                    return self._reply(429, {'message': 'Too many requests'},
+                                       {'x-sib-ratelimit-reset': f"{reset:.3f}", 'x-sib-ratelimit-remaining': '0'})
+                state['in_window'] += 1
+                state['requests'] += 1
+                remaining = rate_limit - state['in_window']
+            time.sleep(latency)
+            versions = body.get('messageVersions') or [{'to': body.get('to', [])}]
+            with lock:
+                for version in versions:
+                    state['recipients'].update(r['email'] for r in version['to'])
+            self._reply(201, {'messageIds': [f"<{i}@fake>" for i in range(len(versions))]},
+                        {'x-sib-ratelimit-remaining': str(remaining), 'x-sib-ratelimit-reset': f"{reset:.3f}"})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+def simulate(count=100000, batch_size=BATCH_SIZE, concurrency=CONCURRENCY):
+    """Deliver to `count` synthetic subscribers through the fake server"""
+    server = make_fake_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"🧪 Fake Brevo on {base_url}, {count} subscribers")
+
+    engine = DeliveryEngine('test-key', base_url=base_url, concurrency=concurrency, backoff=0.05)
+    payload = {"sender": {"name": "Test", "email": "test@example.com"},
+               "subject": "Simulated campaign", "htmlContent": "<p>Hello</p>"}
+    recipients = (f"user{i}@example.com" for i in range(count))
+    try:
+        report = engine.deliver(payload, recipients, batch_size=batch_size)
+    finally:
+        engine.close()
+        server.shutdown()
+
+    print_report(report)
+    state = server.state
+    print(f"📊 Fake server: {state['requests']} accepted requests, {state['limited']} rate-limited, "
+          f"{len(state['recipients'])} unique recipients")
+    return report
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'serve':
+        server = make_fake_server(int(sys.argv[2]) if len(sys.argv) > 2 else 8780)
+        print(f"🧪 Fake Brevo on http://127.0.0.1:{server.server_address[1]} (set BREVO_API_URL)")
+        server.serve_forever()
+    elif command == 'simulate':
+        simulate(int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
+    else:
+        print(__doc__)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Newsletter Email Rendering for TurnitinPaperChecker
+Compiles the campaign email once; Brevo fills in each recipient's fields.
+
+- CampaignEmail() renders the whole message (styles, header, post block,
+  footer) once, with {{ params.* }} slots for the per-recipient values:
+  greeting name, the token in the UTM-tagged article link and the
+  unsubscribe link. It goes in the request as the top-level htmlContent /
+  textContent
+- Each messageVersion carries only the recipient and its params, so a
+  1000-recipient request stays a few hundred KB instead of megabytes
+- Unsubscribe tokens are an HMAC of the address, so they can be checked
+  without storing anything (verify_token). UNSUBSCRIBE_SECRET must be set:
+  without it nothing is sent (anyone could forge tokens)
+- A plain-text alternative is built from the post's excerpt
+
+Usage:
+    python email_render.py bench [count]    # build 100k messageVersions
+"""
+
+import os
+import re
+import sys
+import hmac
+import html
+import json
+import time
+import base64
+import hashlib
+from urllib.parse import quote
+
+import post_renderer
+
+# ===== CONFIGURATION =====
+WEBSITE_URL = "https://www.turnitinpaperchecker.com/"
+UNSUBSCRIBE_SECRET = os.environ.get('UNSUBSCRIBE_SECRET', '').encode('utf-8')
+INSECURE_SECRETS = {b'', b'change-me'}
+# {email} and {token} are filled in per recipient (both URL-encoded)
+UNSUBSCRIBE_URL = os.environ.get(
+    'UNSUBSCRIBE_URL',
+    'mailto:shivansh.assignment365@gmail.com?subject=Unsubscribe%20{email}%20{token}')
+UTM_SOURCE = 'newsletter'
+UTM_MEDIUM = 'email'
+
+_TAG = re.compile(r'<[^>]*>?')
+_PARAM = re.compile(r'\{\{ params\.(\w+) \}\}')
+
+STYLES = """
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: linear-gradient(135deg, #0a5d8c 0%, #0a9cfc 100%); color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }
+        .content { background: white; padding: 30px; border: 1px solid #ddd; }
+        .footer { background: #f8f9fa; padding: 20px; text-align: center; border-radius: 0 0 10px 10px; }
+        .btn { background: #0a5d8c; color: white; padding: 15px 30px; text-decoration: none; border-radius: 25px; display: inline-block; margin: 20px 0; }
+        img { max-width: 100%; border-radius: 10px; }"""
+
+# ===== TOKENS =====
+def secret_configured():
+    """False (with a message) while UNSUBSCRIBE_SECRET is unset or the old default"""
+    if UNSUBSCRIBE_SECRET in INSECURE_SECRETS:
+        print("❌ UNSUBSCRIBE_SECRET not set (unsubscribe links could be forged); not sending")
+        return False
+    return True
+
+def unsubscribe_token(email):
+    digest = hmac.new(UNSUBSCRIBE_SECRET, email.encode('utf-8'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:12]).decode('ascii')
+
+def verify_token(email, token):
+    return hmac.compare_digest(unsubscribe_token(email), token or '')
+
+def plain_excerpt(excerpt):
+    """Excerpt without tags or entities (it is cut from HTML and may end mid-tag)"""
+    return ' '.join(html.unescape(_TAG.sub(' ', excerpt or '')).split())
+
+def param(name):
+    return '{{ params.%s }}' % name
+
+# ===== TEMPLATE =====
+class CampaignEmail:
+    """Compiled campaign: one html/text body with per-recipient {{ params.* }} slots"""
+
+    def __init__(self, blog, campaign=None):
+        self.campaign = campaign or f"blog-{blog['id']}"
+        title = html.escape(blog['title'])
+        excerpt = plain_excerpt(blog.get('excerpt', ''))
+        # utm_content carries the recipient token rather than the address itself
+        link = (f"{post_renderer.post_url(WEBSITE_URL, blog)}"
+                f"?utm_source={UTM_SOURCE}&utm_medium={UTM_MEDIUM}"
+                f"&utm_campaign={quote(self.campaign)}&utm_content={param('TOKEN')}")
+        unsubscribe = UNSUBSCRIBE_URL.format(email=param('EMAIL'), token=param('TOKEN'))
+
+        self.html = f"""<!DOCTYPE html>
+<html>
+<head>
+    <style>{STYLES}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📝 New Blog Post from TurnitinPaperChecker!</h1>
+        </div>
+        <div class="content">
+            <p>Hi {param('NAME')},</p>
+            <h2>{title}</h2>
+            <p><strong>Published:</strong> {html.escape(blog['date'])} | <strong>Read Time:</strong> {blog['readTime']} minutes</p>
+            <img src="{html.escape(blog['image'])}" alt="{title}">
+            <p>{html.escape(excerpt)}</p>
+            <a href="{html.escape(link)}" class="btn">Read Full Article →</a>
+        </div>
+        <div class="footer">
+            <p>You're receiving this because you subscribed to TurnitinPaperChecker updates.</p>
+            <p><small><a href="{html.escape(unsubscribe)}">Unsubscribe</a> | TurnitinPaperChecker | Professional Plagiarism &amp; AI Detection</small></p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+        self.text = (
+            f"Hi {param('NAME')},\n\nNew on the TurnitinPaperChecker blog:\n\n{blog['title']}\n"
+            f"Published {blog['date']} | {blog['readTime']} minute read\n\n{excerpt}\n\n"
+            f"Read the full article: {link}\n\n"
+            f"--\nYou're receiving this because you subscribed to TurnitinPaperChecker updates.\n"
+            f"Unsubscribe: {unsubscribe}\n")
+
+    @staticmethod
+    def params(email, name=''):
+        """The per-recipient values Brevo substitutes into the compiled body"""
+        return {'NAME': name or 'there', 'EMAIL': quote(email, safe=''), 'TOKEN': unsubscribe_token(email)}
+
+    def render(self, email, name=''):
+        """(html, text) for one recipient, filled in locally (previews and checks)"""
+        values = self.params(email, name)
+        escaped = {key: html.escape(value) for key, value in values.items()}
+        return (_PARAM.sub(lambda m: escaped[m.group(1)], self.html),
+                _PARAM.sub(lambda m: values[m.group(1)], self.text))
+
+    def message_version(self, recipient):
+        """Brevo messageVersion for an email or (email, name) pair"""
+        email, name = recipient if isinstance(recipient, tuple) else (recipient, '')
+        to = {"email": email, "name": name} if name else {"email": email}
+        return {"to": [to], "params": self.params(email, name)}
+
+# ===== BENCHMARK =====
+def benchmark(count=100000):
+    blog = {'id': 1, 'slug': 'how-turnitin-detects-ai-writing', 'title': 'How Turnitin Detects AI Writing', 'date': 'January 03, 2026',
+            'readTime': 7, 'image': 'https://images.unsplash.com/photo-1?w=800',
+            'excerpt': 'Turnitin&#39;s AI detector looks at <strong>sentence-level</strong> patterns ' * 3}
+    started = time.perf_counter()
+    campaign = CampaignEmail(blog)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    versions = [campaign.message_version((f"user{i}@example.com", f"User {i}" if i % 2 else ''))
+                for i in range(count)]
+    seconds = time.perf_counter() - started
+    size = len(json.dumps(versions))
+    print(f"✉️ Compiled in {compile_ms:.2f} ms ({len(campaign.html) / 1024:.1f} KB body, sent once per request); "
+          f"{count} messageVersions in {seconds:.2f}s ({count / seconds:,.0f}/s, {size / count:.0f} bytes each)")
+    return {'messages': count, 'seconds': round(seconds, 3), 'per_second': round(count / seconds)}
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
+    else:
+        print(__doc__)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Transactional File Writes for TurnitinPaperChecker
+Every JSON/JS state file goes through here, so overlapping runs (the cron
+and a manual dispatch, the daemon and an email send) can neither lose an
+update nor leave a half-written file for the next reader.
+
+- atomic_write(): unique temp file next to the target, fsync, rename over
+  it, fsync the directory - readers see the old file or the new one,
+  never a torn one (durable=False skips the fsyncs for regenerable pages)
+- lock(path): advisory fcntl lock on <path>.lock for read-modify-write
+  cycles; re-entrant within a thread, blocking=False raises LockBusy
+- Optimistic checks: load_json() also returns the file's version (inode,
+  mtime, size of the file actually read); a writer holding the lock
+  compares it with version(path) and re-reads when someone else wrote
+  in between, instead of holding a lock across slow work (Groq calls)
+- Without fcntl (Windows) locks are no-ops; writes stay atomic
+
+Usage:
+    python file_store.py stress [WORKERS] [ROUNDS]   # concurrent writers, then check nothing was lost
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:   # not on Windows
+    fcntl = None
+
+# ===== CONFIGURATION =====
+LOCK_SUFFIX = '.lock'
+LOCK_POLL_SECONDS = 0.05
+STRESS_WORKERS = 8
+STRESS_ROUNDS = 10
+
+class LockBusy(Exception):
+    """lock(..., blocking=False) found the lock taken"""
+
+# ===== VERSIONS =====
+def _stat_version(stat):
+    return [stat.st_ino, stat.st_mtime_ns, stat.st_size]
+
+def version(path):
+    """Current version of a file (None when missing); every atomic write changes it"""
+    try:
+        return _stat_version(os.stat(path))
+    except OSError:
+        return None
+
+def load_json(path, default=None):
+    """(data, version) of a JSON file; (default, None) when it does not exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f), _stat_version(os.fstat(f.fileno()))
+    except FileNotFoundError:
+        return default, None
+
+# ===== LOCKING =====
+_held = threading.local()
+
+@contextmanager
+def lock(path, blocking=True, timeout=None):
+    """Exclusive advisory lock for `path` (held on <path>.lock)"""
+    held = _held.__dict__.setdefault('paths', {})
+    key = os.path.abspath(path)
+    if key in held or fcntl is None:
+        held[key] = held.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+            if not held[key]:
+                del held[key]
+        return
+
+    lock_path = f"{path}{LOCK_SUFFIX}"
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | (fcntl.LOCK_NB if not blocking or deadline else 0))
+                break
+            except BlockingIOError:
+                if not blocking or time.monotonic() >= deadline:
+                    raise LockBusy(path)
+                time.sleep(LOCK_POLL_SECONDS)
+        held[key] = 1
+        try:
+            yield
+        finally:
+            del held[key]
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+# ===== ATOMIC WRITES =====
+def _fsync_dir(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:   # not supported on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def open_temp(path, mode='w'):
+    """Unique temp file beside `path` -> (file, temp path); finish with commit_temp()"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        mode_bits = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode_bits = 0o644
+    os.chmod(tmp, mode_bits)   # mkstemp creates 0600
+    if 'b' in mode:
+        return os.fdopen(fd, mode), tmp
+    return os.fdopen(fd, mode, encoding='utf-8', newline='\n'), tmp
+
+def commit_temp(f, tmp, path, durable=True):
+    """fsync + rename a temp file from open_temp() over `path`"""
+    try:
+        f.flush()
+        if durable:
+            os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp, path)
+    except BaseException:
+        discard_temp(f, tmp)
+        raise
+    if durable:
+        _fsync_dir(os.path.dirname(path) or '.')
+
+def discard_temp(f, tmp):
+    f.close()
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+
+def atomic_write(path, data, durable=True):
+    """Replace `path` with data (str or bytes) in one step"""
+    f, tmp = open_temp(path, 'wb' if isinstance(data, bytes) else 'w')
+    try:
+        f.write(data)
+    except BaseException:
+        discard_temp(f, tmp)
+        raise
+    commit_temp(f, tmp, path, durable)
+
+def write_json(path, data, indent=2, sort_keys=False, compact=False, durable=True):
+    """Atomically write data as JSON (pretty with a trailing newline, or compact)"""
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False) + '\n'
+    atomic_write(path, text, durable)
+
+def update_json(path, mutate, default=None):
+    """Locked read-modify-write: mutate(data) edits data in place; returns data"""
+    with lock(path):
+        data, _ = load_json(path, default() if callable(default) else default)
+        mutate(data)
+        write_json(path, data)
+        return data
+
+# ===== STRESS TEST =====
+def _stress_worker(worker, rounds):
+    """One writer process: publish posts the way blog-generator.py does, record sends"""
+    import blog_store
+    import delivery_ledger
+    import file_store   # not this __main__ copy: its held-lock table is the one the modules share
+    import keyword_index
+    import notify_queue
+    import sitemap_builder
+
+    url = "https://www.turnitinpaperchecker.com/"
+    for number in range(rounds):
+        keyword = f"stress {worker} {number}"
+        post = {'id': None, 'title': f"Worker {worker} post {number}", 'slug': f"w{worker}-p{number}",
+                'content': f"<p>{keyword}</p>", 'excerpt': keyword, 'keyword': keyword,
+                'date': 'January 01, 2026', 'readTime': 3}
+        manifest = blog_store.append_posts([post])
+        keyword_index.record_uses([(keyword, post['id'])])
+        with file_store.lock(sitemap_builder.STATE_FILE):
+            sitemap_builder.build(blog_store.fresh(manifest), url)
+        notify_queue.enqueue([f"{url}blog-post.html?id={post['id']}"])
+
+        ledger = delivery_ledger.load_ledger()
+        ledger.start(post['id'])
+        ledger.record_batch(post['id'], 1, [f"{worker}-{number}@example.com"], True)
+        ledger.complete(post['id'])
+        if worker == 0:
+            ledger.compact(older_than_days=0)   # rewrites the file under everyone's appends
+
+def stress(workers=STRESS_WORKERS, rounds=STRESS_ROUNDS):
+    """Run concurrent writer processes in a scratch directory; returns the problems found"""
+    import multiprocessing
+    cwd = os.getcwd()
+    directory = tempfile.mkdtemp(prefix='file-store-stress-')
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(directory)
+    try:
+        with open('blogs-data.js', 'w', encoding='utf-8') as f:
+            f.write('const allBlogs = [];\n')
+        with open('keywords.json', 'w', encoding='utf-8') as f:
+            json.dump({'queue': []}, f)
+        import blog_store
+        blog_store.load_manifest()   # migrate the empty store before the workers start
+
+        started = time.perf_counter()
+        processes = [multiprocessing.Process(target=_stress_worker, args=(w, rounds)) for w in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        seconds = time.perf_counter() - started
+        problems = [f"worker exited with {p.exitcode}" for p in processes if p.exitcode]
+        problems += verify(workers * rounds)
+        print(f"🧪 {workers} processes x {rounds} publishes in {seconds:.1f}s "
+              f"({directory})")
+        return problems
+    finally:
+        os.chdir(cwd)
+
+def verify(expected):
+    """Every post, sent id, sitemap URL, keyword use and queued URL must be present exactly once"""
+    import blog_store
+    import delivery_ledger
+    import keyword_index
+    import notify_queue
+
+    problems = []
+    manifest = blog_store.load_manifest()
+    ids = [b['id'] for b in manifest]
+    if len(ids) != expected or len(set(ids)) != expected:
+        problems.append(f"manifest has {len(ids)} posts ({len(set(ids))} distinct ids), expected {expected}")
+    for blog in manifest:
+        post = blog_store.load_post(blog['id'])
+        if not post or post['slug'] != blog['slug']:
+            problems.append(f"post file {blog['id']} is missing or belongs to another post")
+    listed = blog_store.blog_loader.iter_js_blogs()
+    if sum(1 for _ in listed) != len(manifest):
+        problems.append("blogs-data.js does not match the manifest")
+
+    ledger = delivery_ledger.load_ledger()
+    unsent = [i for i in ids if not ledger.is_complete(i)]
+    if unsent:
+        problems.append(f"{len(unsent)} sent id(s) lost from the ledger, e.g. {unsent[:5]}")
+
+    with open('sitemap.xml', 'r', encoding='utf-8') as f:
+        sitemap = f.read()
+    missing = [i for i in ids if f"blog-post.html?id={i}<" not in sitemap]
+    if missing:
+        problems.append(f"{len(missing)} post(s) missing from sitemap.xml, e.g. {missing[:5]}")
+
+    index = keyword_index.load_index([])
+    used = {i for entry in index.values() for i in entry['posts']}
+    if used != set(ids):
+        problems.append(f"keyword index lost {len(set(ids) - used)} use(s)")
+
+    queued = notify_queue.load_queue()['urls']
+    if len(queued) != expected:
+        problems.append(f"notification queue has {len(queued)} URL(s), expected {expected}")
+    return problems
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'stress':
+        found = stress(*(int(arg) for arg in sys.argv[2:4]))
+        for problem in found:
+            print(f"❌ {problem}")
+        if not found:
+            print("✅ Nothing lost: posts, ids, sent ids, sitemap entries, keyword uses and queued URLs all present")
+        sys.exit(1 if found else 0)
+    else:
+        print(__doc__)
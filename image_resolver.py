@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Hero Image Resolver for TurnitinPaperChecker
+Queries every configured provider at once and takes the first usable photo.
+
+- Providers race in parallel: worst-case latency is the slowest provider's
+  timeout, not the sum of all of them
+- Each provider's candidates are cached per normalised query (IMAGE_TTL),
+  so repeated search terms cost no API calls
+- A photo already used as a hero image by another post is skipped; the
+  used set comes from the `image` field of the blog manifest
+- Provider base URLs can be pointed at a local stub (`serve` below)
+
+Usage:
+    python image_resolver.py "turnitin ai detection"    # resolve one keyword
+    python image_resolver.py serve [port]               # local Unsplash/Pexels stub
+"""
+
+import os
+import sys
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import requests
+
+import response_cache
+
+# ===== CONFIGURATION =====
+UNSPLASH_API_URL = os.environ.get('UNSPLASH_API_URL', 'https://api.unsplash.com')
+PEXELS_API_URL = os.environ.get('PEXELS_API_URL', 'https://api.pexels.com')
+DEFAULT_IMAGE = "https://images.unsplash.com/photo-1456513080510-7bf3a84b82f8?w=800"
+CANDIDATES_PER_QUERY = 15
+REQUEST_TIMEOUT = 10
+# Provider name -> pooled requests.Session; blog_daemon.py keeps these open
+SESSIONS = {}
+
+# ===== PROVIDERS =====
+def _unsplash_query(keyword):
+    return ' '.join(keyword.split()[:3] + ['student', 'education'])
+
+def _pexels_query(keyword):
+    return ' '.join(keyword.split()[:3] + ['student'])
+
+def search_unsplash(query):
+    """Candidate image URLs from Unsplash, best match first"""
+    api_key = os.environ.get('UNSPLASH_ACCESS_KEY')
+    if not api_key:
+        return None
+    response = SESSIONS.get('unsplash', requests).get(
+        f"{UNSPLASH_API_URL}/search/photos",
+        headers={"Authorization": f"Client-ID {api_key}"},
+        params={"query": query, "per_page": CANDIDATES_PER_QUERY, "orientation": "landscape"},
+        timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code}")
+    return [photo['urls']['regular'] for photo in response.json().get('results', [])]
+
+def search_pexels(query):
+    """Candidate image URLs from Pexels, best match first"""
+    api_key = os.environ.get('PEXELS_API_KEY')
+    if not api_key:
+        return None
+    response = SESSIONS.get('pexels', requests).get(
+        f"{PEXELS_API_URL}/v1/search",
+        headers={"Authorization": api_key},
+        params={"query": query, "per_page": CANDIDATES_PER_QUERY, "orientation": "landscape"},
+        timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code}")
+    return [photo['src']['large'] for photo in response.json().get('photos', [])]
+
+# (name, query builder, search function) in order of preference
+PROVIDERS = [
+    ('unsplash', _unsplash_query, search_unsplash),
+    ('pexels', _pexels_query, search_pexels),
+]
+
+# ===== USED IMAGES =====
+def image_identity(url):
+    """Same photo with different size/tracking params counts as the same image"""
+    return url.split('?', 1)[0] if url else url
+
+def used_images(blogs):
+    return {image_identity(b.get('image')) for b in blogs if b.get('image')}
+
+def _first_unused(candidates, used):
+    for url in candidates or ():
+        if image_identity(url) not in used:
+            return url
+    return None
+
+# ===== RESOLVER =====
+def _cached(name, query):
+    value = response_cache.get(response_cache.image_key(name, query), response_cache.IMAGE_TTL)
+    # Entries written before candidate lists were cached hold a single URL
+    return [value] if isinstance(value, str) else value
+
+def _fetch(name, query, search):
+    """Query one provider and cache its candidate list"""
+    print(f"🔍 Searching {name.capitalize()}: {query}")
+    candidates = search(query)
+    if candidates:
+        response_cache.put(response_cache.image_key(name, query), candidates, provider=name, query=query)
+    return candidates
+
+def resolve(keyword, used=None, offline=False, providers=None):
+    """Hero image for keyword that no other post uses (DEFAULT_IMAGE as a last resort)"""
+    used = used if used is not None else set()
+    providers = providers or PROVIDERS
+
+    # Cached candidates first, in provider order - no network at all
+    pending = []
+    for name, build_query, search in providers:
+        query = build_query(keyword)
+        image = _first_unused(_cached(name, query), used)
+        if image:
+            return _claim(image, used)
+        pending.append((name, query, search))
+
+    if offline:
+        return _claim(DEFAULT_IMAGE, used)
+
+    # Race the providers; the first with an unused photo wins. Slower ones are
+    # left to finish in the background so their results still land in the cache.
+    executor = ThreadPoolExecutor(max_workers=len(pending))
+    futures = {executor.submit(_fetch, *p): p[0] for p in pending}
+    try:
+        for future in as_completed(futures):
+            try:
+                image = _first_unused(future.result(), used)
+            except Exception as e:
+                print(f"⚠️ {futures[future].capitalize()} error: {e}")
+                continue
+            if image:
+                print(f"📸 Image from {futures[future].capitalize()}")
+                return _claim(image, used)
+    finally:
+        executor.shutdown(wait=False)
+
+    print("📸 Using default")
+    return DEFAULT_IMAGE
+
+def _claim(image, used):
+    used.add(image_identity(image))
+    return image
+
+# ===== LOCAL STUB =====
+def serve(port=8766):
+    """Fake Unsplash + Pexels search APIs; each query gets its own photo URLs"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            query = params.get('query', [''])[0].replace(' ', '-')
+            count = int(params.get('per_page', ['5'])[0])
+            photos = [f"http://127.0.0.1:{port}/photos/{query}-{i}.jpg?w=1080" for i in range(count)]
+            if url.path == '/search/photos':
+                body = {'results': [{'urls': {'regular': p}} for p in photos]}
+            elif url.path == '/v1/search':
+                body = {'photos': [{'src': {'large': p}} for p in photos]}
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    print(f"🧪 Image provider stub on http://127.0.0.1:{port} "
+          f"(set UNSPLASH_API_URL and PEXELS_API_URL to it)")
+    HTTPServer(('127.0.0.1', port), Handler).serve_forever()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        serve(*(int(arg) for arg in sys.argv[2:3]))
+    elif len(sys.argv) > 1:
+        print(resolve(' '.join(sys.argv[1:])))
+    else:
+        print(__doc__)
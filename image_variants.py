@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Responsive Image Variants for TurnitinPaperChecker
+Generates AVIF/WebP copies of local images at several widths, so pages can
+offer a srcset instead of one full-size JPEG.
+
+- Variants go to assets/img/<stem>.<hash>-<width>.<format>; the content
+  hash in the name lets them be cached for a year like other assets
+- Widths above the original are skipped; the original width is always kept
+- Existing variants are not re-encoded, and are only removed once their
+  image was rebuilt without them (or dropped from IMAGES)
+- Needs Pillow (AVIF needs a Pillow build with libavif); without it, or
+  without an encoder, the variants already on disk are used as they are
+
+Usage:
+    python image_variants.py build
+"""
+
+import os
+import re
+import sys
+import hashlib
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+# ===== CONFIGURATION =====
+IMAGES = ['image1.jpeg', 'image2.jpeg', 'image3.jpeg']
+WIDTHS = (200, 400)        # screenshots are shown ~200px wide; 400 covers 2x screens
+FORMATS = (('avif', 'image/avif', {'quality': 55}), ('webp', 'image/webp', {'quality': 78, 'method': 6}))
+OUTPUT_DIR = os.path.join('assets', 'img')
+HASH_LENGTH = 10
+
+# ===== VARIANTS =====
+def available_formats():
+    if Image is None:
+        return []
+    return [f for f in FORMATS if features.check(f[0])]
+
+def stem_of(src):
+    return os.path.splitext(os.path.basename(src))[0]
+
+def variant_path(src, digest, width, fmt):
+    return f"{OUTPUT_DIR}/{stem_of(src)}.{digest}-{width}.{fmt}".replace(os.sep, '/')
+
+def source_digest(src):
+    with open(src, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+
+def existing_variants(src, digest, formats=FORMATS):
+    """{mime: [(width, path), ...]} already on disk for this version of src (no Pillow needed)"""
+    if not os.path.isdir(OUTPUT_DIR):
+        return {}
+    mimes = {fmt: mime for fmt, mime, _ in formats}
+    pattern = re.compile(r'%s\.%s-(\d+)\.(\w+)$' % (re.escape(stem_of(src)), digest))
+    variants = {}
+    for name in os.listdir(OUTPUT_DIR):
+        m = pattern.match(name)
+        if m and m.group(2) in mimes:
+            variants.setdefault(mimes[m.group(2)], []).append((int(m.group(1)), f"{OUTPUT_DIR}/{name}"))
+    return {mime: sorted(variants[mime]) for _, mime, _ in formats if mime in variants}
+
+def build_image(src, widths=WIDTHS):
+    """{mime: [(width, path), ...]} for one image, encoding only missing variants
+
+    Formats this Pillow can't encode keep whatever variants are already on disk.
+    """
+    digest = source_digest(src)
+    encodable = available_formats()
+    variants = existing_variants(src, digest, [f for f in FORMATS if f not in encodable])
+    with Image.open(src) as image:
+        image.load()
+        original = image.width
+        sizes = sorted({w for w in widths if w < original} | {original})
+        for fmt, mime, options in encodable:
+            for width in sizes:
+                path = variant_path(src, digest, width, fmt)
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    height = round(image.height * width / original)
+                    resized = image if width == original else image.resize((width, height), Image.LANCZOS)
+                    resized.convert('RGB').save(f"{path}.tmp", fmt.upper(), **options)
+                    os.replace(f"{path}.tmp", path)
+                variants.setdefault(mime, []).append((width, path))
+    return {mime: variants[mime] for _, mime, _ in FORMATS if mime in variants}   # <source> order
+
+def build(images=IMAGES):
+    """{src: {mime: [(width, path), ...]}} for every local image with variants
+
+    Sources that could not be processed (no Pillow, an encoder error) fall
+    back to their variants already on disk; only rebuilt sources lose stale ones.
+    """
+    if Image is None:
+        print("⚠️ Pillow not installed: keeping existing responsive images (pip install pillow)")
+    result = {}
+    for src in images:
+        try:
+            if Image is None:
+                variants = existing_variants(src, source_digest(src))
+            else:
+                variants = build_image(src)
+                prune_source(src, variants)
+        except Exception as e:
+            print(f"⚠️ Image variants failed for {src}: {e}")
+            try:
+                variants = existing_variants(src, source_digest(src))
+            except OSError:
+                variants = {}
+        if variants:
+            result[src] = variants
+    return result
+
+def prune_source(src, variants):
+    """Remove variants of src that were not just produced (the image changed)"""
+    keep = {path for paths in variants.values() for _, path in paths}
+    prefix = f"{stem_of(src)}."
+    removed = 0
+    for name in os.listdir(OUTPUT_DIR) if os.path.isdir(OUTPUT_DIR) else []:
+        path = f"{OUTPUT_DIR}/{name}"
+        if name.startswith(prefix) and path not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+def prune(images=IMAGES):
+    """Remove variants of images no longer in `images`; nothing without Pillow"""
+    if Image is None or not os.path.isdir(OUTPUT_DIR):
+        return 0
+    prefixes = tuple(f"{stem_of(src)}." for src in images)
+    removed = 0
+    for name in os.listdir(OUTPUT_DIR):
+        if not name.startswith(prefixes):
+            os.remove(f"{OUTPUT_DIR}/{name}")
+            removed += 1
+    return removed
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'build':
+        result = build()
+        prune()
+        for src, variants in result.items():
+            for mime, paths in variants.items():
+                sizes = ', '.join(f"{w}w {os.path.getsize(p) / 1024:.0f} KB" for w, p in paths)
+                print(f"🖼️ {src} {mime}: {sizes} (original {os.path.getsize(src) / 1024:.0f} KB)")
+    else:
+        print(__doc__)
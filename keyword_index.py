@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Keyword Usage Index for TurnitinPaperChecker
+Persisted keyword -> post ids / last-used date map, written on every
+publish so picking the next keyword no longer rescans every blog title.
+
+Selection is a priority queue: never-used keywords first, then the least
+recently used, then higher weight (optional "weights" map in keywords.json),
+then queue order.
+
+Usage:
+    python keyword_index.py rebuild   # rebuild keyword-index.json from the blog store
+"""
+
+import sys
+import json
+import heapq
+from datetime import datetime
+
+import blog_loader
+import file_store
+
+# ===== CONFIGURATION =====
+INDEX_FILE = 'keyword-index.json'
+DEFAULT_WEIGHT = 1.0
+
+def normalize(keyword):
+    """Index key for a keyword"""
+    return ' '.join(keyword.lower().split())
+
+def _blog_day(blog):
+    try:
+        return datetime.strptime(blog['date'], '%B %d, %Y').strftime('%Y-%m-%d')
+    except Exception:
+        return ''
+
+# ===== LOAD / SAVE =====
+def load_index(keywords=None):
+    """Load the index, rebuilding it from the corpus when missing"""
+    try:
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('keywords', {})
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️ Error loading keyword index: {e}")
+    return rebuild_index(keywords)
+
+def save_index(index):
+    file_store.write_json(INDEX_FILE, {
+        'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'keywords': index
+    })
+
+def rebuild_index(keywords=None, blogs=None):
+    """Rebuild from the blog store (one pass over the manifest)"""
+    if keywords is None:
+        keywords = load_queue()
+    if blogs is None:
+        blogs = blog_loader.load_index()
+
+    # Older posts don't record their keyword, so fall back to the old
+    # title match for those - done once here instead of on every run
+    by_norm = {normalize(kw): kw for kw in keywords}
+    index = {}
+    for blog in blogs:
+        used = [normalize(blog['keyword'])] if blog.get('keyword') else \
+            [k for k in by_norm if k in blog.get('title', '').lower()]
+        for key in used:
+            _record(index, key, blog.get('id'), _blog_day(blog))
+
+    save_index(index)
+    print(f"✅ Keyword index rebuilt: {len(index)} keywords from {len(blogs)} posts")
+    return index
+
+def load_queue(path='keywords.json'):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('queue', [])
+    except Exception:
+        return []
+
+def load_weights(path='keywords.json'):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {normalize(k): float(v) for k, v in json.load(f).get('weights', {}).items()}
+    except Exception:
+        return {}
+
+# ===== UPDATE / LOOKUP =====
+def _record(index, key, blog_id, day):
+    entry = index.setdefault(key, {'posts': [], 'last_used': ''})
+    if blog_id is not None and blog_id not in entry['posts']:
+        entry['posts'].append(blog_id)
+    if day > entry['last_used']:
+        entry['last_used'] = day
+
+def record_use(keyword, blog_id, day=None, index=None):
+    """Mark keyword as used by blog_id and persist"""
+    return record_uses([(keyword, blog_id)], day, index)
+
+def record_uses(pairs, day=None, index=None):
+    """Mark (keyword, blog_id) pairs as used with a single index write
+
+    Without `index` the file is re-read under its lock, so uses recorded by
+    an overlapping run are kept.
+    """
+    with file_store.lock(INDEX_FILE):
+        if index is None:
+            index = load_index()
+        day = day or datetime.now().strftime('%Y-%m-%d')
+        for keyword, blog_id in pairs:
+            _record(index, normalize(keyword), blog_id, day)
+        save_index(index)
+    return index
+
+def lookup(index, keyword):
+    """O(1) usage lookup: {'posts': [...], 'last_used': 'YYYY-MM-DD'} or None"""
+    return index.get(normalize(keyword))
+
+# ===== SELECTION =====
+def keyword_queue(keywords, index, weights=None):
+    """Heap of (last_used, -weight, position, keyword); '' sorts never-used first"""
+    weights = weights or {}
+    heap = []
+    seen = set()
+    for pos, kw in enumerate(keywords):
+        key = normalize(kw)
+        if key in seen:
+            continue
+        seen.add(key)
+        entry = index.get(key)
+        heap.append((entry['last_used'] if entry else '',
+                     -weights.get(key, DEFAULT_WEIGHT), pos, kw))
+    heapq.heapify(heap)
+    return heap
+
+def pick_keywords(keywords, index, count=1, weights=None):
+    """Next `count` distinct keywords in priority order"""
+    heap = keyword_queue(keywords, index, weights)
+    return [heapq.heappop(heap)[-1] for _ in range(min(count, len(heap)))]
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'rebuild':
+        rebuild_index()
+    else:
+        print(__doc__)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Search-Engine Notification Queue for TurnitinPaperChecker
+Changed URLs (new/updated posts, sitemap files) are queued on disk,
+deduplicated, and flushed to IndexNow as batched `urlList` submissions.
+Failed URLs stay queued with exponential backoff and are retried on the
+next run, so publishing never waits on (or loses) a notification.
+
+Usage:
+    python notify_queue.py flush    # submit everything that is due
+    python notify_queue.py status
+    python notify_queue.py serve [port] [status]   # local IndexNow stand-in
+
+Point INDEXNOW_ENDPOINT at the stand-in (http://127.0.0.1:8765/indexnow)
+to exercise batching and backoff without talking to a search engine.
+"""
+
+import os
+import sys
+import json
+import time
+
+import file_store
+
+# ===== CONFIGURATION =====
+QUEUE_FILE = 'notify-queue.json'
+WEBSITE_URL = "https://www.turnitinpaperchecker.com/"
+WEBSITE_HOST = "www.turnitinpaperchecker.com"
+INDEXNOW_ENDPOINT = os.environ.get('INDEXNOW_ENDPOINT', 'https://api.indexnow.org/indexnow')
+MAX_URLS_PER_REQUEST = 10000   # IndexNow protocol limit
+BACKOFF_SECONDS = 300
+MAX_BACKOFF_SECONDS = 24 * 3600
+MAX_ATTEMPTS = 12
+REQUEST_TIMEOUT = 10
+
+# ===== QUEUE FILE =====
+def load_queue():
+    try:
+        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'urls': {}}
+    except Exception as e:
+        print(f"⚠️ Error loading notification queue: {e}")
+        return {'urls': {}}
+
+def save_queue(queue):
+    file_store.write_json(QUEUE_FILE, queue, sort_keys=True)
+
+def enqueue(urls):
+    """Add URLs (duplicates collapse); a re-queued URL becomes due immediately"""
+    with file_store.lock(QUEUE_FILE):
+        queue = load_queue()
+        now = time.time()
+        for url in urls:
+            entry = queue['urls'].setdefault(url, {'added': now, 'attempts': 0})
+            entry['next_attempt'] = now
+        save_queue(queue)
+    return len(queue['urls'])
+
+def due_urls(queue, now=None):
+    now = now or time.time()
+    return sorted((url for url, e in queue['urls'].items() if e.get('next_attempt', 0) <= now),
+                  key=lambda url: queue['urls'][url]['added'])
+
+# ===== SUBMISSION =====
+def _submit(urls, api_key, session):
+    payload = {
+        "host": WEBSITE_HOST,
+        "key": api_key,
+        "keyLocation": f"{WEBSITE_URL}{api_key}.txt",
+        "urlList": urls
+    }
+    response = session.post(
+        INDEXNOW_ENDPOINT,
+        json=payload,
+        headers={"Content-Type": "application/json; charset=utf-8"},
+        timeout=REQUEST_TIMEOUT
+    )
+    return response.status_code
+
+def _backoff(entry, error, now):
+    entry['attempts'] = entry.get('attempts', 0) + 1
+    entry['last_error'] = error
+    delay = min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * (2 ** (entry['attempts'] - 1)))
+    entry['next_attempt'] = now + delay
+
+def flush(api_key=None, batch_size=MAX_URLS_PER_REQUEST, session=None):
+    """Submit due URLs in batches; returns (sent, still_queued)
+
+    The queue is locked only to read the due URLs and to apply the
+    outcome, not across the HTTP calls; URLs enqueued meanwhile are kept.
+    session: a caller-owned requests.Session to reuse (left open)
+    """
+    api_key = api_key or os.environ.get('INDEXNOW_API_KEY')
+    with file_store.lock(QUEUE_FILE):
+        queue = load_queue()
+    if not api_key:
+        return 0, len(queue['urls'])
+
+    now = time.time()
+    urls = due_urls(queue, now)
+    done, failed = [], set()   # sent or dropped; to back off
+    sent = 0
+    own_session = session is None
+    if own_session and urls:
+        import requests   # ~100 ms: only paid when something is actually sent
+        session = requests.Session()
+    try:
+        for start in range(0, len(urls), batch_size):
+            batch = urls[start:start + batch_size]
+            try:
+                status = _submit(batch, api_key, session)
+                error = None if status in (200, 202) else f"HTTP {status}"
+            except Exception as e:
+                status, error = None, str(e)
+
+            if error is None:
+                done += batch
+                sent += len(batch)
+                print(f"📡 IndexNow accepted {len(batch)} URL(s)")
+            elif status == 422:
+                # URLs don't belong to the host/key - retrying can't help
+                done += batch
+                print(f"⚠️ IndexNow rejected {len(batch)} URL(s) (422), dropped")
+            else:
+                # Same endpoint, same outcome: back off everything still due
+                failed = set(urls[start:])
+                print(f"⚠️ IndexNow error ({error}); {len(failed)} URL(s) kept for retry")
+                break
+    finally:
+        if own_session and urls:
+            session.close()
+
+    with file_store.lock(QUEUE_FILE):
+        queue = load_queue()
+        for url in [*done, *failed]:
+            entry = queue['urls'].get(url)
+            if entry is None or entry['next_attempt'] > now:
+                continue   # re-queued while we were sending
+            if url in failed:
+                _backoff(entry, error, now)
+                if entry['attempts'] < MAX_ATTEMPTS:
+                    continue
+                print(f"⚠️ Giving up on {url} after {entry['attempts']} attempts")
+            del queue['urls'][url]
+        save_queue(queue)
+    return sent, len(queue['urls'])
+
+# ===== LOCAL STAND-IN =====
+def serve(port=8765, status=200):
+    """Tiny IndexNow endpoint that logs each submission and answers with `status`"""
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            print(f"📨 {len(body.get('urlList', []))} URL(s) for {body.get('host')}")
+            self.send_response(status)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    print(f"🧪 IndexNow stand-in on http://127.0.0.1:{port}/indexnow (HTTP {status})")
+    HTTPServer(('127.0.0.1', port), Handler).serve_forever()
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'flush':
+        sent, left = flush()
+        print(f"✅ Sent {sent} URL(s), {left} still queued")
+    elif command == 'status':
+        queue = load_queue()
+        print(f"{len(queue['urls'])} queued, {len(due_urls(queue))} due")
+    elif command == 'serve':
+        serve(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        print(__doc__)
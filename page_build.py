@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Page Build for TurnitinPaperChecker
+Builds the served index.html from src/index.html with its CSS/JS slimmed.
+
+- <style> blocks in <head> are minified into one fingerprinted stylesheet
+  that loads without blocking; only the rules the first screen needs
+  (critical CSS) stay inline
+- Inline scripts over EXTRACT_BYTES are minified into fingerprinted files
+  at the same position; smaller ones are minified in place
+- <img> tags pointing at local images get <picture> AVIF/WebP sources with
+  srcset (image_variants.py)
+- The homepage's latest-posts grid is filled from blogs/latest.html, written
+  by blog-generator.py, instead of loading every post through blogs-data.js
+- report() compares bytes and parse time of each page before and after
+
+Edit src/index.html; index.html is overwritten by every asset build
+(python asset_build.py build), which runs this module.
+
+Usage:
+    python page_build.py report [baseline.html]   # baseline defaults to the source page
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import html
+import time
+import hashlib
+from html.parser import HTMLParser
+
+import asset_build
+import file_store
+import image_variants
+
+# ===== CONFIGURATION =====
+PAGES = {'src/index.html': 'index.html'}
+OUTPUT_DIR = asset_build.OUTPUT_DIR
+LATEST_FRAGMENT = os.path.join('blogs', 'latest.html')
+LATEST_COUNT = 3
+EXTRACT_BYTES = 4096       # smaller inline scripts are not worth a request
+CRITICAL_HTML_CHARS = 20000   # body markup treated as "above the fold"
+IMAGE_SIZES = '200px'
+REPORT_FILE = 'page-report.json'
+HASH_LENGTH = asset_build.HASH_LENGTH
+
+LATEST_START = '<!-- latest-posts -->'
+LATEST_END = '<!-- /latest-posts -->'
+BUILD_NOTE = '<!-- Built by page_build.py from {source}: edit that file, not this one -->'
+
+_STYLE = re.compile(r'<style>(.*?)</style>\s*', re.S)
+_SCRIPT = re.compile(r'<script(\s[^>]*)?>(.*?)</script>', re.S)
+_IMG = re.compile(r'<img\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+_SRC = re.compile(r'\ssrc="([^"]+)"')
+
+# ===== CSS =====
+def minify_css(css):
+    """Drop comments and redundant whitespace (strings are left alone)"""
+    out = []
+    for n, part in enumerate(re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', css)):
+        if n % 2:
+            out.append(part)
+            continue
+        part = re.sub(r'/\*.*?\*/', '', part, flags=re.S)
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        part = re.sub(r':\s+', ':', part)
+        out.append(part.replace(';}', '}'))
+    return ''.join(out).strip()
+
+def _css_blocks(css):
+    """Split minified CSS into (prelude, body) blocks at the top level"""
+    blocks, depth, start, prelude_end = [], 0, 0, None
+    for i, c in enumerate(css):
+        if c == '{':
+            if depth == 0:
+                prelude_end = i
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append((css[start:prelude_end].strip(), css[prelude_end + 1:i]))
+                start = i + 1
+        elif c == ';' and depth == 0:
+            blocks.append((css[start:i].strip(), None))   # @import / @charset
+            start = i + 1
+    return blocks
+
+_SIMPLE = re.compile(r'([.#]?)(-?[_a-zA-Z][\w-]*)')
+
+def _selector_matches(selector, tokens):
+    selector = re.sub(r'::?[\w-]+(\([^)]*\))?|\[[^\]]*\]', '', selector)
+    for compound in re.split(r'[\s>+~]+', selector.strip()):
+        for prefix, name in _SIMPLE.findall(compound):
+            kind = {'.': 'class', '#': 'id', '': 'tag'}[prefix]
+            if name.lower() not in tokens[kind]:
+                return False
+    return True
+
+def critical_css(css, above_fold_html):
+    """Rules whose selectors can match something in the first screen of markup"""
+    tokens = {
+        'class': {c.lower() for attr in re.findall(r'class="([^"]*)"', above_fold_html) for c in attr.split()},
+        'id': {i.lower() for i in re.findall(r'id="([^"]*)"', above_fold_html)},
+        'tag': {t.lower() for t in re.findall(r'<([a-zA-Z][\w-]*)', above_fold_html)} | {'html', 'body'},
+    }
+
+    def select(text):
+        out = []
+        for prelude, body in _css_blocks(text):
+            if body is None:
+                out.append(prelude + ';')
+            elif prelude.startswith('@media') or prelude.startswith('@supports'):
+                inner = select(body)
+                if inner:
+                    out.append(f"{prelude}{{{inner}}}")
+            elif prelude.startswith('@'):
+                continue   # keyframes, font-face: come with the full stylesheet
+            elif any(s.strip() in ('*', ':root') or _selector_matches(s, tokens) for s in prelude.split(',')):
+                out.append(f"{prelude}{{{body}}}")
+        return ''.join(out)
+
+    return select(css)
+
+# ===== JS =====
+_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'}
+
+def minify_js(js):
+    """Strip comments, indentation and blank lines; newlines are kept so ASI is untouched"""
+    out = []
+    i, n = 0, len(js)
+    templates = []   # brace depth at each open ${ ... }
+    depth = 0
+
+    def last_significant():
+        for chunk in reversed(out):
+            stripped = chunk.rstrip()
+            if stripped:
+                return stripped
+        return ''
+
+    while i < n:
+        c = js[i]
+        if c in ' \t\r\n':
+            j = i
+            while j < n and js[j] in ' \t\r\n':
+                j += 1
+            gap = js[i:j]
+            if out and not out[-1].endswith('\n'):
+                out.append('\n' if '\n' in gap else ' ')
+            i = j
+        elif js.startswith('//', i):
+            while i < n and js[i] != '\n':
+                i += 1
+        elif js.startswith('/*', i):
+            end = js.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            if out and not out[-1].endswith(('\n', ' ')):
+                out.append(' ')
+        elif c in '"\'':
+            j = i + 1
+            while j < n and js[j] != c:
+                j += 2 if js[j] == '\\' else 1
+            out.append(js[i:j + 1])
+            i = j + 1
+        elif c == '`' or (c == '}' and templates and templates[-1] == depth):
+            # Template literal text (or its continuation after ${...}), verbatim
+            if c == '}':
+                templates.pop()
+            j = i + 1
+            while j < n:
+                if js[j] == '\\':
+                    j += 2
+                elif js[j] == '`':
+                    j += 1
+                    break
+                elif js.startswith('${', j):
+                    j += 2
+                    templates.append(depth)
+                    break
+                else:
+                    j += 1
+            out.append(js[i:j])
+            i = j
+        elif c == '/':
+            prev = last_significant()
+            word = re.search(r'[\w$]+$', prev)
+            if not prev or prev[-1] in _REGEX_AFTER or (word and word.group() in _REGEX_KEYWORDS):
+                j, in_class = i + 1, False
+                while j < n and (in_class or js[j] != '/') and js[j] != '\n':
+                    if js[j] == '\\':
+                        j += 1
+                    elif js[j] == '[':
+                        in_class = True
+                    elif js[j] == ']':
+                        in_class = False
+                    j += 1
+                j += 1
+                while j < n and (js[j].isalnum()):
+                    j += 1   # flags
+                out.append(js[i:j])
+                i = j
+            else:
+                out.append(c)
+                i += 1
+        else:
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+            out.append(c)
+            i += 1
+    return ''.join(out).strip()
+
+# ===== IMAGES =====
+def picture(tag, src, variants):
+    """<img> wrapped in <picture> with one srcset per modern format"""
+    sources = ''.join(
+        f'<source type="{mime}" srcset="{", ".join(f"{path} {w}w" for w, path in paths)}" sizes="{IMAGE_SIZES}">'
+        for mime, paths in variants.items())
+    return f"<picture>{sources}{tag}</picture>"
+
+def add_srcsets(text, images):
+    def replace(m):
+        src = _SRC.search(m.group(0))
+        if src and images.get(src.group(1)):
+            return picture(m.group(0), src.group(1), images[src.group(1)])
+        return m.group(0)
+    return _IMG.sub(replace, text)
+
+# ===== LATEST POSTS =====
+def latest_fragment(manifest, count=LATEST_COUNT):
+    """Cards for the newest posts, in the markup the homepage script used to build"""
+    cards = []
+    for blog in sorted(manifest, key=lambda b: b['id'], reverse=True)[:count]:
+        title = html.escape(blog['title'])
+        cards.append(f"""<div class="service-card fade-in">
+    <div style="height: 200px; overflow: hidden; border-radius: 10px; margin-bottom: 1rem;">
+        <img src="{html.escape(blog.get('image', ''))}" alt="{title}" style="width: 100%; height: 100%; object-fit: cover;" loading="lazy">
+    </div>
+    <h3>{title}</h3>
+    <p>{blog.get('excerpt', '')}</p>
+    <div style="color: #666; font-size: 0.9rem; margin: 1rem 0;">
+        {html.escape(blog.get('date', ''))} • {blog.get('readTime', '')} min read
+    </div>
+    <a href="articles/{blog['slug']}-{blog['id']}.html" class="btn-primary">Read More</a>
+</div>""")
+    return '\n'.join(cards) + '\n'
+
+def write_latest(manifest, path=LATEST_FRAGMENT):
+    """Write blogs/latest.html; True when it changed"""
+    fragment = latest_fragment(manifest)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == fragment:
+                return False
+    except OSError:
+        pass
+    file_store.atomic_write(path, fragment)
+    return True
+
+def insert_latest(text, path=LATEST_FRAGMENT):
+    if LATEST_START not in text:
+        return text
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            fragment = f.read()
+    except OSError:
+        fragment = ''
+    head, rest = text.split(LATEST_START, 1)
+    tail = rest.split(LATEST_END, 1)[1]
+    return f"{head}{LATEST_START}\n{fragment}{LATEST_END}{tail}"
+
+# ===== BUILD =====
+def fingerprint(data, stem, ext):
+    digest = hashlib.sha256(data.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    return f"{OUTPUT_DIR}/{stem}.{digest}{ext}"
+
+def _emit(path, data, written):
+    # The name is the content hash: an existing file is already right
+    if not asset_build.emitted(path):
+        asset_build.emit(path, data.encode('utf-8'))
+        written.append(path)
+
+def build_page(source, target, paths=None, images=None):
+    """Build one page; returns (files written, extracted asset paths)
+
+    paths: {asset: fingerprinted path} from asset_build, applied to the
+    source's references before anything is extracted.
+    """
+    with open(source, 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = asset_build.rewrite_text(text, paths or {})
+    text = insert_latest(text)
+    stem = os.path.splitext(os.path.basename(target))[0]
+    written, assets = [], []
+
+    # Head styles -> critical inline CSS + one async stylesheet
+    head_end = text.index('</head>')
+    head, body = text[:head_end], text[head_end:]
+    css = minify_css('\n'.join(m.group(1) for m in _STYLE.finditer(head)))
+    if css:
+        visible = _SCRIPT.sub('', _STYLE.sub('', body))[:CRITICAL_HTML_CHARS]
+        path = fingerprint(css, stem, '.css')
+        _emit(path, css, written)
+        assets.append(path)
+        first = _STYLE.search(head)
+        links = (f'<style>{critical_css(css, visible)}</style>\n    '
+                 f'<link rel="stylesheet" href="{path}" media="print" onload="this.media=\'all\'">\n    '
+                 f'<noscript><link rel="stylesheet" href="{path}"></noscript>\n    ')
+        head = head[:first.start()] + links + _STYLE.sub('', head[first.start():])
+    text = head + body
+
+    # Body styles stay in place (cascade order), minified
+    text = text[:len(head)] + _STYLE.sub(lambda m: f"<style>{minify_css(m.group(1))}</style>\n", text[len(head):])
+
+    # Scripts: JSON-LD compacted, classic scripts minified and the big ones extracted
+    count = [0]
+
+    def script(m):
+        attrs, code = m.group(1) or '', m.group(2)
+        if 'src=' in attrs or not code.strip():
+            return m.group(0)
+        if 'application/ld+json' in attrs:
+            try:
+                return f"<script{attrs}>{json.dumps(json.loads(code), ensure_ascii=False, separators=(',', ':'))}</script>"
+            except ValueError:
+                return m.group(0)
+        if 'type=' in attrs and 'javascript' not in attrs:
+            return m.group(0)
+        code = minify_js(code)
+        if len(code) < EXTRACT_BYTES:
+            return f"<script{attrs}>{code}</script>"
+        count[0] += 1
+        path = fingerprint(code, f"{stem}-{count[0]}", '.js')
+        _emit(path, code, written)
+        assets.append(path)
+        return f'<script src="{path}"></script>'
+
+    text = _SCRIPT.sub(script, text)
+    text = add_srcsets(text, images or {})
+    text = text.replace('<!DOCTYPE html>', '<!DOCTYPE html>\n' + BUILD_NOTE.format(source=source), 1)
+
+    try:
+        with open(target, 'r', encoding='utf-8') as f:
+            unchanged = f.read() == text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        file_store.atomic_write(target, text)
+        written.append(target)
+    return written, assets
+
+def build(paths=None, pages=PAGES):
+    """Build every page; returns (files written, asset paths now in use)"""
+    images = image_variants.build()
+    written, assets = [], []
+    for source, target in pages.items():
+        w, a = build_page(source, target, paths, images)
+        written += w
+        assets += a
+    # Extracted files from earlier builds that no page references any more
+    live = set(assets)
+    stems = tuple(f"{os.path.splitext(os.path.basename(t))[0]}" for t in pages.values())
+    if os.path.isdir(OUTPUT_DIR):
+        for name in os.listdir(OUTPUT_DIR):
+            path = f"{OUTPUT_DIR}/{name}"
+            base = re.sub(r'\.(gz|br)$', '', path)
+            if (name.startswith(stems) and re.search(r'\.[0-9a-f]{%d}\.(css|js)(\.gz|\.br)?$' % HASH_LENGTH, name)
+                    and base not in live):
+                os.remove(path)
+    image_variants.prune()
+    return written, assets + [p for v in images.values() for paths in v.values() for _, p in paths]
+
+# ===== REPORT =====
+class _Counter(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.elements = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.elements += 1
+
+def _blocking_bytes(text):
+    """Render-blocking bytes: <head> CSS and synchronous scripts (inline or external)"""
+    text = re.sub(r'<noscript>.*?</noscript>', '', text[:text.find('</head>')], flags=re.S)
+    total = sum(len(m.group(1).encode('utf-8')) for m in _STYLE.finditer(text))
+    for m in _SCRIPT.finditer(text):
+        attrs = m.group(1) or ''
+        src = re.search(r'src="([^"]+)"', attrs)
+        if src and not re.search(r'\b(async|defer)\b', attrs):
+            if os.path.exists(src.group(1)):
+                total += os.path.getsize(src.group(1))
+        elif not src and 'ld+json' not in attrs:
+            total += len(m.group(2).encode('utf-8'))
+    for href in re.findall(r'<link rel="stylesheet" href="([^"]+)"(?![^>]*media="print")', text):
+        if os.path.exists(href):
+            total += os.path.getsize(href)
+    return total
+
+def measure(path, runs=5):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        parser = _Counter()
+        parser.feed(text)
+        parser.close()
+        timings.append(time.perf_counter() - started)
+    raw = text.encode('utf-8')
+    return {'bytes': len(raw), 'gzip': len(gzip.compress(raw, 9)), 'blocking': _blocking_bytes(text),
+            'elements': parser.elements, 'parse_ms': round(sorted(timings)[len(timings) // 2] * 1000, 2)}
+
+def report(pages=PAGES, path=REPORT_FILE, baseline=None):
+    """Bytes and HTML parse time (html.parser, median of 5) per page, source (or baseline) vs built"""
+    result = {}
+    for source, target in pages.items():
+        before, after = measure(baseline or source), measure(target)
+        result[target] = {'before': before, 'after': after}
+        print(f"📄 {target}: {before['bytes'] / 1024:,.0f} KB -> {after['bytes'] / 1024:,.0f} KB "
+              f"({before['gzip'] / 1024:,.0f} -> {after['gzip'] / 1024:,.0f} KB gzip), "
+              f"render-blocking {before['blocking'] / 1024:,.0f} -> {after['blocking'] / 1024:,.0f} KB, "
+              f"parse {before['parse_ms']} -> {after['parse_ms']} ms")
+    file_store.write_json(path, result)
+    return result
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'report':
+        report(baseline=sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        print(__doc__)
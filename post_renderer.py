@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Static Post Pages for TurnitinPaperChecker
+Pre-renders every post into articles/<slug>-<id>.html at publish time, so
+readers and crawlers get the article, meta description, OpenGraph tags and
+JSON-LD in the HTML instead of an empty shell filled in by JavaScript.
+
+- blog-post.html is the template: its placeholders are filled in and its
+  relative links are pointed one directory up
+- Each page's hash (template + post fields) is kept in render-state.json;
+  posts whose hash did not change are not rewritten
+- Each page carries its related posts (related_posts.py) in #postData, so
+  it needs no listing fetch; a page whose related list changes is re-rendered
+- Full rebuilds render across all cores (one process per chunk of posts)
+- blog-post.html?id=N keeps working and redirects to the static page
+
+Usage:
+    python post_renderer.py build          # render changed posts
+    python post_renderer.py build --full   # ignore hashes, re-render everything
+"""
+
+import os
+import re
+import sys
+import json
+import html
+import hashlib
+
+import blog_store
+import file_store
+import related_posts
+from sitemap_builder import to_w3c_date
+
+# ===== CONFIGURATION =====
+TEMPLATE_FILE = 'blog-post.html'
+OUTPUT_DIR = 'articles'
+STATE_FILE = 'render-state.json'
+WEBSITE_URL = "https://www.turnitinpaperchecker.com/"
+PARALLEL_THRESHOLD = 64    # below this many posts, forking workers costs more than it saves
+CHUNK_SIZE = 50
+
+_TAG = re.compile(r'<[^>]*>?')
+_RELATIVE = re.compile(r'(\s(?:href|src)=")(?!https?:|#|/|data:|mailto:|javascript:|\$\{|\.\./)')
+_SCHEMA = re.compile(r'<script type="application/ld\+json" id="blogPostSchema">.*?</script>', re.S)
+_CONTENT = re.compile(r'<div id="blogContent">\s*<p>Loading article content\.\.\.</p>\s*</div>')
+
+# ===== PATHS =====
+def post_path(blog):
+    return f"{OUTPUT_DIR}/{blog['slug']}-{blog['id']}.html"
+
+def post_url(website_url, blog):
+    """Same signature as sitemap_builder.default_post_url"""
+    return f"{website_url}{post_path(blog)}"
+
+# ===== TEMPLATE =====
+def _plain(text):
+    return ' '.join(html.unescape(_TAG.sub(' ', text or '')).split())
+
+def _script_json(data):
+    # "</" would close the <script> element early
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+class PageTemplate:
+    """blog-post.html prepared for pages one directory below the site root"""
+
+    def __init__(self, path=TEMPLATE_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        # The file carries stray wrapper lines outside the document
+        text = text[text.index('<!DOCTYPE html>'):text.rindex('</html>') + len('</html>')] + '\n'
+        text = _RELATIVE.sub(r'\1../', text)
+        text = text.replace("const SITE_ROOT = '';", "const SITE_ROOT = '../';")
+        for marker in ('<title>Blog Post - TurnitinPaperChecker</title>', '<h1 id="blogTitle">Loading...</h1>',
+                       '<span id="blogAuthor">✍️ TurnitinPaperChecker Team</span>',
+                       '<span id="blogDate">📅 Loading...</span>', '<span id="blogReadTime">⏱️ Loading...</span>',
+                       '<img id="blogImage" class="blog-featured-image" alt="" loading="lazy">',
+                       "const SITE_ROOT = '../';"):
+            if marker not in text:
+                raise ValueError(f"{path} no longer contains {marker!r}")
+        if not _SCHEMA.search(text) or not _CONTENT.search(text):
+            raise ValueError(f"{path} no longer has the schema/content placeholders")
+        self.text = text
+        self.hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def page_hash(self, blog):
+        fields = {k: blog.get(k) for k in ('id', 'slug', 'title', 'content', 'excerpt', 'meta', 'image',
+                                           'date', 'updated', 'author', 'readTime', 'category', 'tags',
+                                           'related')}
+        return hashlib.sha256((self.hash + json.dumps(fields, sort_keys=True)).encode('utf-8')).hexdigest()
+
+    def render(self, blog):
+        url = post_url(WEBSITE_URL, blog)
+        title = html.escape(blog['title'])
+        author = blog.get('author') or 'TurnitinPaperChecker Team'
+        description = _plain(blog.get('meta') or blog.get('excerpt', ''))[:300]
+        published = to_w3c_date(blog.get('date', ''))
+        modified = to_w3c_date(blog.get('updated') or blog.get('date', ''))
+
+        head = '\n    '.join([
+            f'<title>{title} - TurnitinPaperChecker</title>',
+            f'<meta name="description" content="{html.escape(description)}">',
+            f'<link rel="canonical" href="{html.escape(url)}">',
+            '<meta property="og:type" content="article">',
+            '<meta property="og:site_name" content="TurnitinPaperChecker">',
+            f'<meta property="og:title" content="{title}">',
+            f'<meta property="og:description" content="{html.escape(description)}">',
+            f'<meta property="og:image" content="{html.escape(blog.get("image", ""))}">',
+            f'<meta property="og:url" content="{html.escape(url)}">',
+            f'<meta property="article:published_time" content="{published}">',
+            f'<meta property="article:modified_time" content="{modified}">',
+            '<meta name="twitter:card" content="summary_large_image">',
+        ])
+        schema = {
+            "@context": "https://schema.org",
+            "@type": "BlogPosting",
+            "headline": blog['title'],
+            "image": blog.get('image', ''),
+            "datePublished": published,
+            "dateModified": modified,
+            "author": {"@type": "Organization", "name": author},
+            "publisher": {
+                "@type": "Organization",
+                "name": "TurnitinPaperChecker",
+                "logo": {"@type": "ImageObject", "url": f"{WEBSITE_URL}images/logo.png"}
+            },
+            "description": description,
+            "mainEntityOfPage": {"@type": "WebPage", "@id": url}
+        }
+        if blog.get('tags'):
+            schema['keywords'] = ', '.join(blog['tags'])
+        # What the page script needs for related posts and tracking (no content)
+        post_data = {k: blog.get(k) for k in ('id', 'slug', 'title', 'date', 'readTime', 'category', 'tags',
+                                              'related')}
+
+        text = self.text.replace('<title>Blog Post - TurnitinPaperChecker</title>', head, 1)
+        text = _SCHEMA.sub(lambda m: '<script type="application/ld+json" id="blogPostSchema">\n    '
+                           + _script_json(schema) + '\n    </script>', text, 1)
+        text = text.replace('<h1 id="blogTitle">Loading...</h1>', f'<h1 id="blogTitle">{title}</h1>', 1)
+        text = text.replace('<span id="blogAuthor">✍️ TurnitinPaperChecker Team</span>',
+                            f'<span id="blogAuthor">✍️ {html.escape(author)}</span>', 1)
+        text = text.replace('<span id="blogDate">📅 Loading...</span>',
+                            f'<span id="blogDate">📅 {html.escape(blog.get("date", ""))}</span>', 1)
+        text = text.replace('<span id="blogReadTime">⏱️ Loading...</span>',
+                            f'<span id="blogReadTime">⏱️ {blog.get("readTime", "")} min read</span>', 1)
+        # The hero image is above the fold: no lazy loading
+        text = text.replace('<img id="blogImage" class="blog-featured-image" alt="" loading="lazy">',
+                            f'<img id="blogImage" class="blog-featured-image" src="{html.escape(blog.get("image", ""))}" '
+                            f'alt="{title}" fetchpriority="high">', 1)
+        text = _CONTENT.sub(lambda m: '<div id="blogContent">\n' + blog.get('content', '') + '\n                </div>\n'
+                            '                <script type="application/json" id="postData">'
+                            + _script_json(post_data) + '</script>', text, 1)
+        return text
+
+# ===== STATE =====
+def load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {'pages': {}}
+
+def save_state(state):
+    file_store.write_json(STATE_FILE, state, sort_keys=True)
+
+# ===== RENDERING =====
+def related_map(manifest, ids=None, index=None):
+    """{id: related cards} for the given ids (default: every post)"""
+    index = index or related_posts.load_index()
+    by_id = {b['id']: b for b in manifest}
+    return {i: related_posts.related_cards(index, i, by_id) for i in (ids if ids is not None else by_id)}
+
+def _render_one(template, blog, previous, related=None):
+    """(id, hash, path, written) for one post"""
+    if related is not None:
+        blog = dict(blog, related=related)
+    digest = template.page_hash(blog)
+    path = post_path(blog)
+    if previous and previous.get('hash') == digest and previous.get('path') == path and os.path.exists(path):
+        return blog['id'], digest, path, False
+    # Pages are rebuilt from the store, so no fsync: a full rebuild writes thousands
+    file_store.atomic_write(path, template.render(blog), durable=False)
+    return blog['id'], digest, path, True
+
+_worker_template = None
+
+def _init_worker(template_path):
+    global _worker_template
+    _worker_template = PageTemplate(template_path)
+
+def _render_chunk(ids, previous, related):
+    """Worker: load each post from the store (bodies are not pickled across) and render it"""
+    return [_render_one(_worker_template, blog_store.load_post(blog_id), previous.get(str(blog_id)),
+                        related.get(blog_id))
+            for blog_id in ids]
+
+def render_posts(blogs, related=None, template_path=TEMPLATE_FILE):
+    """Render the given full posts (with content); returns paths written
+
+    related: {id: cards} from related_map(); posts missing from it render
+    without a related list.
+    """
+    template = PageTemplate(template_path)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    related = related or {}
+    with file_store.lock(STATE_FILE):
+        state = load_state()
+        results = [_render_one(template, blog, state['pages'].get(str(blog['id'])), related.get(blog['id']))
+                   for blog in blogs]
+        return _apply_results(state, template, results)
+
+def render_all(manifest=None, full=False, workers=None, template_path=TEMPLATE_FILE):
+    """Check every post in the store and re-render those whose hash changed"""
+    with file_store.lock(STATE_FILE):
+        return _render_all(blog_store.fresh(manifest), full, workers, template_path)
+
+def _render_all(manifest, full, workers, template_path):
+    template = PageTemplate(template_path)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    state = load_state()
+    previous = {} if full else state['pages']
+    ids = [b['id'] for b in manifest]
+    related = related_map(manifest)
+
+    workers = workers or os.cpu_count() or 1
+    if len(ids) < PARALLEL_THRESHOLD or workers == 1:
+        results = [_render_one(template, blog_store.load_post(i), previous.get(str(i)), related[i]) for i in ids]
+    else:
+        from concurrent.futures import ProcessPoolExecutor   # multiprocessing: only for full rebuilds
+        chunks = [ids[i:i + CHUNK_SIZE] for i in range(0, len(ids), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(template_path,)) as executor:
+            states = [{str(i): previous.get(str(i)) for i in chunk} for chunk in chunks]
+            cards = [{i: related[i] for i in chunk} for chunk in chunks]
+            results = [r for chunk in executor.map(_render_chunk, chunks, states, cards) for r in chunk]
+
+    written = _apply_results(state, template, results)
+    # Posts that no longer exist lose their page
+    live = {str(i) for i in ids}
+    for key in [k for k in state['pages'] if k not in live]:
+        _remove(state['pages'].pop(key)['path'])
+    save_state(state)
+    return written
+
+def _apply_results(state, template, results):
+    written = []
+    for blog_id, digest, path, was_written in results:
+        old = state['pages'].get(str(blog_id))
+        if old and old['path'] != path:
+            _remove(old['path'])   # slug changed
+        state['pages'][str(blog_id)] = {'hash': digest, 'path': path}
+        if was_written:
+            written.append(path)
+    state['template'] = template.hash
+    save_state(state)
+    return written
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'build':
+        written = render_all(full='--full' in sys.argv)
+        print(f"✅ Rendered {len(written)} page(s) into {OUTPUT_DIR}/")
+    else:
+        print(__doc__)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Related Posts Index for TurnitinPaperChecker
+Computes each post's top-k related articles at publish time, so post pages
+no longer score the whole corpus in the browser.
+
+- Each post becomes a TF-IDF vector over its title, tags, category and body
+  (title/tag/category terms weighted up, common words dropped)
+- Similarities are accumulated over an inverted index (term -> posts), so
+  a post is only compared with posts that share a term with it
+- Adding a post computes its own top-k and updates the lists of the posts
+  it displaces into; nothing else is recomputed
+- Vectors and lists are kept in related-index.json; the lists are embedded
+  in each pre-rendered page (see post_renderer.py)
+
+Usage:
+    python related_posts.py rebuild
+    python related_posts.py bench      # incremental add vs full recompute at 10k posts
+"""
+
+import os
+import re
+import sys
+import json
+import html
+import math
+import time
+import heapq
+import random
+from collections import Counter
+
+import blog_loader
+import file_store
+
+# ===== CONFIGURATION =====
+INDEX_FILE = 'related-index.json'
+TOP_K = 5
+TERMS_PER_POST = 40        # strongest terms kept per post
+MAX_DF_RATIO = 0.5         # terms in more than half the posts don't pick candidates
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 3
+CATEGORY_WEIGHT = 4
+STRONG_MATCH = 0.15        # cosine at which a card is highlighted
+CARD_FIELDS = ('id', 'slug', 'title', 'date', 'readTime', 'category')
+
+_TAG = re.compile(r'<[^>]+>')
+_WORD = re.compile(r"[a-z][a-z0-9']+")
+STOPWORDS = set("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers how i if in into is it its itself just more most my no nor not of
+off on once only or other our out over own same she should so some such than that the their them
+then there these they this those through to too under until up very was we were what when where
+which while who whom why will with would you your yours can't don't it's you'll you're
+""".split())
+
+# ===== VECTORS =====
+def _words(text):
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS and len(w) > 2]
+
+def term_counts(blog):
+    """Weighted term frequencies of a post"""
+    counts = Counter()
+    for word in _words(blog.get('title', '')):
+        counts[word] += TITLE_WEIGHT
+    for tag in blog.get('tags') or []:
+        counts[f"tag:{tag.lower()}"] += TAG_WEIGHT
+        for word in _words(tag):
+            counts[word] += TAG_WEIGHT
+    if blog.get('category'):
+        counts[f"cat:{blog['category'].lower()}"] += CATEGORY_WEIGHT
+    counts.update(_words(html.unescape(_TAG.sub(' ', blog.get('content', '')))))
+    return counts
+
+def idf_value(df, n):
+    return math.log((n + 1) / (df + 1)) + 1
+
+# ===== INDEX =====
+class RelatedIndex:
+    """Per-post term weights, postings and top-k lists"""
+
+    def __init__(self, path=INDEX_FILE, k=TOP_K):
+        self.path = path
+        self.k = k
+        self.terms = {}      # id -> {term: 1 + log(tf)}
+        self.related = {}    # id -> [[id, score], ...] best first
+        self.postings = {}   # term -> {id: weight}
+        self.inv_norm = {}   # id -> 1 / |tf-idf vector|
+
+    # ----- persistence -----
+    def load(self):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.k = data.get('k', self.k)
+        for key, doc in data['posts'].items():
+            self._insert(int(key), doc['terms'])
+            self.related[int(key)] = doc['related']
+        self._refresh_norms()
+        return True
+
+    def save(self):
+        data = {'k': self.k, 'posts': {str(i): {'terms': self.terms[i], 'related': self.related.get(i, [])}
+                                       for i in sorted(self.terms)}}
+        file_store.write_json(self.path, data, compact=True)
+
+    # ----- scoring -----
+    def _insert(self, blog_id, terms):
+        self.terms[blog_id] = terms
+        for term, weight in terms.items():
+            self.postings.setdefault(term, {})[blog_id] = weight
+
+    def _idf(self, term):
+        return idf_value(len(self.postings.get(term, ())), len(self.terms))
+
+    def _norm(self, blog_id):
+        norm = math.sqrt(sum((w * self._idf(t)) ** 2 for t, w in self.terms[blog_id].items()))
+        self.inv_norm[blog_id] = 1.0 / (norm or 1.0)
+
+    def _refresh_norms(self):
+        for blog_id in self.terms:
+            self._norm(blog_id)
+
+    @staticmethod
+    def _select(counts, idf):
+        """Keep the terms that say most about a post at the given idf"""
+        weights = {t: 1 + math.log(c) for t, c in counts.items()}
+        best = heapq.nlargest(TERMS_PER_POST, weights, key=lambda t: weights[t] * idf(t))
+        return {t: round(weights[t], 3) for t in best}
+
+    def _scores(self, blog_id):
+        """Cosine similarity with every post sharing a term, accumulated per posting
+
+        Terms in more than MAX_DF_RATIO of posts are skipped: they carry
+        little weight and would make every post a candidate.
+        """
+        limit = max(2, MAX_DF_RATIO * len(self.terms))
+        inv_norm = self.inv_norm
+        own = self.inv_norm[blog_id]
+        scores = {}
+        get = scores.get
+        for term, weight in self.terms[blog_id].items():
+            posting = self.postings[term]
+            if len(posting) > limit:
+                continue
+            idf = self._idf(term)
+            q = weight * idf * idf * own
+            for other, w in posting.items():
+                scores[other] = get(other, 0.0) + q * w * inv_norm[other]
+        scores.pop(blog_id, None)
+        return scores
+
+    def _top(self, scores):
+        best = heapq.nlargest(self.k, scores.items(), key=lambda item: (item[1], item[0]))
+        return [[other, round(score, 4)] for other, score in best]
+
+    # ----- updates -----
+    def add_posts(self, blogs):
+        """Index new (or edited) posts; returns ids of existing posts whose list changed
+
+        Norms of existing posts keep the idf they were indexed with until
+        the next rebuild; the drift from one post is negligible.
+        """
+        new_ids = set()
+        for blog in blogs:
+            blog_id = blog['id']
+            self._remove(blog_id)
+            n = len(self.terms) + 1
+            self._insert(blog_id, self._select(term_counts(blog),
+                                               lambda t: idf_value(len(self.postings.get(t, ())), n)))
+            self._norm(blog_id)
+            new_ids.add(blog_id)
+
+        touched = set()
+        for blog_id in new_ids:
+            scores = self._scores(blog_id)
+            self.related[blog_id] = self._top(scores)
+            # Neighbours: the new post may now belong in their top-k
+            for other, score in scores.items():
+                if other in new_ids:
+                    continue
+                current = self.related.get(other, [])
+                ids = [i for i, _ in current]
+                if blog_id in ids:
+                    current = [pair for pair in current if pair[0] != blog_id]
+                if len(current) < self.k or score > current[-1][1]:
+                    current = sorted(current + [[blog_id, round(score, 4)]], key=lambda p: (-p[1], -p[0]))[:self.k]
+                if [i for i, _ in current] != ids:
+                    self.related[other] = current
+                    touched.add(other)
+        return touched
+
+    def _remove(self, blog_id):
+        for term in self.terms.pop(blog_id, {}):
+            self.postings[term].pop(blog_id, None)
+        self.related.pop(blog_id, None)
+        self.inv_norm.pop(blog_id, None)
+
+    def rebuild(self, blogs=None):
+        """Recompute every vector and every list from the corpus"""
+        counts = {}
+        df = Counter()
+        for blog in (blogs if blogs is not None else blog_loader.iter_blogs()):
+            counts[blog['id']] = term_counts(blog)
+            df.update(counts[blog['id']].keys())
+        # Term selection needs the corpus-wide df, so select before inserting
+        n = len(counts)
+        self.terms, self.related, self.postings, self.inv_norm = {}, {}, {}, {}
+        for blog_id, c in counts.items():
+            self._insert(blog_id, self._select(c, lambda t: idf_value(df[t], n)))
+        self._refresh_norms()
+        for blog_id in self.terms:
+            self.related[blog_id] = self._top(self._scores(blog_id))
+        return self
+
+    def top(self, blog_id):
+        return [i for i, _ in self.related.get(blog_id, [])]
+
+def load_index(path=INDEX_FILE):
+    """Load the index, rebuilding it from the corpus when missing"""
+    index = RelatedIndex(path)
+    try:
+        if index.load():
+            return index
+    except Exception as e:
+        print(f"⚠️ Error loading related index: {e}")
+    index.rebuild()
+    index.save()
+    print(f"✅ Related index rebuilt: {len(index.terms)} posts")
+    return index
+
+def related_cards(index, blog_id, by_id):
+    """Top-k as the small dicts a page displays, topped up with the newest posts"""
+    scores = {i: score for i, score in index.related.get(blog_id, []) if i in by_id}
+    ids = list(scores)
+    if len(ids) < index.k:
+        for other in sorted(by_id, reverse=True):
+            if len(ids) >= index.k:
+                break
+            if other != blog_id and other not in scores:
+                ids.append(other)
+    cards = []
+    for i in ids:
+        card = {k: by_id[i].get(k) for k in CARD_FIELDS}
+        card['strong'] = scores.get(i, 0) >= STRONG_MATCH
+        cards.append(card)
+    return cards
+
+# ===== BENCHMARK =====
+def _synthetic(rng, vocab, categories, blog_id):
+    topic = rng.sample(vocab, 30)
+    words = [rng.choice(topic) if rng.random() < 0.4 else rng.choice(vocab) for _ in range(300)]
+    return {'id': blog_id, 'title': ' '.join(rng.sample(topic, 5)),
+            'tags': rng.sample(topic, 3), 'category': rng.choice(categories),
+            'content': '<p>' + ' '.join(words) + '</p>'}
+
+def benchmark(posts=10000, adds=20, seed=1):
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(8000)]
+    categories = [f"Category {i}" for i in range(12)]
+    corpus = [_synthetic(rng, vocab, categories, i) for i in range(1, posts + 1)]
+
+    started = time.perf_counter()
+    index = RelatedIndex(os.devnull).rebuild(corpus)
+    full = time.perf_counter() - started
+    print(f"🧮 Full recompute: {posts} posts in {full:.2f}s")
+
+    extra = [_synthetic(rng, vocab, categories, posts + i) for i in range(1, adds + 1)]
+    started = time.perf_counter()
+    touched = 0
+    for blog in extra:
+        touched += len(index.add_posts([blog]))
+    incremental = (time.perf_counter() - started) / adds
+    print(f"➕ Incremental add: {incremental * 1000:.1f} ms per post "
+          f"({touched / adds:.1f} neighbour lists updated on average, {full / incremental:,.0f}x faster)")
+    return {'posts': posts, 'full_s': round(full, 2), 'add_ms': round(incremental * 1000, 1)}
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'rebuild':
+        index = RelatedIndex().rebuild()
+        index.save()
+        print(f"✅ Related index rebuilt: {len(index.terms)} posts")
+    elif command == 'bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+    else:
+        print(__doc__)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Response Cache for TurnitinPaperChecker
+Content-addressed on-disk cache for Groq completions and image lookups.
+
+- LLM entries are keyed on (prompt hash, model, temperature, seed)
+- Image entries are keyed on (provider, search query)
+- Entries expire after a TTL; the cache is trimmed to a size budget
+- The last run's keys are journaled so `blog-generator.py --replay` can
+  re-run the whole pipeline offline from cached responses
+
+Usage:
+    python response_cache.py stats
+    python response_cache.py evict
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+
+import file_store
+
+# ===== CONFIGURATION =====
+CACHE_DIR = os.environ.get('BLOG_CACHE_DIR', '.cache')
+ENTRIES_DIR = os.path.join(CACHE_DIR, 'responses')
+LAST_RUN_FILE = os.path.join(CACHE_DIR, 'last-run.json')
+LLM_TTL = 30 * 24 * 3600       # 30 days
+IMAGE_TTL = 7 * 24 * 3600      # 7 days
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+# ===== KEYS =====
+def _digest(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def llm_key(prompt, model, temperature, seed):
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return _digest({'kind': 'llm', 'prompt': prompt_hash, 'model': model,
+                    'temperature': temperature, 'seed': seed})
+
+def image_key(provider, query):
+    return _digest({'kind': 'image', 'provider': provider, 'query': ' '.join(query.lower().split())})
+
+def entry_path(key):
+    return os.path.join(ENTRIES_DIR, key[:2], f"{key}.json")
+
+# ===== GET / PUT =====
+def get(key, ttl=None):
+    """Cached value, or None when missing or older than ttl seconds"""
+    path = entry_path(key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Cache read error ({key[:12]}): {e}")
+        return None
+    if ttl is not None and time.time() - entry.get('created', 0) > ttl:
+        _remove(path)
+        return None
+    return entry.get('value')
+
+def put(key, value, **meta):
+    """Store value under key (meta is kept for debugging only)"""
+    path = entry_path(key)
+    try:
+        # Entries can be fetched again: atomic is enough, no fsync
+        file_store.write_json(path, {'created': time.time(), 'meta': meta, 'value': value},
+                              compact=True, durable=False)
+    except Exception as e:
+        print(f"⚠️ Cache write error ({key[:12]}): {e}")
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ===== EVICTION =====
+def _entries():
+    for root, _, files in os.walk(ENTRIES_DIR):
+        for name in files:
+            if name.endswith('.json'):
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_mtime, st.st_size
+
+def evict(max_bytes=MAX_CACHE_BYTES, max_age=LLM_TTL):
+    """Drop entries older than max_age, then oldest first until under max_bytes"""
+    now = time.time()
+    kept = []
+    removed = 0
+    for path, mtime, size in _entries():
+        if now - mtime > max_age:
+            _remove(path)
+            removed += 1
+        else:
+            kept.append((mtime, size, path))
+
+    total = sum(size for _, size, _ in kept)
+    kept.sort()
+    for mtime, size, path in kept:
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+        removed += 1
+
+    if removed:
+        print(f"🧹 Cache evicted {removed} entries ({total // 1024} KB kept)")
+    return removed
+
+def stats():
+    entries = list(_entries())
+    return {'entries': len(entries), 'bytes': sum(size for _, _, size in entries)}
+
+# ===== RUN JOURNAL =====
+def save_last_run(run):
+    """Remember seed, keywords, titles and accepted seeds of this run for --replay"""
+    try:
+        file_store.write_json(LAST_RUN_FILE, run)
+    except Exception as e:
+        print(f"⚠️ Could not save run journal: {e}")
+
+def load_last_run():
+    try:
+        with open(LAST_RUN_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'stats':
+        print(json.dumps(stats()))
+    elif command == 'evict':
+        evict()
+    else:
+        print(__doc__)
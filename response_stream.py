@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Streaming Response Parser for TurnitinPaperChecker
+Parses the ---TITLE--- / ---CONTENT--- / ---META--- / ---END--- sections of
+a Groq completion while tokens are still arriving, so a malformed response
+is abandoned after a few hundred tokens instead of the full 5000.
+"""
+
+import re
+import time
+
+# ===== CONFIGURATION =====
+MARKERS = ['---TITLE---', '---CONTENT---', '---META---', '---END---']
+SECTIONS = ['title', 'content', 'meta']
+TITLE_DEADLINE_TOKENS = 300    # ---TITLE--- must show up this early
+MAX_TITLE_CHARS = 300          # title section longer than this is not a title
+MAX_CONTENT_WORDS = 3500       # prompt asks for 1500-2000 words
+MAX_META_CHARS = 600
+
+_WORD = re.compile(r'\S+')
+
+class StreamAbort(Exception):
+    """Raised when a streamed response is clearly malformed"""
+
+class SectionStreamParser:
+    """Feed text deltas; raises StreamAbort as soon as the structure is wrong"""
+
+    def __init__(self, title_deadline_tokens=TITLE_DEADLINE_TOKENS,
+                 max_content_words=MAX_CONTENT_WORDS):
+        self.title_deadline_tokens = title_deadline_tokens
+        self.max_content_words = max_content_words
+        self.chunks = []
+        self.length = 0
+        self.tokens = 0
+        self.stage = 0           # index of the next marker expected
+        self.section_start = 0   # offset where the current section's text starts
+        self.scan_from = 0       # offset to resume marker search from
+        self.content_words = 0
+        self._tail = ''          # unscanned text kept to catch split markers
+        self._last_char = ' '
+        self.started = time.perf_counter()
+        self.marks = {}          # marker -> seconds since start
+
+    # ===== FEEDING =====
+    def feed(self, text):
+        if not text:
+            return
+        self.tokens += 1
+        self.marks.setdefault('first_token', time.perf_counter() - self.started)
+        self.chunks.append(text)
+        self.length += len(text)
+        self._tail += text
+
+        # A delta may complete several markers at once
+        while self.stage < len(MARKERS) and self._advance():
+            pass
+        self._check_budget(text)
+
+    def _advance(self):
+        marker = MARKERS[self.stage]
+        found = self._tail.find(marker)
+        # A later marker before the expected one means the order is wrong
+        for later in MARKERS[self.stage + 1:]:
+            pos = self._tail.find(later)
+            if pos != -1 and (found == -1 or pos < found):
+                raise StreamAbort(f"{later} arrived before {marker}")
+        if found == -1:
+            # Keep just enough text to match a marker split across deltas
+            keep = max(len(m) for m in MARKERS) - 1
+            consumed = max(0, len(self._tail) - keep)
+            self.scan_from += consumed
+            self._tail = self._tail[consumed:]
+            return False
+
+        end = self.scan_from + found + len(marker)
+        if self.stage > 0:
+            self.marks[SECTIONS[self.stage - 1]] = time.perf_counter() - self.started
+        self.stage += 1
+        self.section_start = end
+        self.scan_from = end
+        self._tail = self._tail[found + len(marker):]
+        return True
+
+    def _count_words(self, text):
+        if not text:
+            return
+        words = len(_WORD.findall(text))
+        # Word split across two deltas was counted twice
+        if words and not self._last_char.isspace() and not text[0].isspace():
+            words -= 1
+        self.content_words += words
+        self._last_char = text[-1]
+
+    def _check_budget(self, text):
+        if self.stage == 0 and self.tokens > self.title_deadline_tokens:
+            raise StreamAbort(f"no {MARKERS[0]} within {self.title_deadline_tokens} tokens")
+        section_len = self.length - self.section_start
+        if self.stage == 1 and section_len > MAX_TITLE_CHARS:
+            raise StreamAbort(f"title section over {MAX_TITLE_CHARS} chars")
+        if self.stage == 2:
+            # Only the text after the marker belongs to the content section
+            self._count_words(text[len(text) - section_len:] if section_len < len(text) else text)
+            if self.content_words > self.max_content_words:
+                raise StreamAbort(f"content over {self.max_content_words} words")
+        if self.stage == 3 and section_len > MAX_META_CHARS:
+            raise StreamAbort(f"meta section over {MAX_META_CHARS} chars")
+
+    # ===== RESULT =====
+    def text(self):
+        return ''.join(self.chunks)
+
+    def finish(self):
+        """Full text once the stream ends; aborts if a required section is missing"""
+        self.marks['total'] = time.perf_counter() - self.started
+        if self.stage < 3:
+            raise StreamAbort(f"stream ended before {MARKERS[self.stage]}")
+        if self.stage == 3:
+            self.marks['meta'] = self.marks['total']
+        return self.text()
+
+    def timing_report(self):
+        """e.g. 'title 0.4s | content 11.2s | meta 0.3s | total 12.0s (812 tokens)'"""
+        parts = []
+        previous = self.marks.get('first_token', 0.0)
+        for section in SECTIONS:
+            if section in self.marks:
+                parts.append(f"{section} {self.marks[section] - previous:.1f}s")
+                previous = self.marks[section]
+        parts.append(f"total {self.marks.get('total', time.perf_counter() - self.started):.1f}s")
+        return ' | '.join(parts) + f" ({self.tokens} tokens)"
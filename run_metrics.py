@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Run Metrics for TurnitinPaperChecker
+Per-stage timings and counters for the publishing scripts, so a slow
+scheduled run can be diagnosed afterwards and trended across days.
+
+- span('stage') / @timed(): wall time per stage; nested spans are keyed by
+  their path ("save_blogs/update_sitemap"), repeated ones are aggregated
+- count('groq.completion_tokens', n): counters for tokens, HTTP retries,
+  bytes written, cache hits, ...
+- finish() appends the run as one JSON line to run-history.jsonl
+- Profiling is opt-in (--profile or RUN_PROFILE=cprofile|tracemalloc):
+  the top functions or allocation sites are added to the run's record.
+  cProfile only sees the main thread; worker-thread stages still get spans
+
+Spans and counters are no-ops until start() is called, so modules can be
+instrumented without caring who imports them.
+
+Usage:
+    python run_metrics.py show [N]          # last N runs (default 10)
+    python run_metrics.py trend STAGE [N]   # one stage (or counter) across runs
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+
+import file_store
+
+try:
+    import resource
+except ImportError:   # not on Windows
+    resource = None
+
+# ===== CONFIGURATION =====
+HISTORY_FILE = 'run-history.jsonl'
+MAX_HISTORY = 400   # runs kept: over a year of daily runs
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+PROFILE_TOP = 25
+
+# ===== RUN STATE =====
+class Run:
+    def __init__(self, script, meta=None):
+        self.script = script
+        self.meta = dict(meta or {})
+        self.started = datetime.now()
+        self.clock = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.profile = None
+        self.profiler = None
+
+    def stack(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def record(self, path, seconds, failed):
+        ms = seconds * 1000
+        with self.lock:
+            stage = self.stages.setdefault(path, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'errors': 0})
+            stage['count'] += 1
+            stage['total_ms'] += ms
+            stage['max_ms'] = max(stage['max_ms'], ms)
+            stage['errors'] += failed
+
+    def add(self, name, amount):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+_run = None
+
+# ===== RECORDING =====
+def start(script, profile=None, **meta):
+    """Begin recording a run (replaces any previous one)"""
+    global _run
+    _run = Run(script, meta)
+    profile = profile or os.environ.get('RUN_PROFILE') or None
+    if profile:
+        _start_profile(_run, profile)
+    return _run
+
+@contextmanager
+def span(name):
+    run = _run
+    if run is None:
+        yield
+        return
+    stack = run.stack()
+    stack.append(name)
+    path = '/'.join(stack)
+    failed = False
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        run.record(path, time.perf_counter() - started, failed)
+        stack.pop()
+
+def timed(name=None):
+    """Decorator form of span(); the stage name defaults to the function name"""
+    def decorate(func, name=name):
+        name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    if callable(name):
+        return decorate(name, None)
+    return decorate
+
+def count(name, amount=1):
+    if _run is not None and amount:
+        _run.add(name, amount)
+
+def count_files(name, paths):
+    """Add the size of each existing file in paths to counter `name`"""
+    if _run is None:
+        return
+    total = 0
+    for path in paths or ():
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    count(name, total)
+
+def note(key, value):
+    """Attach a value (posts published, blog id, ...) to the run record"""
+    if _run is not None:
+        _run.meta[key] = value
+
+# ===== PROFILING =====
+def _start_profile(run, mode):
+    if mode not in PROFILE_MODES:
+        print(f"⚠️ Unknown profile mode '{mode}' (use {' or '.join(PROFILE_MODES)})")
+        return
+    run.profile = mode
+    if mode == 'cprofile':
+        import cProfile
+        run.profiler = cProfile.Profile()
+        run.profiler.enable()
+    else:
+        import tracemalloc
+        tracemalloc.start(10)
+
+def _stop_profile(run):
+    if run.profile == 'cprofile':
+        import pstats
+        run.profiler.disable()
+        stats = pstats.Stats(run.profiler).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP]
+        return {'mode': 'cprofile', 'top': [
+            {'function': f"{os.path.relpath(file) if file.startswith('/') else file}:{line}({func})",
+             'calls': calls, 'total_ms': round(tottime * 1000, 1), 'cumulative_ms': round(cumtime * 1000, 1)}
+            for (file, line, func), (_, calls, tottime, cumtime, _) in top]}
+    if run.profile == 'tracemalloc':
+        import tracemalloc
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        top = snapshot.statistics('lineno')[:PROFILE_TOP]
+        return {'mode': 'tracemalloc', 'peak_kb': peak // 1024, 'top': [
+            {'line': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             'kb': stat.size // 1024, 'blocks': stat.count} for stat in top]}
+    return None
+
+# ===== REPORT =====
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak   # bytes on macOS, KB elsewhere
+
+def report(status='ok'):
+    run = _run
+    stages = {path: dict(stage, total_ms=round(stage['total_ms'], 1), max_ms=round(stage['max_ms'], 1))
+              for path, stage in run.stages.items()}
+    record = {
+        'script': run.script,
+        'started': run.started.strftime('%Y-%m-%d %H:%M:%S'),
+        'seconds': round(time.perf_counter() - run.clock, 2),
+        'status': status,
+        'meta': run.meta,
+        'stages': stages,
+        'counters': dict(sorted(run.counters.items())),
+        'peak_rss_kb': _peak_rss_kb(),
+    }
+    profile = _stop_profile(run)
+    if profile:
+        record['profile'] = profile
+    return record
+
+def append_history(record, path=HISTORY_FILE, keep=MAX_HISTORY):
+    with file_store.lock(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            lines = []
+        lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        file_store.atomic_write(path, ''.join(lines[-keep:]))
+
+def _duration(ms):
+    return f"{ms / 1000:.1f}s" if ms >= 1000 else f"{ms:.0f} ms"
+
+def print_summary(record, top=6):
+    slowest = sorted(((p, s) for p, s in record['stages'].items() if '/' not in p),
+                     key=lambda item: item[1]['total_ms'], reverse=True)[:top]
+    stages = ', '.join(f"{p} {_duration(s['total_ms'])}" + (f" ×{s['count']}" if s['count'] > 1 else '')
+                       for p, s in slowest)
+    print(f"📊 {record['script']}: {record['seconds']}s ({record['status']}) - {stages}")
+    if record['counters']:
+        print("📊 " + ', '.join(f"{k} {v:,}" for k, v in record['counters'].items()))
+
+def finish(status='ok', path=HISTORY_FILE):
+    """Close the run, append it to the history file; returns the record"""
+    global _run
+    if _run is None:
+        return None
+    record = report(status)
+    _run = None
+    print_summary(record)
+    try:
+        append_history(record, path)
+    except Exception as e:
+        print(f"⚠️ Could not write {path}: {e}")
+    return record
+
+# ===== HISTORY =====
+def load_history(path=HISTORY_FILE):
+    runs = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return runs
+
+def stage_value(record, name):
+    """Milliseconds for a stage path, or a counter's value"""
+    if name in record.get('stages', {}):
+        return record['stages'][name]['total_ms']
+    return record.get('counters', {}).get(name)
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'show':
+        for record in load_history()[-int(sys.argv[2] if len(sys.argv) > 2 else 10):]:
+            print(f"{record['started']} ", end='')
+            print_summary(record)
+    elif command == 'trend' and len(sys.argv) > 2:
+        name = sys.argv[2]
+        for record in load_history()[-int(sys.argv[3] if len(sys.argv) > 3 else 30):]:
+            value = stage_value(record, name)
+            print(f"{record['started']}  {record['script']:<18} {'-' if value is None else value}")
+    else:
+        print(__doc__)
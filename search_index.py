@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Blog Search Index for TurnitinPaperChecker
+Builds the static search index blog.html queries, so the listing page no
+longer downloads every post to filter it in the browser.
+
+- Terms come from titles, tags, categories, excerpts and <h2>/<h3> headings
+- Each posting list is the sorted post ids, delta-encoded and written as
+  base64 VLQ digits (a run of consecutive ids costs one character per post)
+- Category filters and the A-Z order are stored the same way in
+  blogs/search/index.json, so sorting and filtering need nothing else
+- Posting lists are sharded by the term's first character
+  (blogs/search/terms/<c>.json); a query downloads only the shards it uses
+- Card data (title, image, excerpt, ...) lives in blogs/search/cards/<n>.json,
+  CARD_CHUNK posts per file; the page fetches only the chunks it shows
+- Saving a post re-encodes only the posting lists it touches and rewrites
+  only their shards and its card chunk
+
+Usage:
+    python search_index.py rebuild
+    python search_index.py search "turnitin score"
+    python search_index.py bench       # size + query latency at 1k/10k/50k posts
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import html
+import time
+import random
+import tempfile
+
+import blog_loader
+import blog_store
+import file_store
+
+# ===== CONFIGURATION =====
+SEARCH_DIR = os.path.join('blogs', 'search')
+CARD_CHUNK = 100
+CARD_FIELDS = ('id', 'slug', 'title', 'date', 'readTime', 'category', 'image', 'excerpt')
+INDEX_VERSION = 1
+
+_TAG = re.compile(r'<[^>]*>?')
+_HEADING = re.compile(r'<h[23][^>]*>(.*?)</h[23]>', re.S | re.I)
+_WORD = re.compile(r'[a-z0-9]+')
+STOPWORDS = set("""
+a an and are as at be by for from has have how in is it its of on or that the this to was were what
+when which who why will with your you
+""".split())
+B64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+B64_VALUES = {c: i for i, c in enumerate(B64)}
+
+# ===== ENCODING =====
+def encode_vlq(numbers):
+    """Non-negative ints as base64 VLQ digits (5 bits per char, 6th bit = more follows)"""
+    out = []
+    for n in numbers:
+        while True:
+            digit = n & 31
+            n >>= 5
+            out.append(B64[digit | 32] if n else B64[digit])
+            if not n:
+                break
+    return ''.join(out)
+
+def decode_vlq(text):
+    numbers, value, shift = [], 0, 0
+    for c in text:
+        digit = B64_VALUES[c]
+        value |= (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            numbers.append(value)
+            value, shift = 0, 0
+    return numbers
+
+def encode_postings(ids):
+    """Sorted ids -> first id then gaps"""
+    previous, gaps = 0, []
+    for i in ids:
+        gaps.append(i - previous)
+        previous = i
+    return encode_vlq(gaps)
+
+def decode_postings(text):
+    ids, total = [], 0
+    for gap in decode_vlq(text):
+        total += gap
+        ids.append(total)
+    return ids
+
+# ===== TOKENS =====
+def tokenize(text):
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS and len(w) > 1]
+
+def post_terms(blog):
+    """Distinct searchable terms of a full post (or a manifest entry, minus headings)"""
+    parts = [blog.get('title', ''), blog.get('category') or '', ' '.join(blog.get('tags') or []),
+             html.unescape(_TAG.sub(' ', blog.get('excerpt', '')))]
+    parts += [html.unescape(_TAG.sub(' ', h)) for h in _HEADING.findall(blog.get('content', ''))]
+    return set(tokenize(' '.join(parts)))
+
+def card(blog):
+    return {k: blog.get(k) for k in CARD_FIELDS}
+
+def card_chunk(blog_id):
+    return blog_id // CARD_CHUNK
+
+def shard(term):
+    return term[0]
+
+# ===== INDEX =====
+class SearchIndex:
+    """Encoded posting lists, decoded only for the terms being changed"""
+
+    def __init__(self, search_dir=SEARCH_DIR):
+        self.path = os.path.join(search_dir, 'index.json')
+        self.cards_dir = os.path.join(search_dir, 'cards')
+        self.terms_dir = os.path.join(search_dir, 'terms')
+        self.terms = {}        # term -> encoded postings
+        self.categories = {}   # category -> encoded postings
+        self.ids = []
+        self.titles = {}       # id -> lower-cased title, for the A-Z order
+        self.dirty = set()     # shards to rewrite on save
+
+    def load(self, manifest=None):
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('v') != INDEX_VERSION:
+            return False
+        self.categories = data['categories']
+        self.ids = decode_postings(data['ids'])
+        for name in data['shards']:
+            with open(self._shard_path(name), 'r', encoding='utf-8') as f:
+                self.terms.update(json.load(f))
+        manifest = manifest if manifest is not None else blog_store.load_manifest()
+        self.titles = {b['id']: b.get('title', '').lower() for b in manifest}
+        return True
+
+    def _shard_path(self, name):
+        return os.path.join(self.terms_dir, f"{name}.json")
+
+    def head(self):
+        """index.json: everything the listing needs before a query is typed"""
+        alpha = sorted(self.ids, key=lambda i: (self.titles.get(i, ''), i))
+        return {
+            'v': INDEX_VERSION,
+            'count': len(self.ids),
+            'chunk': CARD_CHUNK,
+            'ids': encode_postings(self.ids),
+            'alpha': encode_vlq(alpha),
+            'categories': self.categories,
+            'shards': sorted({shard(t) for t in self.terms}),
+        }
+
+    def save(self):
+        """Write the head plus the term shards that changed"""
+        shards = {}
+        for term, encoded in self.terms.items():
+            if shard(term) in self.dirty:
+                shards.setdefault(shard(term), {})[term] = encoded
+        os.makedirs(self.terms_dir, exist_ok=True)
+        for name in self.dirty:
+            if name in shards:
+                _write_compact(self._shard_path(name), dict(sorted(shards[name].items())))
+            elif os.path.exists(self._shard_path(name)):
+                os.remove(self._shard_path(name))
+        _write_compact(self.path, self.head())
+        self.dirty = set()
+
+    # ----- updates -----
+    @staticmethod
+    def _add(table, key, blog_id):
+        ids = decode_postings(table.get(key, ''))
+        if blog_id in ids:
+            return False
+        ids.append(blog_id)
+        ids.sort()
+        table[key] = encode_postings(ids)
+        return True
+
+    @staticmethod
+    def _discard(table, blog_id):
+        changed = []
+        for key, encoded in list(table.items()):
+            ids = decode_postings(encoded)
+            if blog_id in ids:
+                ids.remove(blog_id)
+                if ids:
+                    table[key] = encode_postings(ids)
+                else:
+                    del table[key]
+                changed.append(key)
+        return changed
+
+    def add_posts(self, blogs):
+        """Index new or edited posts; returns the card chunk files written"""
+        chunks = {}
+        indexed = set(self.ids)
+        for blog in blogs:
+            blog_id = blog['id']
+            if blog_id in indexed:
+                # Edited post: its old terms are unknown, so scan once (rare path)
+                self.dirty.update(shard(t) for t in self._discard(self.terms, blog_id))
+                self._discard(self.categories, blog_id)
+            else:
+                indexed.add(blog_id)
+                self.ids.append(blog_id)
+                self.ids.sort()
+            self.titles[blog_id] = blog.get('title', '').lower()
+            for term in post_terms(blog):
+                if self._add(self.terms, term, blog_id):
+                    self.dirty.add(shard(term))
+            if blog.get('category'):
+                self._add(self.categories, blog['category'], blog_id)
+            chunks.setdefault(card_chunk(blog_id), []).append(card(blog))
+        return [self._write_cards(n, cards) for n, cards in sorted(chunks.items())]
+
+    def _cards_path(self, n):
+        return os.path.join(self.cards_dir, f"{n}.json")
+
+    def _write_cards(self, n, cards):
+        path = self._cards_path(n)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+        except Exception:
+            existing = {}
+        existing.update({str(c['id']): c for c in cards})
+        _write_compact(path, existing)
+        return path
+
+    def rebuild(self, blogs=None):
+        """Index every post from scratch and rewrite all card chunks"""
+        self.terms, self.categories, self.ids, self.titles = {}, {}, [], {}
+        postings, categories, chunks = {}, {}, {}
+        for blog in (blogs if blogs is not None else blog_loader.iter_blogs()):
+            blog_id = blog['id']
+            self.ids.append(blog_id)
+            self.titles[blog_id] = blog.get('title', '').lower()
+            for term in post_terms(blog):
+                postings.setdefault(term, []).append(blog_id)
+            if blog.get('category'):
+                categories.setdefault(blog['category'], []).append(blog_id)
+            chunks.setdefault(card_chunk(blog_id), {})[str(blog_id)] = card(blog)
+        self.ids.sort()
+        self.terms = {t: encode_postings(sorted(ids)) for t, ids in sorted(postings.items())}
+        self.categories = {c: encode_postings(sorted(ids)) for c, ids in sorted(categories.items())}
+        for directory in (self.cards_dir, self.terms_dir):
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    os.remove(os.path.join(directory, name))
+        for n, cards in chunks.items():
+            _write_compact(self._cards_path(n), cards)
+        self.dirty = {shard(t) for t in self.terms}
+        return self
+
+    # ----- queries (same rules as blog.html) -----
+    def search(self, query, category=None):
+        """Ids matching every query word (the last one as a prefix), newest first"""
+        words = tokenize(query)
+        result = None
+        for n, word in enumerate(words):
+            if n == len(words) - 1:
+                ids = set()
+                for term in self.terms:
+                    if term.startswith(word):
+                        ids.update(decode_postings(self.terms[term]))
+            else:
+                ids = set(decode_postings(self.terms.get(word, '')))
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        if result is None:
+            result = set(self.ids)
+        if category:
+            result &= set(decode_postings(self.categories.get(category, '')))
+        return sorted(result, reverse=True)
+
+def _write_compact(path, data):
+    file_store.write_json(path, data, compact=True)
+
+def load_index(manifest=None):
+    """Load the search index, rebuilding it from the store when missing"""
+    index = SearchIndex()
+    try:
+        if index.load(manifest):
+            return index
+    except Exception as e:
+        print(f"⚠️ Error loading search index: {e}")
+    index.rebuild()
+    index.save()
+    print(f"✅ Search index rebuilt: {len(index.ids)} posts")
+    return index
+
+# ===== BENCHMARK =====
+def _synthetic(rng, vocab, categories, blog_id):
+    topic = rng.sample(vocab, 20)
+    title = ' '.join(rng.sample(topic, 6))
+    headings = ''.join(f"<h2>{' '.join(rng.sample(topic, 4))}</h2><p>...</p>" for _ in range(5))
+    return {'id': blog_id, 'slug': f"post-{blog_id}", 'title': title, 'date': 'January 01, 2026',
+            'readTime': 5, 'category': rng.choice(categories), 'tags': rng.sample(topic, 3),
+            'image': f"https://images.example.com/{blog_id}.jpg",
+            'excerpt': ' '.join(rng.choice(vocab) for _ in range(30)) + '...', 'content': headings}
+
+def _gzip_size(path):
+    with open(path, 'rb') as f:
+        return len(gzip.compress(f.read()))
+
+def benchmark(sizes=(1000, 10000, 50000), queries=200, seed=1):
+    rng = random.Random(seed)
+    vocab = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 10)))
+             for _ in range(6000)]
+    categories = ['Academic Writing', 'Plagiarism Detection', 'AI Detection', 'Student Tips', 'Research']
+    results = []
+    for size in sizes:
+        corpus = [_synthetic(rng, vocab, categories, i) for i in range(1, size + 1)]
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SearchIndex(tmp)
+            started = time.perf_counter()
+            index.rebuild(corpus)
+            index.save()
+            build = time.perf_counter() - started
+
+            head = _gzip_size(index.path)
+            shards = [_gzip_size(os.path.join(index.terms_dir, name)) for name in os.listdir(index.terms_dir)]
+            listing = len(gzip.compress(json.dumps([blog_store.manifest_entry(b) for b in corpus]).encode('utf-8')))
+
+            extra = _synthetic(rng, vocab, categories, size + 1)
+            started = time.perf_counter()
+            index.add_posts([extra])
+            index.save()
+            add = time.perf_counter() - started
+
+            terms = [rng.choice(vocab) for _ in range(queries)]
+            started = time.perf_counter()
+            for n, term in enumerate(terms):
+                index.search(term if n % 2 else f"{term} {rng.choice(vocab)[:3]}")
+            query_ms = (time.perf_counter() - started) * 1000 / queries
+
+        print(f"🔎 {size:>6} posts: head {head / 1024:,.0f} KB + {sum(shards) / len(shards) / 1024:,.0f} KB "
+              f"per term shard (gzip, {sum(shards) / 1024:,.0f} KB all) vs {listing / 1024:,.0f} KB listing; "
+              f"build {build:.2f}s, add one {add * 1000:.0f} ms, query {query_ms:.2f} ms")
+        results.append({'posts': size, 'head_kb': round(head / 1024), 'shard_kb': round(sum(shards) / len(shards) / 1024),
+                        'listing_kb': round(listing / 1024), 'build_s': round(build, 2),
+                        'add_ms': round(add * 1000), 'query_ms': round(query_ms, 2)})
+    return results
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'rebuild':
+        index = SearchIndex().rebuild()
+        index.save()
+        print(f"✅ Search index rebuilt: {len(index.ids)} posts, {len(index.terms)} terms")
+    elif command == 'search' and len(sys.argv) > 2:
+        index = load_index()
+        titles = {b['id']: b['title'] for b in blog_store.load_manifest()}
+        for blog_id in index.search(' '.join(sys.argv[2:])):
+            print(f"#{blog_id}: {titles.get(blog_id, '')}")
+    elif command == 'bench':
+        benchmark()
+    else:
+        print(__doc__)
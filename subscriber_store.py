@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Subscriber Store for TurnitinPaperChecker
+SQLite table of newsletter subscribers keyed on the normalised address.
+
+- Emails are trimmed and lower-cased before they become the primary key,
+  so duplicates collapse on import
+- Each subscriber has a status: active / unsubscribed / bounced
+- iter_active() pages through the (status, email) index with keyset
+  pagination, so the sender streams 1M subscribers in flat memory
+- newsletter-subscribers.json is merged in whenever its content changes
+  (its hash is kept in the store): new addresses are added, existing
+  rows keep their status, so unsubscribes and bounces survive re-imports.
+  subscribers.db itself holds those statuses - keep it between runs
+
+Usage:
+    python subscriber_store.py import [file]    # merge a JSON list into the store
+    python subscriber_store.py count
+    python subscriber_store.py unsubscribe EMAIL
+    python subscriber_store.py bounce EMAIL
+    python subscriber_store.py bench [count]    # import + iteration at 1M
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import sqlite3
+import tempfile
+import tracemalloc
+
+# ===== CONFIGURATION =====
+DB_FILE = 'subscribers.db'
+LEGACY_FILE = 'newsletter-subscribers.json'
+PAGE_SIZE = 5000
+STATUSES = ('active', 'unsubscribed', 'bounced')
+
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscribers (
+    email   TEXT PRIMARY KEY,
+    name    TEXT NOT NULL DEFAULT '',
+    status  TEXT NOT NULL DEFAULT 'active',
+    source  TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS subscribers_status ON subscribers (status, email, name);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# ===== NORMALISATION =====
+def normalize_email(email):
+    """'  Jane@Example.COM ' -> 'jane@example.com' (None if not an address)"""
+    email = (email or '').strip().lower()
+    return email if _EMAIL.match(email) else None
+
+# ===== CONNECTION =====
+def connect(path=DB_FILE):
+    """Open (and create if needed) the store; merges the JSON list when it changed"""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    if path == DB_FILE and os.path.exists(LEGACY_FILE):
+        sync_json(conn, LEGACY_FILE)
+    return conn
+
+# ===== WRITES =====
+def _rows(entries, source, now):
+    for entry in entries:
+        if isinstance(entry, dict):
+            email, name = entry.get('email'), entry.get('name', '')
+        else:
+            email, name = entry, ''
+        email = normalize_email(email)
+        if email:
+            yield (email, name or '', source, now, now)
+
+def add_many(conn, entries, source=''):
+    """Insert addresses (strings or {"email", "name"}); existing rows keep their status"""
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            "INSERT INTO subscribers (email, name, source, created, updated) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(email) DO NOTHING",
+            _rows(entries, source, time.time()))
+    return conn.total_changes - before
+
+def add(conn, email, name='', source=''):
+    return add_many(conn, [{'email': email, 'name': name}], source) == 1
+
+def set_status(conn, email, status):
+    if status not in STATUSES:
+        raise ValueError(f"Unknown status: {status}")
+    with conn:
+        cur = conn.execute("UPDATE subscribers SET status = ?, updated = ? WHERE email = ?",
+                           (status, time.time(), normalize_email(email)))
+    return cur.rowcount == 1
+
+def _read_json(path):
+    """(raw bytes, subscriber entries) of a {"subscribers": [...]} file; (None, None) if unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return raw, json.loads(raw).get('subscribers', [])
+    except Exception as e:
+        print(f"⚠️ Could not read {path}: {e}")
+        return None, None
+
+def _merge(conn, path, entries):
+    added = add_many(conn, entries, source=os.path.basename(path))
+    print(f"📥 Imported {added} new subscriber(s) from {path} ({len(entries)} in file)")
+    return added
+
+def import_json(conn, path=LEGACY_FILE):
+    """Merge a {"subscribers": [...]} file into the store"""
+    _, entries = _read_json(path)
+    return 0 if entries is None else _merge(conn, path, entries)
+
+def sync_json(conn, path=LEGACY_FILE):
+    """import_json() only when the file's content differs from the last merge"""
+    raw, entries = _read_json(path)
+    if entries is None:
+        return 0
+    digest = hashlib.sha256(raw).hexdigest()
+    key = f"merged:{os.path.basename(path)}"
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    if row and row[0] == digest:
+        return 0
+    added = _merge(conn, path, entries)
+    with conn:
+        conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                     "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, digest))
+    return added
+
+# ===== READS =====
+def count(conn, status='active'):
+    return conn.execute("SELECT COUNT(*) FROM subscribers WHERE status = ?", (status,)).fetchone()[0]
+
+def iter_active(conn, page_size=PAGE_SIZE, with_names=False):
+    """Yield active emails (or (email, name)) in email order, one page in memory at a time"""
+    last = ''
+    while True:
+        rows = conn.execute(
+            "SELECT email, name FROM subscribers WHERE status = 'active' AND email > ? "
+            "ORDER BY email LIMIT ?", (last, page_size)).fetchall()
+        if not rows:
+            return
+        for email, name in rows:
+            yield (email, name) if with_names else email
+        last = rows[-1][0]
+
+# ===== BENCHMARK =====
+def benchmark(total=1000000, page_size=PAGE_SIZE):
+    """Import and stream `total` synthetic subscribers through a temporary store"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = connect(os.path.join(tmp, 'bench.db'))
+        entries = (f"User{i:07d}@Example.com" for i in range(total))
+        started = time.perf_counter()
+        add_many(conn, entries, source='bench')
+        import_seconds = time.perf_counter() - started
+        print(f"📥 Import: {total} subscribers in {import_seconds:.2f}s ({total / import_seconds:,.0f}/s)")
+
+        started = time.perf_counter()
+        first = None
+        seen = 0
+        for email in iter_active(conn, page_size):
+            if first is None:
+                first = time.perf_counter() - started
+            seen += 1
+        iterate_seconds = time.perf_counter() - started
+
+        # Second pass for memory only: tracemalloc slows iteration several-fold
+        tracemalloc.start()
+        for email in iter_active(conn, page_size):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"📤 Iterate: {seen} in {iterate_seconds:.2f}s ({seen / iterate_seconds:,.0f}/s), "
+              f"first row after {first * 1000:.1f} ms, peak {peak / 1024 / 1024:.1f} MB traced")
+        conn.close()
+    return {'subscribers': total, 'import_s': round(import_seconds, 2),
+            'iterate_s': round(iterate_seconds, 2), 'peak_mb': round(peak / 1024 / 1024, 1)}
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+    if command == 'import':
+        import_json(connect(), sys.argv[2] if len(sys.argv) > 2 else LEGACY_FILE)
+    elif command == 'count':
+        conn = connect()
+        print(', '.join(f"{status}: {count(conn, status)}" for status in STATUSES))
+    elif command in ('unsubscribe', 'bounce') and len(sys.argv) > 2:
+        status = 'unsubscribed' if command == 'unsubscribe' else 'bounced'
+        print('✅ Updated' if set_status(connect(), sys.argv[2], status) else '❌ Not found')
+    elif command == 'bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1000000)
+    else:
+        print(__doc__)
@@ -1,12 +1,16 @@
 // Service Worker for TurnitinPaperChecker PWA
-const CACHE_NAME = 'turnitin-checker-v1';
+// ===== PRECACHE (generated by asset_build.py) =====
+const CACHE_NAME = 'turnitin-checker-5b339ed1b0';
 const urlsToCache = [
     '/',
     '/index.html',
-    '/blogs-data.js',
-    '/country-codes.json',
+    '/assets/blogs-data.9a490e5075.js',
+    '/assets/country-codes.2a2c2a6398.json',
+    '/assets/index-1.ac552dafe2.js',
+    '/assets/index.b176ac2ade.css',
     'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css'
 ];
+// ===== END PRECACHE =====
 
 // Install event - cache resources
 self.addEventListener('install', event => {